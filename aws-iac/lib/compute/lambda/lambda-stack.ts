@@ -10,6 +10,9 @@ import { SqsEventSource } from "aws-cdk-lib/aws-lambda-event-sources";
 import { S2NLambda } from "./s2n-lambda";
 import { MRRUploadLambda } from "./mrr-upload-lambda";
 
+// records processed by an invocation of the s2n lambda, all at the same time
+const S2N_LAMBDA_BATCH_SIZE = 5;
+
 export interface LambdaStackProps extends AwsEnvStackProps {
   mainBucket: s3.Bucket;
   nutritionRequestQueue: sqs.Queue;
@@ -24,10 +27,15 @@ export class LambdaStack extends cdk.Stack {
 
     const { mainBucket, nutritionRequestQueue, nutritionResponseQueue } = props;
 
+    // the s2n lambda processes the records of a batch in parallel and reports the
+    // ones that failed, or whose response could not be sent, so only those are
+    // retried
     const nutritionRequestEventSource = new SqsEventSource(
       nutritionRequestQueue,
       {
-        batchSize: 1,
+        batchSize: S2N_LAMBDA_BATCH_SIZE,
+        maxBatchingWindow: cdk.Duration.seconds(1),
+        reportBatchItemFailures: true,
         enabled: true,
       }
     );
@@ -45,6 +53,7 @@ export class LambdaStack extends cdk.Stack {
       policyStatement: s2nLambdaServicePolicy,
       s3BucketName: mainBucket.bucketName,
       nutritionResponseQueueUrl: nutritionResponseQueue.queueUrl,
+      recordWorkers: S2N_LAMBDA_BATCH_SIZE,
       env: props.config.env,
       ecrRepository: props.s2nEcrRepository,
       getSecretParamName: (name: string) => {
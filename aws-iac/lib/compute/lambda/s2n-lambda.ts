@@ -13,6 +13,7 @@ type S2NServiceConfig = {
   SECRETS_FROM: string;
   AWS_S3_BUCKET: string;
   AWS_NUTRITION_RESPONSE_QUEUE_URL: string;
+  LAMBDA_RECORD_WORKERS: string;
 };
 
 export interface S2nLambdaProps {
@@ -20,6 +21,7 @@ export interface S2nLambdaProps {
   policyStatement: iam.PolicyStatement;
   s3BucketName: string;
   nutritionResponseQueueUrl: string;
+  recordWorkers: number;
   env: string;
   functionName: string;
   ecrRepository: ecr.Repository;
@@ -30,7 +32,9 @@ function getEnvironmentVariablesFromEnv(
   env: string
 ): Omit<
   S2NServiceConfig,
-  "AWS_S3_BUCKET" | "AWS_NUTRITION_RESPONSE_QUEUE_URL"
+  | "AWS_S3_BUCKET"
+  | "AWS_NUTRITION_RESPONSE_QUEUE_URL"
+  | "LAMBDA_RECORD_WORKERS"
 > {
   if (env === "test") {
     return {
@@ -72,6 +76,7 @@ export class S2NLambda extends Construct {
       policyStatement,
       s3BucketName,
       nutritionResponseQueueUrl,
+      recordWorkers,
       env,
       functionName,
       getSecretParamName,
@@ -99,6 +104,7 @@ export class S2NLambda extends Construct {
       environment: {
         AWS_S3_BUCKET: s3BucketName,
         AWS_NUTRITION_RESPONSE_QUEUE_URL: nutritionResponseQueueUrl,
+        LAMBDA_RECORD_WORKERS: recordWorkers.toString(),
         ...s2nServiceConfig,
       },
     });
@@ -129,6 +135,22 @@ export class S2NLambda extends Construct {
       );
       param.grantRead(s2nServiceLambda);
     });
+    // the secrets are loaded with one get_parameters_by_path request on the path
+    // of the service, grantRead only allows requesting them by name
+    const secretsPath = getSecretParamName("").replace(/\/$/, "");
+    s2nServiceLambda.addToRolePolicy(
+      new iam.PolicyStatement({
+        effect: iam.Effect.ALLOW,
+        actions: ["ssm:GetParametersByPath"],
+        resources: [
+          cdk.Stack.of(this).formatArn({
+            service: "ssm",
+            resource: "parameter",
+            resourceName: secretsPath.replace(/^\//, ""),
+          }),
+        ],
+      })
+    );
 
     this.lambdaFunc = s2nServiceLambda;
   }
@@ -0,0 +1,101 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Tuple
+
+from spacy.language import Language
+
+from core.lib.nlp.clean_keyword import clean_keyword
+
+CacheKey = Tuple[str, bool, str]
+
+
+@dataclass
+class KeywordCacheStats:
+    hits: int
+    """ Number of lookups answered from the cache """
+    misses: int
+    """ Number of lookups that required running the nlp pipeline """
+    evictions: int
+    """ Number of entries removed because the cache was full """
+    size: int
+    """ Current number of entries in the cache """
+    maxsize: int
+    """ Maximum number of entries in the cache """
+
+
+def get_model_name(nlp: Language) -> str:
+    """
+    Get the name of the spacy model, e.g. 'es_core_news_sm'
+    """
+    return f"{nlp.meta.get('lang', '')}_{nlp.meta.get('name', '')}"
+
+
+class KeywordCleaningEngine:
+    """
+    Memoize `clean_keyword` using a bounded LRU cache keyed by
+    (text, lemmatization flag, model name).
+
+    Foods share most of their descriptions ('crudo', 'cocido', 'sin sal'), so the
+    same keywords are cleaned thousands of times in a single pipeline run. Once
+    the cache is full the least recently used entry is evicted.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+
+        self.maxsize = maxsize
+        self._cache: OrderedDict[CacheKey, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def clean(
+        self, nlp: Language, text: str, disable_lemmatization: bool = True
+    ) -> str:
+        """
+        Clean the keyword, see `clean_keyword`
+        """
+        key = (text, disable_lemmatization, get_model_name(nlp))
+
+        with self._lock:
+            clean_text = self._cache.get(key)
+            if clean_text is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return clean_text
+            self._misses += 1
+
+        # the pipeline is executed outside the lock, in the worst case two threads
+        # clean the same text and the second one overrides the first result
+        clean_text = clean_keyword(
+            nlp, text, disable_lemmatization=disable_lemmatization
+        )
+
+        with self._lock:
+            self._cache[key] = clean_text
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+
+        return clean_text
+
+    def stats(self) -> KeywordCacheStats:
+        with self._lock:
+            return KeywordCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._cache),
+                maxsize=self.maxsize,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
@@ -53,8 +53,9 @@ def map_bedca_data_to_comon_food_task(
 def create_clean_food_task(common_foods: List[CommonFood]) -> List[CleanKeywordFood]:
     logger: logging.Logger = get_run_logger()
     env_name: str = variables.get("environment")
-    logger.info("building clean function")
-    clean_keyword_func = build_clean_function()
+    nlp_mode: str = variables.get("clean_keyword_nlp_mode", default="lexical")
+    logger.info(f"building clean function in {nlp_mode} mode")
+    clean_keyword_func = build_clean_function(nlp_mode=nlp_mode)
     logger.info("clean function built")
     core_task = CreateCleanFoodTask(
         logger=logger, env_name=env_name, clean_keyword_func=clean_keyword_func
@@ -1,14 +1,14 @@
 from typing import Callable
 
-import spacy
+from core.lib.nlp.clean_keyword import load_keyword_nlp
+from core.lib.nlp.keyword_cleaning_engine import KeywordCleaningEngine
 
-from core.lib.nlp.clean_keyword import clean_keyword
 
-
-def build_clean_function() -> Callable[[str], str]:
-    nlp = spacy.load("es_core_news_sm")
+def build_clean_function(nlp_mode: str = "lexical") -> Callable[[str], str]:
+    nlp = load_keyword_nlp("es_core_news_sm", mode=nlp_mode)
+    cleaning_engine = KeywordCleaningEngine()
 
     def clean_func(text: str) -> str:
-        return clean_keyword(nlp, text)
+        return cleaning_engine.clean(nlp, text)
 
     return clean_func
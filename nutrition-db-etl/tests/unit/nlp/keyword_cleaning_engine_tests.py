@@ -0,0 +1,87 @@
+import logging
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import spacy
+from spacy.language import Language
+
+from core.lib.nlp.clean_keyword import clean_keyword
+from core.lib.nlp.keyword_cleaning_engine import KeywordCleaningEngine
+
+logger = logging.getLogger(__name__)
+
+
+assertionLib = unittest.TestCase()
+
+
+@pytest.fixture(scope="module")
+def nlp():
+    logger.info("loading spacy model for spanish")
+    return spacy.load("es_core_news_sm")
+
+
+def test_keyword_cleaning_engine_same_output(nlp: Language):
+    engine = KeywordCleaningEngine(maxsize=10)
+    for text in ["Carne de res", "Arroz con leche, sin azúcar", ""]:
+        expected = clean_keyword(nlp, text)
+        assertionLib.assertEqual(engine.clean(nlp, text), expected)
+        assertionLib.assertEqual(engine.clean(nlp, text), expected)
+
+
+def test_keyword_cleaning_engine_hits_and_misses(nlp: Language):
+    engine = KeywordCleaningEngine(maxsize=10)
+    engine.clean(nlp, "arroz")
+    engine.clean(nlp, "arroz")
+    engine.clean(nlp, "arroz", disable_lemmatization=False)
+
+    stats = engine.stats()
+    assertionLib.assertEqual(stats.hits, 1)
+    assertionLib.assertEqual(stats.misses, 2)
+    assertionLib.assertEqual(stats.size, 2)
+
+
+def test_keyword_cleaning_engine_evicts_least_recently_used(nlp: Language):
+    engine = KeywordCleaningEngine(maxsize=2)
+    engine.clean(nlp, "arroz")
+    engine.clean(nlp, "carne")
+    # 'arroz' becomes the most recently used entry
+    engine.clean(nlp, "arroz")
+    engine.clean(nlp, "pollo")
+
+    stats = engine.stats()
+    assertionLib.assertEqual(stats.evictions, 1)
+    assertionLib.assertEqual(stats.size, 2)
+
+    engine.clean(nlp, "arroz")
+    assertionLib.assertEqual(engine.stats().hits, 2)
+    engine.clean(nlp, "carne")
+    assertionLib.assertEqual(engine.stats().misses, 4)
+
+
+def test_keyword_cleaning_engine_concurrent_clean(nlp: Language):
+    engine = KeywordCleaningEngine(maxsize=3)
+    texts = ["arroz", "carne", "pollo", "leche", "queso"] * 20
+    expected = {text: clean_keyword(nlp, text) for text in set(texts)}
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda text: engine.clean(nlp, text), texts))
+
+    assertionLib.assertEqual(results, [expected[text] for text in texts])
+    stats = engine.stats()
+    assertionLib.assertEqual(stats.hits + stats.misses, len(texts))
+    assertionLib.assertLessEqual(stats.size, 3)
+
+
+def test_keyword_cleaning_engine_clear(nlp: Language):
+    engine = KeywordCleaningEngine(maxsize=10)
+    engine.clean(nlp, "arroz")
+    engine.clear()
+
+    stats = engine.stats()
+    assertionLib.assertEqual((stats.hits, stats.misses, stats.size), (0, 0, 0))
+
+
+def test_keyword_cleaning_engine_invalid_maxsize():
+    with pytest.raises(ValueError):
+        KeywordCleaningEngine(maxsize=0)
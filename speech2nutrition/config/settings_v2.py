@@ -1,9 +1,25 @@
+import logging
 import os
+import time
+from typing import Dict
 
 from decouple import config
 
+from config.ssm_secrets import load_ssm_parameters
 from config.utils import Singleton
 
+logger = logging.getLogger(__name__)
+
+SSM_PARAMETER_NAMES = [
+    "nutrition_mongo_url",
+    "nutrition_db_name",
+    "nutrition_system_db_collection_name",
+    "nutrition_system_db_collection_index",
+    "open_ai_key",
+    "open_ai_engine",
+    "deepgram_key",
+]
+
 
 def config_as_str(key: str, **kwargs) -> str:
     return config(key, **kwargs)  # pyright: ignore [reportReturnType]
@@ -39,18 +55,92 @@ class APPConfig(metaclass=Singleton):
             "MOCK_AUDIO_STORAGE_FOLDER", default="tests/data/audio"
         )
         self.message_queue_service = config_as_str("MESSAGE_QUEUE_SERVICE", default="")
+        self.async_max_in_flight_requests = config_as_int(
+            "ASYNC_MAX_IN_FLIGHT_REQUESTS", default=16
+        )
 
         self.aws_region = config_as_str("AWS_REGION", default="us-east-1")
         self.aws_nutrition_response_queue = config_as_str(
             "AWS_NUTRITION_RESPONSE_QUEUE_URL", default=""
         )
         self.aws_s3_bucket = config_as_str("AWS_S3_BUCKET", default="")
+        self.audio_cache_folder = config_as_str("AUDIO_CACHE_FOLDER", default="")
+        self.audio_cache_max_size = config_as_int("AUDIO_CACHE_MAX_SIZE", default=512)
+        self.transcription_cache = config_as_str("TRANSCRIPTION_CACHE", default="")
+        self.transcription_cache_file = config_as_str(
+            "TRANSCRIPTION_CACHE_FILE", default="transcription-cache.sqlite3"
+        )
+        self.transcription_cache_size = config_as_int(
+            "TRANSCRIPTION_CACHE_SIZE", default=10000
+        )
+        self.transcription_cache_ttl = config_as_int(
+            "TRANSCRIPTION_CACHE_TTL", default=7 * 24 * 3600
+        )
 
         self.aws_nutrition_request_queue = config_as_str(
             "AWS_NUTRITION_REQUEST_QUEUE_URL", default=""
         )
         self.aws_nutrition_request_queue_polling_time = config_as_int(
-            "NUTRITION_REQUEST_QUEUE_POLLING_TIME", default=60000
+            "NUTRITION_REQUEST_QUEUE_POLLING_TIME", default=20000
+        )
+        self.sqs_consumer_wait_time_seconds = config_as_int(
+            "SQS_CONSUMER_WAIT_TIME_SECONDS", default=20
+        )
+        self.lazy_components_warm_up = config_as_bool(
+            "LAZY_COMPONENTS_WARM_UP", default=True
+        )
+        self.lambda_record_workers = config_as_int("LAMBDA_RECORD_WORKERS", default=1)
+        self.response_publisher_max_linger_time = config_as_int(
+            "RESPONSE_PUBLISHER_MAX_LINGER_TIME", default=200
+        )
+        self.sqs_consumer_workers = config_as_int("SQS_CONSUMER_WORKERS", default=1)
+        self.sqs_consumer_visibility_timeout = config_as_int(
+            "SQS_CONSUMER_VISIBILITY_TIMEOUT", default=60
+        )
+
+        self.nutrition_system_db_search_limit = config_as_int(
+            "NUTRITION_SYSTEM_DB_SEARCH_LIMIT", default=100
+        )
+        self.nutrition_system_db_source = config_as_str(
+            "NUTRITION_SYSTEM_DB_SOURCE", default="atlas-search"
+        )
+        self.nutrition_system_db_snapshot_file = config_as_str(
+            "NUTRITION_SYSTEM_DB_SNAPSHOT_FILE", default=""
+        )
+        self.nutrition_system_db_snapshot_refresh_time = config_as_int(
+            "NUTRITION_SYSTEM_DB_SNAPSHOT_REFRESH_TIME", default=3600
+        )
+
+        self.food_mapping_strategy = config_as_str(
+            "FOOD_MAPPING_STRATEGY", default="batch"
+        )
+        self.food_mapping_max_workers = config_as_int(
+            "FOOD_MAPPING_MAX_WORKERS", default=8
+        )
+
+        self.food_extraction_streaming = config_as_bool(
+            "FOOD_EXTRACTION_STREAMING", default=False
+        )
+        self.food_extraction_batch_size = config_as_int(
+            "FOOD_EXTRACTION_BATCH_SIZE", default=10
+        )
+
+        self.extraction_cache = config_as_str("EXTRACTION_CACHE", default="")
+        self.extraction_cache_file = config_as_str(
+            "EXTRACTION_CACHE_FILE", default="extraction-cache.sqlite3"
+        )
+        self.extraction_cache_size = config_as_int(
+            "EXTRACTION_CACHE_SIZE", default=10000
+        )
+        self.extraction_cache_ttl = config_as_int(
+            "EXTRACTION_CACHE_TTL", default=7 * 24 * 3600
+        )
+
+        self.keyword_cleaning_cache_size = config_as_int(
+            "KEYWORD_CLEANING_CACHE_SIZE", default=4096
+        )
+        self.keyword_cleaning_nlp_mode = config_as_str(
+            "KEYWORD_CLEANING_NLP_MODE", default="lexical"
         )
 
         self._load_secrets()
@@ -70,36 +160,38 @@ class APPConfig(metaclass=Singleton):
         return f"/fitvoice-app/{self.env}/s2n/{name}"
 
     def _load_secrets_from_ssm(self):
-        import boto3
+        values = self._load_ssm_parameters()
 
-        ssm = boto3.client("ssm", region_name=self.aws_region)
-
-        self.nutrition_mongo_url = ssm.get_parameter(
-            Name=self.get_key_for_ssm("nutrition_mongo_url"), WithDecryption=True
-        )["Parameter"]["Value"]
-        self.nutrition_db_name = ssm.get_parameter(
-            Name=self.get_key_for_ssm("nutrition_db_name")
-        )["Parameter"]["Value"]
-        self.nutrition_system_db_collection_name = ssm.get_parameter(
-            Name=self.get_key_for_ssm("nutrition_system_db_collection_name")
-        )["Parameter"]["Value"]
-        self.nutrition_system_db_collection_index = ssm.get_parameter(
-            Name=self.get_key_for_ssm("nutrition_system_db_collection_index")
-        )["Parameter"]["Value"]
+        self.nutrition_mongo_url = values["nutrition_mongo_url"]
+        self.nutrition_db_name = values["nutrition_db_name"]
+        self.nutrition_system_db_collection_name = values[
+            "nutrition_system_db_collection_name"
+        ]
+        self.nutrition_system_db_collection_index = values[
+            "nutrition_system_db_collection_index"
+        ]
 
         # Assumption: If we aren't using aws ssm, that means that we will not be using rabbitmq
         self.rabbitmq_url = ""
 
-        self.open_ai_key = ssm.get_parameter(
-            Name=self.get_key_for_ssm("open_ai_key"), WithDecryption=True
-        )["Parameter"]["Value"]
-        self.open_ai_engine = ssm.get_parameter(
-            Name=self.get_key_for_ssm("open_ai_engine")
-        )["Parameter"]["Value"]
+        self.open_ai_key = values["open_ai_key"]
+        self.open_ai_engine = values["open_ai_engine"]
+
+        self.deepgram_key = values["deepgram_key"]
+
+    def _load_ssm_parameters(self) -> Dict[str, str]:
+        import boto3
+
+        start = time.perf_counter()
+        ssm_client = boto3.client("ssm", region_name=self.aws_region)
+        values = load_ssm_parameters(
+            ssm_client, self.get_key_for_ssm(""), SSM_PARAMETER_NAMES
+        )
+        logger.info(
+            f"secrets loaded from ssm in {time.perf_counter() - start:.3f} seconds"
+        )
 
-        self.deepgram_key = ssm.get_parameter(
-            Name=self.get_key_for_ssm("deepgram_key"), WithDecryption=True
-        )["Parameter"]["Value"]
+        return values
 
     def _load_secrets_from_env(self):
         self.nutrition_mongo_url = config_as_str("NUTRITION_MONGO_URL", default="")
@@ -124,8 +216,47 @@ class APPConfig(metaclass=Singleton):
         self._set_aws_credentials()
 
     def _validate_settings(self):
+        cache_settings = {
+            "EXTRACTION_CACHE": self.extraction_cache,
+            "TRANSCRIPTION_CACHE": self.transcription_cache,
+        }
+        for name, value in cache_settings.items():
+            if value not in ["", "memory", "sqlite"]:
+                raise ValueError(
+                    f"Invalid {name}: {value}, valid values: memory, sqlite or empty"
+                )
+
+        if self.food_mapping_strategy not in ["batch", "concurrent", "sequential"]:
+            raise ValueError(
+                f"Invalid FOOD_MAPPING_STRATEGY: {self.food_mapping_strategy}, valid values: batch, concurrent and sequential"
+            )
+
+        if self.food_extraction_streaming and self.food_mapping_strategy == "batch":
+            raise ValueError(
+                "FOOD_EXTRACTION_STREAMING requires the concurrent or sequential FOOD_MAPPING_STRATEGY"
+            )
+
+        positive_settings = {
+            "AUDIO_CACHE_MAX_SIZE": self.audio_cache_max_size,
+            "EXTRACTION_CACHE_SIZE": self.extraction_cache_size,
+            "TRANSCRIPTION_CACHE_SIZE": self.transcription_cache_size,
+            "FOOD_EXTRACTION_BATCH_SIZE": self.food_extraction_batch_size,
+            "FOOD_MAPPING_MAX_WORKERS": self.food_mapping_max_workers,
+            "LAMBDA_RECORD_WORKERS": self.lambda_record_workers,
+            "SQS_CONSUMER_WORKERS": self.sqs_consumer_workers,
+            "ASYNC_MAX_IN_FLIGHT_REQUESTS": self.async_max_in_flight_requests,
+        }
+        for name, value in positive_settings.items():
+            if value < 1:
+                raise ValueError(f"{name} must be greater than 0")
+
+        if self.nutrition_system_db_source not in ["atlas-search", "snapshot"]:
+            raise ValueError(
+                f"Invalid NUTRITION_SYSTEM_DB_SOURCE: {self.nutrition_system_db_source}, valid values: atlas-search and snapshot"
+            )
+
         if (
-            self.message_queue_service == "sqs"
+            self.message_queue_service in ["sqs", "sqs-async"]
             and self.aws_nutrition_request_queue == ""
         ):
             raise ValueError(
@@ -0,0 +1,99 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# max number of names accepted by get_parameters
+GET_PARAMETERS_BATCH_SIZE = 10
+
+
+def _get_parameters_by_path(ssm_client: Any, prefix: str) -> Dict[str, str]:
+    values: Dict[str, str] = {}
+    # the path of the parameters is the prefix without the trailing slash
+    path = prefix.rstrip("/") or "/"
+    params: Dict[str, Any] = {"Path": path, "WithDecryption": True}
+    while True:
+        response = ssm_client.get_parameters_by_path(**params)
+        for parameter in response.get("Parameters", []):
+            values[parameter["Name"]] = parameter["Value"]
+
+        next_token = response.get("NextToken")
+        if not next_token:
+            return values
+        params["NextToken"] = next_token
+
+
+def _get_parameters(ssm_client: Any, names: List[str]) -> Dict[str, str]:
+    values: Dict[str, str] = {}
+    for start in range(0, len(names), GET_PARAMETERS_BATCH_SIZE):
+        response = ssm_client.get_parameters(
+            Names=names[start : start + GET_PARAMETERS_BATCH_SIZE],
+            WithDecryption=True,
+        )
+        for parameter in response.get("Parameters", []):
+            values[parameter["Name"]] = parameter["Value"]
+    return values
+
+
+def _get_parameters_in_parallel(ssm_client: Any, names: List[str]) -> Dict[str, str]:
+    def get_parameter(name: str) -> str:
+        response = ssm_client.get_parameter(Name=name, WithDecryption=True)
+        return response["Parameter"]["Value"]
+
+    with ThreadPoolExecutor(max_workers=len(names)) as executor:
+        return dict(zip(names, executor.map(get_parameter, names), strict=True))
+
+
+def load_ssm_parameters(
+    ssm_client: Any, prefix: str, names: List[str]
+) -> Dict[str, str]:
+    """
+    Load the parameters `names` that are under `prefix` in as few requests as
+    possible.
+
+    All the parameters under the prefix are loaded with get_parameters_by_path, and
+    the ones that are not found are requested with get_parameters. Each request
+    falls back to the next one if it fails, e.g. the role can not use it, and
+    if get_parameters fails too each parameter is requested with get_parameter
+    at the same time.
+
+    Returns
+    -------
+    Dict[str, str]
+        The value of each name, without the prefix
+    """
+    if len(names) == 0:
+        return {}
+
+    full_names = [f"{prefix}{name}" for name in names]
+    values: Dict[str, str] = {}
+    try:
+        values = _get_parameters_by_path(ssm_client, prefix)
+    except Exception:
+        logger.warning(
+            "failed to load parameters by path, loading them in batches",
+            exc_info=True,
+        )
+
+    missing_names = [name for name in full_names if name not in values]
+    if len(missing_names) > 0:
+        logger.info(f"{len(missing_names)} parameters not found by path")
+        try:
+            values.update(_get_parameters(ssm_client, missing_names))
+        except Exception:
+            logger.warning(
+                "failed to load parameters in batches, loading them one by one",
+                exc_info=True,
+            )
+            missing_names = [name for name in full_names if name not in values]
+            values.update(_get_parameters_in_parallel(ssm_client, missing_names))
+
+    missing_names = [name for name in full_names if name not in values]
+    if len(missing_names) > 0:
+        raise ValueError(f"ssm parameters not found: {', '.join(missing_names)}")
+
+    return {
+        name: values[full_name]
+        for name, full_name in zip(names, full_names, strict=True)
+    }
@@ -0,0 +1,49 @@
+from core.components.food_extraction.definitions import AsyncExtractFoodComponent
+from core.components.food_mapping.definitions.food_map_v2 import (
+    AsyncMapManyFoodsToNutritionDBComponent,
+)
+from core.components.speech2text.definitions import AsyncSpeech2TextComponent
+from core.domain.entities.nutrition_information_request import (
+    NutritionInformationRequest,
+)
+from core.domain.entities.nutrition_information_response import (
+    NutritionInformationResponse,
+)
+
+
+class AsyncRequestHandler:
+    """
+    Async version of RequestHandler, while a request waits for the audio storage,
+    the speech2text model, the llm or the database, the event loop can work on
+    other requests
+    """
+
+    def __init__(
+        self,
+        s2t_component: AsyncSpeech2TextComponent,
+        food_extraction_component: AsyncExtractFoodComponent,
+        food_mapping_component: AsyncMapManyFoodsToNutritionDBComponent,
+    ) -> None:
+        self.s2t_component = s2t_component
+        self.food_extraction_component = food_extraction_component
+        self.food_mapping_component = food_mapping_component
+
+    async def __call__(
+        self, request: NutritionInformationRequest
+    ) -> NutritionInformationResponse:
+        audio_id = request.audio_id
+        transcription = await self.s2t_component(audio_id)
+        food_requests = await self.food_extraction_component(transcription)
+
+        food_responses = await self.food_mapping_component(
+            food_requests, request.db_lookup_preference, request.user_id
+        )
+
+        nutrition_information_response = NutritionInformationResponse(
+            raw_transcript=transcription,
+            food_responses=food_responses,
+            food_requests=food_requests,
+            ni_request=request,
+        )
+
+        return nutrition_information_response
@@ -0,0 +1,143 @@
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Protocol, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class Cache(Protocol):
+    def get(self, key: str) -> str | None:
+        """
+        Get the cached value of the key, None if it is missing or expired
+        """
+        ...
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Save the value of the key, the least recently used values are evicted if
+        the cache is full
+        """
+        ...
+
+
+class MemoryCache:
+    """
+    In memory LRU cache, the values expire `ttl_seconds` after they are saved
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl_seconds: float = 7 * 24 * 3600):
+        if maxsize < 1:
+            raise ValueError("maxsize must be greater than 0")
+
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        # key -> (value, created at)
+        self._entries: OrderedDict[str, Tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, created_at = entry
+            if time.time() - created_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+class SQLiteCache:
+    """
+    Cache stored in a local SQLite database, so it survives restarts. The values
+    expire `ttl_seconds` after they are saved and the least recently used values
+    are evicted when there are more than `maxsize`
+    """
+
+    def __init__(
+        self, file_path: str, maxsize: int = 10000, ttl_seconds: float = 7 * 24 * 3600
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be greater than 0")
+
+        self.file_path = file_path
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(file_path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created_at REAL NOT NULL, used_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS cache_used_at ON cache (used_at)"
+            )
+
+    def get(self, key: str) -> str | None:
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT value, created_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, created_at = row
+            if now - created_at > self.ttl_seconds:
+                self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return None
+
+            self._connection.execute(
+                "UPDATE cache SET used_at = ? WHERE key = ?", (now, key)
+            )
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache "
+                "(key, value, created_at, used_at) VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            self._connection.execute(
+                "DELETE FROM cache WHERE key IN ("
+                "SELECT key FROM cache ORDER BY used_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+def cache_factory(
+    backend: str, file_path: str, maxsize: int, ttl_seconds: float
+) -> Cache | None:
+    """
+    Create the cache of a backend: "memory", "sqlite", or "" for no cache
+    """
+    if backend == "memory":
+        logger.info("creating in memory cache")
+        return MemoryCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+    if backend == "sqlite":
+        logger.info(f"creating sqlite cache in {file_path}")
+        return SQLiteCache(
+            file_path=file_path, maxsize=maxsize, ttl_seconds=ttl_seconds
+        )
+    return None
@@ -0,0 +1,97 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Generic, List, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LazyComponent(Generic[T]):
+    """
+    Component created with its factory the first time it is used. It can also be
+    created in a background thread with `warm_up`, e.g. during the init phase of a
+    lambda, and the first use waits for it
+    """
+
+    def __init__(self, name: str, factory: Callable[[], T]):
+        self.name = name
+        self.factory = factory
+        self.init_seconds: float | None = None
+        """ Time spent creating the component, None if it is not created yet """
+        self._value: T | None = None
+        self._initialized = False
+        self._lock = threading.Lock()
+
+    @property
+    def initialized(self) -> bool:
+        return self._initialized
+
+    def get(self) -> T:
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    logger.info(f"initializing component {self.name}")
+                    start = time.perf_counter()
+                    self._value = self.factory()
+                    self.init_seconds = time.perf_counter() - start
+                    self._initialized = True
+                    logger.info(
+                        f"component {self.name} initialized in {self.init_seconds:.3f} seconds"
+                    )
+
+        return self._value  # pyright: ignore [reportReturnType]
+
+    def warm_up(self) -> threading.Thread:
+        """
+        Create the component in a background thread. If it fails, the error is
+        logged and the creation is tried again on the first use
+        """
+
+        def initialize():
+            try:
+                self.get()
+            except Exception:
+                logger.exception(f"failed to initialize component {self.name}")
+
+        thread = threading.Thread(
+            target=initialize, name=f"warm-up-{self.name}", daemon=True
+        )
+        thread.start()
+        return thread
+
+
+class ComponentContainer:
+    """
+    Group of lazy components identified by name
+    """
+
+    def __init__(self) -> None:
+        self._components: Dict[str, LazyComponent[Any]] = {}
+
+    def register(self, name: str, factory: Callable[[], T]) -> LazyComponent[T]:
+        if name in self._components:
+            raise ValueError(f"component {name} is already registered")
+
+        component = LazyComponent(name, factory)
+        self._components[name] = component
+        return component
+
+    def get(self, name: str) -> Any:
+        return self._components[name].get()
+
+    def warm_up(self) -> List[threading.Thread]:
+        """
+        Create all the components at the same time in background threads
+        """
+        return [component.warm_up() for component in self._components.values()]
+
+    def timings(self) -> Dict[str, float | None]:
+        """
+        Initialization time of each component in seconds, None if the component is
+        not created yet
+        """
+        return {
+            name: component.init_seconds for name, component in self._components.items()
+        }
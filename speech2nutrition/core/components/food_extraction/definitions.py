@@ -1,4 +1,4 @@
-from typing import Callable, List
+from typing import Awaitable, Callable, Iterator, List
 
 from core.domain.entities.food_nutrition_request import FoodNutritionRequest
 
@@ -16,3 +16,20 @@ Returns
 List[FoodNutritionRequest]
     A list of FoodNutritionRequest objects
 """
+
+AsyncExtractFoodComponent = Callable[[str], Awaitable[List[FoodNutritionRequest]]]
+"""
+Async version of ExtractFoodComponent
+"""
+
+StreamExtractFoodComponent = Callable[[str], Iterator[FoodNutritionRequest]]
+"""
+Same as ExtractFoodComponent, but the foods are returned as soon as they are
+extracted, so they can be processed while the rest of the text is extracted
+"""
+
+BatchExtractFoodComponent = Callable[[List[str]], List[List[FoodNutritionRequest]]]
+"""
+Same as ExtractFoodComponent, but the foods of several texts are extracted at once.
+The foods of each text are returned in the same order as the texts
+"""
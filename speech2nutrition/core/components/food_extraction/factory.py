@@ -1,25 +1,120 @@
 import logging
 
 from config.settings_v2 import APP_CONFIG
-from core.components.food_extraction.definitions import ExtractFoodComponent
+from core.cache import Cache, cache_factory
+from core.components.food_extraction.definitions import (
+    AsyncExtractFoodComponent,
+    BatchExtractFoodComponent,
+    ExtractFoodComponent,
+    StreamExtractFoodComponent,
+)
+from core.components.food_extraction.infrastructure.build_prompt import (
+    get_prompt_version,
+)
+from core.components.food_extraction.infrastructure.extraction_cache import (
+    AsyncCachedFoodExtractionService,
+    CachedFoodExtractionService,
+    CachedStreamFoodExtractionService,
+)
 from core.components.food_extraction.infrastructure.gpt import (
+    AsyncChatGPTFoodExtractionService,
     ChatGPTFoodExtractionService,
 )
 from core.components.food_extraction.infrastructure.mocks.mock_food_extraction import (
+    AsyncMockFoodExtractionService,
     MockFoodExtractionService,
 )
 
 logger = logging.getLogger(__name__)
 
 
+def extraction_cache_factory() -> Cache | None:
+    return cache_factory(
+        APP_CONFIG.extraction_cache,
+        file_path=APP_CONFIG.extraction_cache_file,
+        maxsize=APP_CONFIG.extraction_cache_size,
+        ttl_seconds=APP_CONFIG.extraction_cache_ttl,
+    )
+
+
 def food_extraction_component_factory() -> ExtractFoodComponent:
     if APP_CONFIG.mock_services:
         logger.info("creating mock food extraction service")
-        extraction_service = MockFoodExtractionService()
-    else:
-        logger.info("creating chatgpt food extraction service")
-        extraction_service = ChatGPTFoodExtractionService(
-            openai_key=APP_CONFIG.open_ai_key,
-            engine=APP_CONFIG.open_ai_engine,
-        )
-    return extraction_service
+        return MockFoodExtractionService()
+
+    logger.info("creating chatgpt food extraction service")
+    extraction_service = ChatGPTFoodExtractionService(
+        openai_key=APP_CONFIG.open_ai_key,
+        engine=APP_CONFIG.open_ai_engine,
+    )
+
+    cache = extraction_cache_factory()
+    if cache is None:
+        return extraction_service
+
+    return CachedFoodExtractionService(
+        extraction_service,
+        cache,
+        engine=APP_CONFIG.open_ai_engine,
+        prompt_version=get_prompt_version(),
+    )
+
+
+def food_extraction_batch_component_factory() -> BatchExtractFoodComponent:
+    if APP_CONFIG.mock_services:
+        logger.info("creating mock food extraction batch service")
+        return MockFoodExtractionService().extract_many
+
+    logger.info("creating chatgpt food extraction batch service")
+    extraction_service = ChatGPTFoodExtractionService(
+        openai_key=APP_CONFIG.open_ai_key,
+        engine=APP_CONFIG.open_ai_engine,
+        max_batch_size=APP_CONFIG.food_extraction_batch_size,
+    )
+    return extraction_service.extract_many
+
+
+def food_extraction_stream_component_factory() -> StreamExtractFoodComponent:
+    if APP_CONFIG.mock_services:
+        logger.info("creating mock food extraction stream service")
+        return MockFoodExtractionService().stream
+
+    logger.info("creating chatgpt food extraction stream service")
+    extraction_service = ChatGPTFoodExtractionService(
+        openai_key=APP_CONFIG.open_ai_key,
+        engine=APP_CONFIG.open_ai_engine,
+    )
+
+    cache = extraction_cache_factory()
+    if cache is None:
+        return extraction_service.stream
+
+    return CachedStreamFoodExtractionService(
+        extraction_service.stream,
+        cache,
+        engine=APP_CONFIG.open_ai_engine,
+        prompt_version=get_prompt_version(),
+    )
+
+
+def async_food_extraction_component_factory() -> AsyncExtractFoodComponent:
+    if APP_CONFIG.mock_services:
+        logger.info("creating async mock food extraction service")
+        return AsyncMockFoodExtractionService()
+
+    logger.info("creating async chatgpt food extraction service")
+    extraction_service = AsyncChatGPTFoodExtractionService(
+        openai_key=APP_CONFIG.open_ai_key,
+        engine=APP_CONFIG.open_ai_engine,
+    )
+
+    cache = extraction_cache_factory()
+    if cache is None:
+        return extraction_service
+
+    return AsyncCachedFoodExtractionService(
+        extraction_service,
+        cache,
+        engine=APP_CONFIG.open_ai_engine,
+        prompt_version=get_prompt_version(),
+    )
@@ -1,9 +1,15 @@
+import hashlib
 import json
+from typing import Any, Dict, List
 
 from core.components.food_extraction.infrastructure.prompts import (
+    BATCH_EXTRACTION_BASE_PROMPT,
     EXTRACTION_BASE_PROMPT,
 )
 
+# marks where the text is inserted in the rendered template
+TEXT_FRAGMENT_PLACEHOLDER = "{TEXT_FRAGMENT}"
+
 examples = [
     {
         "text": "Estoy comiendo 100 gramos de arroz blanco cocido y una pera",
@@ -87,15 +93,54 @@ examples = [
 ]
 
 
-def get_extraction_prompt(text_fragment: str):
-    example_list = []
-    for e in examples:
-        s = f"{e['text']}\n{json.dumps(e['result'], ensure_ascii=False)}"
-        example_list.append(s)
+class ExtractionPrompt:
+    """
+    Extraction prompt with the examples already rendered, so building the prompt of
+    a text only needs to insert it in the template
+    """
+
+    def __init__(self, base_prompt: str, examples: List[Dict[str, Any]]):
+        self.examples_block = render_examples(examples)
+        rendered = base_prompt.format(
+            EXAMPLES=self.examples_block, TEXT_FRAGMENT=TEXT_FRAGMENT_PLACEHOLDER
+        )
+        self.prefix, _, self.suffix = rendered.partition(TEXT_FRAGMENT_PLACEHOLDER)
+        # hash of the rendered template, used in the keys of the extraction cache
+        self.version = hashlib.sha256(rendered.encode("utf-8")).hexdigest()[:16]
+
+    def render(self, text_fragment: str) -> str:
+        return f"{self.prefix}{text_fragment}{self.suffix}"
+
+
+def render_examples(examples: List[Dict[str, Any]]) -> str:
+    return "\n".join(
+        f"{e['text']}\n{json.dumps(e['result'], ensure_ascii=False)}" for e in examples
+    )
+
+
+EXTRACTION_PROMPT = ExtractionPrompt(EXTRACTION_BASE_PROMPT, examples)
+BATCH_EXTRACTION_PROMPT = ExtractionPrompt(BATCH_EXTRACTION_BASE_PROMPT, examples)
+
+
+def get_extraction_prompt(text_fragment: str) -> str:
+    return EXTRACTION_PROMPT.render(text_fragment)
+
+
+def get_prompt_version() -> str:
+    """
+    Hash of the extraction prompt, it changes whenever the template or the examples
+    change
+    """
+    return EXTRACTION_PROMPT.version
 
-    examples_as_str = "\n".join(example_list)
 
-    final_prompt = EXTRACTION_BASE_PROMPT.format(
-        EXAMPLES=examples_as_str, TEXT_FRAGMENT=text_fragment
+def get_batch_extraction_prompt(text_fragments: Dict[str, str]) -> str:
+    """
+    Build the prompt to extract the foods of several texts at once, the model
+    answers with a json object with the foods of each text by its id
+    """
+    fragments = "\n".join(
+        f"{text_id}: {json.dumps(text, ensure_ascii=False)}"
+        for text_id, text in text_fragments.items()
     )
-    return final_prompt
+    return BATCH_EXTRACTION_PROMPT.render(fragments)
@@ -0,0 +1,134 @@
+import hashlib
+import json
+import logging
+import re
+from typing import Iterator, List
+
+from core.cache import Cache
+from core.components.food_extraction.definitions import (
+    AsyncExtractFoodComponent,
+    ExtractFoodComponent,
+    StreamExtractFoodComponent,
+)
+from core.domain.entities.food_nutrition_request import FoodNutritionRequest
+
+logger = logging.getLogger(__name__)
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+# punctuation added by the speech2text models that does not change the meal
+SURROUNDING_PUNCTUATION = " .,;:!?¡¿"
+
+
+def normalize_transcript(text: str) -> str:
+    """
+    Lowercase the transcript, collapse the whitespace and remove the punctuation
+    around it, so the same meal said in a slightly different way has the same key
+    """
+    text = WHITESPACE_PATTERN.sub(" ", text.lower())
+    return text.strip(SURROUNDING_PUNCTUATION)
+
+
+def build_extraction_cache_key(text: str, engine: str, prompt_version: str) -> str:
+    content = f"{engine}\n{prompt_version}\n{normalize_transcript(text)}"
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def serialize_food_requests(food_requests: List[FoodNutritionRequest]) -> str:
+    return json.dumps([f.dict() for f in food_requests], ensure_ascii=False)
+
+
+def deserialize_food_requests(value: str) -> List[FoodNutritionRequest]:
+    return [FoodNutritionRequest(**food) for food in json.loads(value)]
+
+
+class CachedFoodExtractionService:
+    """
+    Return the cached foods of a transcript instead of calling the extraction
+    service again. The key includes the engine and the prompt version, so the
+    cached foods are not used after either of them changes
+    """
+
+    def __init__(
+        self,
+        extraction_service: ExtractFoodComponent,
+        cache: Cache,
+        engine: str,
+        prompt_version: str,
+    ) -> None:
+        self.extraction_service = extraction_service
+        self.cache = cache
+        self.engine = engine
+        self.prompt_version = prompt_version
+
+    def __call__(self, text: str) -> List[FoodNutritionRequest]:
+        key = build_extraction_cache_key(text, self.engine, self.prompt_version)
+        value = self.cache.get(key)
+        if value is not None:
+            logger.info("foods found in extraction cache")
+            return deserialize_food_requests(value)
+
+        food_requests = self.extraction_service(text)
+        self.cache.set(key, serialize_food_requests(food_requests))
+        return food_requests
+
+
+class AsyncCachedFoodExtractionService:
+    """
+    Async version of CachedFoodExtractionService
+    """
+
+    def __init__(
+        self,
+        extraction_service: AsyncExtractFoodComponent,
+        cache: Cache,
+        engine: str,
+        prompt_version: str,
+    ) -> None:
+        self.extraction_service = extraction_service
+        self.cache = cache
+        self.engine = engine
+        self.prompt_version = prompt_version
+
+    async def __call__(self, text: str) -> List[FoodNutritionRequest]:
+        key = build_extraction_cache_key(text, self.engine, self.prompt_version)
+        value = self.cache.get(key)
+        if value is not None:
+            logger.info("foods found in extraction cache")
+            return deserialize_food_requests(value)
+
+        food_requests = await self.extraction_service(text)
+        self.cache.set(key, serialize_food_requests(food_requests))
+        return food_requests
+
+
+class CachedStreamFoodExtractionService:
+    """
+    Streaming version of CachedFoodExtractionService, the foods are saved after
+    the stream is completely consumed
+    """
+
+    def __init__(
+        self,
+        extraction_service: StreamExtractFoodComponent,
+        cache: Cache,
+        engine: str,
+        prompt_version: str,
+    ) -> None:
+        self.extraction_service = extraction_service
+        self.cache = cache
+        self.engine = engine
+        self.prompt_version = prompt_version
+
+    def __call__(self, text: str) -> Iterator[FoodNutritionRequest]:
+        key = build_extraction_cache_key(text, self.engine, self.prompt_version)
+        value = self.cache.get(key)
+        if value is not None:
+            logger.info("foods found in extraction cache")
+            yield from deserialize_food_requests(value)
+            return
+
+        food_requests = []
+        for food_request in self.extraction_service(text):
+            food_requests.append(food_request)
+            yield food_request
+        self.cache.set(key, serialize_food_requests(food_requests))
@@ -1,22 +1,94 @@
 import json
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from core.components.food_extraction.infrastructure.build_prompt import (
+    get_batch_extraction_prompt,
     get_extraction_prompt,
 )
+from core.components.food_extraction.infrastructure.json_stream import (
+    JSONArrayStreamParser,
+)
 from core.domain.entities.food_nutrition_request import FoodNutritionRequest
 from core.domain.errors import ServiceException
 
 logger = logging.getLogger(__name__)
 
+# max number of tokens generated for the foods of a text
+MAX_TOKENS_PER_TEXT = 300
+# timeout of a completion for one text, it grows with the texts of a batch
+TIMEOUT_SECONDS_PER_TEXT = 10
+
+
+def parse_extraction_content(content: str | None) -> List[FoodNutritionRequest]:
+    """
+    Parse the json list of foods generated by the model, the foods that are not
+    valid are ignored
+    """
+    if content:
+        raw_foods: List[Dict[str, Any]] = json.loads(content)
+    else:
+        raise ServiceException(
+            "content attribute is empty from chat completion",
+            service_name="gpt-api",
+        )
+
+    food_nutrition_requests = []
+    for food in raw_foods:
+        food_nutrition_request = parse_food(food)
+        if food_nutrition_request is not None:
+            food_nutrition_requests.append(food_nutrition_request)
+
+    return food_nutrition_requests
+
+
+def parse_food(food: Dict[str, Any]) -> FoodNutritionRequest | None:
+    try:
+        return FoodNutritionRequest(**food)
+    except Exception as e:
+        logger.warning(f"Error parsing food: {food} with error: {e}", exc_info=True)
+        return None
+
+
+def parse_batch_extraction_content(
+    content: str | None, text_ids: List[str]
+) -> Dict[str, List[FoodNutritionRequest]]:
+    """
+    Parse the json object with the foods of each text generated by the model. The
+    texts whose foods are missing or are not a list are not included
+    """
+    content = content or ""
+    # ignore any text around the object, e.g. a markdown code fence
+    start, end = content.find("{"), content.rfind("}")
+    try:
+        raw_results = json.loads(content[start : end + 1])
+    except json.JSONDecodeError:
+        logger.warning("batch extraction content is not valid json", exc_info=True)
+        return {}
+
+    if not isinstance(raw_results, dict):
+        logger.warning("batch extraction content is not a json object")
+        return {}
+
+    results = {}
+    for text_id in text_ids:
+        raw_foods = raw_results.get(text_id)
+        if not isinstance(raw_foods, list):
+            continue
+        results[text_id] = [
+            food for food in (parse_food(f) for f in raw_foods) if food is not None
+        ]
+    return results
+
 
 class ChatGPTFoodExtractionService:
-    def __init__(self, openai_key: str, engine: str) -> None:
-        self.client = OpenAI(api_key=openai_key, timeout=10)
+    def __init__(self, openai_key: str, engine: str, max_batch_size: int = 10) -> None:
+        self.client = OpenAI(api_key=openai_key, timeout=TIMEOUT_SECONDS_PER_TEXT)
         self.engine = engine
+        # max number of texts sent in the same prompt by extract_many
+        self.max_batch_size = max_batch_size
 
     def __call__(self, text: str) -> List[FoodNutritionRequest]:
         """
@@ -32,24 +104,139 @@ class ChatGPTFoodExtractionService:
             ],
             model=self.engine,
             temperature=0,
-            max_tokens=300,
+            max_tokens=MAX_TOKENS_PER_TEXT,
         )
         content = chat_completion.choices[0].message.content
-        if content:
-            raw_foods: List[Dict[str, Any]] = json.loads(content)
-        else:
+        return parse_extraction_content(content)
+
+    def extract_many(self, texts: List[str]) -> List[List[FoodNutritionRequest]]:
+        """
+        Extract the foods of several texts with one chat completion per
+        `max_batch_size` texts. The texts whose foods can not be parsed from the
+        batch completion, e.g. because it failed or was truncated, are extracted
+        one by one
+        """
+        results = []
+        for start in range(0, len(texts), self.max_batch_size):
+            results.extend(
+                self._extract_batch(texts[start : start + self.max_batch_size])
+            )
+        return results
+
+    def _extract_batch(self, texts: List[str]) -> List[List[FoodNutritionRequest]]:
+        if len(texts) == 1:
+            return [self(texts[0])]
+
+        text_fragments = {str(i + 1): text for i, text in enumerate(texts)}
+        batch_results = self._complete_batch(text_fragments)
+
+        results = []
+        for text_id, text in text_fragments.items():
+            food_requests = batch_results.get(text_id)
+            if food_requests is None:
+                logger.info(f"foods of text {text_id} not in batch, extracting them")
+                food_requests = self(text)
+            results.append(food_requests)
+        return results
+
+    def _complete_batch(
+        self, text_fragments: Dict[str, str]
+    ) -> Dict[str, List[FoodNutritionRequest]]:
+        """
+        Extract the foods of the texts with one chat completion, the texts whose
+        foods are not found are not included, and none if the completion fails
+        """
+        try:
+            # the completion of a batch generates more tokens than the one of a
+            # single text, so it takes longer
+            chat_completion = self.client.with_options(
+                timeout=TIMEOUT_SECONDS_PER_TEXT * len(text_fragments)
+            ).chat.completions.create(
+                messages=[
+                    {
+                        "role": "user",
+                        "content": get_batch_extraction_prompt(text_fragments),
+                    }
+                ],
+                model=self.engine,
+                temperature=0,
+                max_tokens=MAX_TOKENS_PER_TEXT * len(text_fragments),
+            )
+        except Exception:
+            logger.warning("batch extraction failed", exc_info=True)
+            return {}
+
+        choice = chat_completion.choices[0]
+        if choice.finish_reason == "length":
+            # the content is usually not valid json, so the texts are extracted one
+            # by one
+            logger.warning("batch extraction content was truncated")
+        return parse_batch_extraction_content(
+            choice.message.content, list(text_fragments.keys())
+        )
+
+    def stream(self, text: str) -> Iterator[FoodNutritionRequest]:
+        """
+        Same as __call__, but the completion is streamed and each food is returned
+        as soon as the model finishes generating it
+        """
+        chunks = self.client.chat.completions.create(
+            messages=[
+                {
+                    "role": "user",
+                    "content": get_extraction_prompt(text),
+                }
+            ],
+            model=self.engine,
+            temperature=0,
+            max_tokens=MAX_TOKENS_PER_TEXT,
+            stream=True,
+        )
+
+        parser = JSONArrayStreamParser()
+        for chunk in chunks:
+            if len(chunk.choices) == 0 or not chunk.choices[0].delta.content:
+                continue
+
+            try:
+                foods = parser.feed(chunk.choices[0].delta.content)
+            except json.JSONDecodeError as e:
+                raise ServiceException(
+                    "chat completion stream does not contain valid json",
+                    service_name="gpt-api",
+                ) from e
+
+            for food in foods:
+                food_nutrition_request = parse_food(food)
+                if food_nutrition_request is not None:
+                    yield food_nutrition_request
+
+        if not parser.finished:
             raise ServiceException(
-                "content attribute is empty from chat completion",
+                "chat completion stream does not contain a complete json list",
                 service_name="gpt-api",
             )
 
-        food_nutrition_requests = []
-        for food in raw_foods:
-            try:
-                food_nutrition_requests.append(FoodNutritionRequest(**food))
-            except Exception as e:
-                logger.warning(
-                    f"Error parsing food: {food} with error: {e}", exc_info=True
-                )
 
-        return food_nutrition_requests
+class AsyncChatGPTFoodExtractionService:
+    def __init__(self, openai_key: str, engine: str) -> None:
+        self.client = AsyncOpenAI(api_key=openai_key, timeout=TIMEOUT_SECONDS_PER_TEXT)
+        self.engine = engine
+
+    async def __call__(self, text: str) -> List[FoodNutritionRequest]:
+        """
+        Async version of ChatGPTFoodExtractionService.__call__
+        """
+        chat_completion = await self.client.chat.completions.create(
+            messages=[
+                {
+                    "role": "user",
+                    "content": get_extraction_prompt(text),
+                }
+            ],
+            model=self.engine,
+            temperature=0,
+            max_tokens=MAX_TOKENS_PER_TEXT,
+        )
+        content = chat_completion.choices[0].message.content
+        return parse_extraction_content(content)
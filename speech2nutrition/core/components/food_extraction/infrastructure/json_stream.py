@@ -0,0 +1,85 @@
+import json
+from typing import Any, Dict, List
+
+
+class JSONArrayStreamParser:
+    """
+    Incremental parser of a JSON array of objects, e.g. the list of foods generated
+    by the model. The text is fed in chunks as it is received, and each object is
+    returned as soon as it is closed.
+
+    Any text before the array, e.g. a markdown code fence, and after it is ignored
+    """
+
+    def __init__(self) -> None:
+        # characters of the object that is being parsed
+        self._buffer: List[str] = []
+        # nesting level, 1 is inside the array and 2 inside one of its objects
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self.started = False
+        self.finished = False
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """
+        Parse the next chunk of text
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            The objects closed in this chunk
+
+        Raises
+        ------
+        json.JSONDecodeError
+            If an object of the array is not valid JSON
+        """
+        objects = []
+        for char in chunk:
+            if self.finished:
+                break
+
+            if not self.started:
+                if char == "[":
+                    self.started = True
+                    self._depth = 1
+                continue
+
+            obj = self._parse_char(char)
+            if obj is not None:
+                objects.append(obj)
+
+        return objects
+
+    def _parse_char(self, char: str) -> Dict[str, Any] | None:
+        """
+        Parse a character inside the array, returns the object that it closes
+        """
+        if self._depth > 1:
+            self._buffer.append(char)
+
+        if self._in_string:
+            self._parse_string_char(char)
+        elif char == '"':
+            self._in_string = True
+        elif char in "{[":
+            if self._depth == 1:
+                self._buffer = [char]
+            self._depth += 1
+        elif char in "}]":
+            self._depth -= 1
+            if self._depth == 1:
+                return json.loads("".join(self._buffer))
+            if self._depth == 0:
+                self.finished = True
+
+        return None
+
+    def _parse_string_char(self, char: str) -> None:
+        if self._escaped:
+            self._escaped = False
+        elif char == "\\":
+            self._escaped = True
+        elif char == '"':
+            self._in_string = False
@@ -1,5 +1,5 @@
 import json
-from typing import List
+from typing import Iterator, List
 
 from core.domain.entities.food_nutrition_request import FoodNutritionRequest
 
@@ -18,3 +18,26 @@ class MockFoodExtractionService:
             food_nutrition_requests.append(FoodNutritionRequest(**food))
 
         return food_nutrition_requests
+
+    def stream(self, text: str) -> Iterator[FoodNutritionRequest]:
+        """
+        Same as __call__, but the foods are returned one by one
+        """
+        yield from self(text)
+
+    def extract_many(self, texts: List[str]) -> List[List[FoodNutritionRequest]]:
+        """
+        Same as __call__, but for several texts
+        """
+        return [self(text) for text in texts]
+
+
+class AsyncMockFoodExtractionService:
+    def __init__(self) -> None:
+        self.extraction_service = MockFoodExtractionService()
+
+    async def __call__(self, text: str) -> List[FoodNutritionRequest]:
+        """
+        Async version of MockFoodExtractionService.__call__
+        """
+        return self.extraction_service(text)
@@ -6,3 +6,12 @@ Ejemplos:
 Fragmento de texto:
 {TEXT_FRAGMENT}
 """
+
+BATCH_EXTRACTION_BASE_PROMPT = """Se te proporcionarán varios fragmentos de texto que describen alimentos y sus atributos, cada uno con un identificador. Para cada fragmento, tu tarea consiste en extraer los nombres de los alimentos, junto con su descripción, porción y unidad de la porción, en formato de lista JSON, donde cada elemento es un objeto JSON con la siguiente estructura: {{"food_name":"string","description":"string","amount":"number","unit":"string"}}. Si algún atributo no está presente en el fragmento de texto, déjalo vacío ("" para atributos tipo string y 0 para atributos numéricos). Ten en cuenta que puede haber múltiples alimentos mencionados en un fragmento de texto, y debes tomar en cuenta la última mención de cada alimento. Cada fragmento es independiente de los demás. Debes generar el resultado como un objeto JSON cuyas claves son los identificadores de los fragmentos y cuyos valores son las listas JSON de cada fragmento. No expliques los resultados, solo responde con el objeto JSON
+
+Ejemplos de un fragmento de texto y su lista JSON:
+{EXAMPLES}
+
+Fragmentos de texto:
+{TEXT_FRAGMENT}
+"""
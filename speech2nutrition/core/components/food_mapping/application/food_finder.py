@@ -1,7 +1,11 @@
 import logging
+from typing import List
 
 from core.components.food_mapping.definitions.food_map_v2 import RepoFoodsResponse
-from core.components.food_mapping.definitions.repository import NutritionRepository
+from core.components.food_mapping.definitions.repository import (
+    AsyncNutritionRepository,
+    NutritionRepository,
+)
 from core.domain.entities.food_nutrition_request import FoodNutritionRequest
 from core.domain.entities.nutrition_information_request import DBLookupPreference
 
@@ -45,3 +49,99 @@ def find_foods_by_preference(
         return RepoFoodsResponse(foods=system_foods)
 
     raise ValueError(f"Invalid lookup preference: {lookup_preference}")
+
+
+def find_many_foods_by_preference(
+    food_requests: List[FoodNutritionRequest],
+    lookup_preference: DBLookupPreference,
+    system_repository: NutritionRepository,
+    user_repository: NutritionRepository,
+) -> List[RepoFoodsResponse]:
+    """
+    Same as `find_foods_by_preference` but for several food requests at once. Each
+    repository is queried with all the names that still need a lookup, so at most
+    two bulk queries are made
+    """
+    names = [food_request.food_name for food_request in food_requests]
+
+    if lookup_preference in (
+        DBLookupPreference.user_db_system_db,
+        DBLookupPreference.system_db_user_db,
+    ):
+        if lookup_preference == DBLookupPreference.user_db_system_db:
+            first_repository, second_repository = user_repository, system_repository
+        else:
+            first_repository, second_repository = system_repository, user_repository
+
+        logger.debug("looking up in first repository")
+        results = first_repository.get_foods_by_names(names)
+
+        missing_indexes = [i for i, foods in enumerate(results) if len(foods) == 0]
+        if len(missing_indexes) > 0:
+            logger.debug("looking up missing foods in second repository")
+            missing_results = second_repository.get_foods_by_names([
+                names[i] for i in missing_indexes
+            ])
+            for i, foods in zip(missing_indexes, missing_results, strict=True):
+                results[i] = foods
+
+        return [RepoFoodsResponse(foods=foods) for foods in results]
+
+    if lookup_preference == DBLookupPreference.user_db:
+        logger.debug("looking up in user repository")
+        results = user_repository.get_foods_by_names(names)
+        return [RepoFoodsResponse(foods=foods) for foods in results]
+
+    if lookup_preference == DBLookupPreference.system_db:
+        logger.debug("looking up in system repository")
+        results = system_repository.get_foods_by_names(names)
+        return [RepoFoodsResponse(foods=foods) for foods in results]
+
+    raise ValueError(f"Invalid lookup preference: {lookup_preference}")
+
+
+async def find_many_foods_by_preference_async(
+    food_requests: List[FoodNutritionRequest],
+    lookup_preference: DBLookupPreference,
+    system_repository: AsyncNutritionRepository,
+    user_repository: AsyncNutritionRepository,
+) -> List[RepoFoodsResponse]:
+    """
+    Async version of `find_many_foods_by_preference`
+    """
+    names = [food_request.food_name for food_request in food_requests]
+
+    if lookup_preference in (
+        DBLookupPreference.user_db_system_db,
+        DBLookupPreference.system_db_user_db,
+    ):
+        if lookup_preference == DBLookupPreference.user_db_system_db:
+            first_repository, second_repository = user_repository, system_repository
+        else:
+            first_repository, second_repository = system_repository, user_repository
+
+        logger.debug("looking up in first repository")
+        results = await first_repository.get_foods_by_names(names)
+
+        missing_indexes = [i for i, foods in enumerate(results) if len(foods) == 0]
+        if len(missing_indexes) > 0:
+            logger.debug("looking up missing foods in second repository")
+            missing_results = await second_repository.get_foods_by_names([
+                names[i] for i in missing_indexes
+            ])
+            for i, foods in zip(missing_indexes, missing_results, strict=True):
+                results[i] = foods
+
+        return [RepoFoodsResponse(foods=foods) for foods in results]
+
+    if lookup_preference == DBLookupPreference.user_db:
+        logger.debug("looking up in user repository")
+        results = await user_repository.get_foods_by_names(names)
+        return [RepoFoodsResponse(foods=foods) for foods in results]
+
+    if lookup_preference == DBLookupPreference.system_db:
+        logger.debug("looking up in system repository")
+        results = await system_repository.get_foods_by_names(names)
+        return [RepoFoodsResponse(foods=foods) for foods in results]
+
+    raise ValueError(f"Invalid lookup preference: {lookup_preference}")
@@ -1,5 +1,8 @@
 from dataclasses import dataclass
-from typing import Callable, List
+from typing import Awaitable, Callable, List
+
+import numpy as np
+import numpy.typing as npt
 
 from core.domain.entities.food import Food
 from core.domain.entities.food_nutrition_request import FoodNutritionRequest
@@ -25,6 +28,14 @@ class FoodScoreQuery:
 
 FoodScoreFunction = Callable[[FoodScoreQuery], float]
 
+FoodBatchScoreFunction = Callable[
+    [FoodNutritionRequest, List[Food]], npt.NDArray[np.float64]
+]
+"""
+Score all the candidate foods of a food request at once, the scores are returned in
+the same order as the foods
+"""
+
 
 @dataclass
 class FoodUnitQuery:
@@ -78,3 +89,19 @@ MapFoodToNutritionDBComponentV2 = Callable[
 """
 Given the food information reported by the user, the lookup preference and the app user id, map it to a food record in the nutrition database
 """
+
+MapManyFoodsToNutritionDBComponent = Callable[
+    [List[FoodNutritionRequest], DBLookupPreference, str], List[FoodNutritionResponse]
+]
+"""
+Same as MapFoodToNutritionDBComponentV2 but for all the foods reported by the user at
+once, the responses are returned in the same order as the requests
+"""
+
+AsyncMapManyFoodsToNutritionDBComponent = Callable[
+    [List[FoodNutritionRequest], DBLookupPreference, str],
+    Awaitable[List[FoodNutritionResponse]],
+]
+"""
+Async version of MapManyFoodsToNutritionDBComponent
+"""
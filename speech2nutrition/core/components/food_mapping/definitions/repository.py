@@ -12,6 +12,27 @@ class NutritionRepository(Protocol):
         """
         ...
 
+    def get_foods_by_names(self, names: List[str]) -> List[List[Food]]:
+        """
+        Get the foods of several names at once, ideally in a single round trip to
+        the database. The results are returned in the same order as the names
+        """
+        ...
+
+
+class AsyncNutritionRepository(Protocol):
+    async def get_foods_by_name(self, name: str) -> List[Food]:
+        """
+        Async version of NutritionRepository.get_foods_by_name
+        """
+        ...
+
+    async def get_foods_by_names(self, names: List[str]) -> List[List[Food]]:
+        """
+        Async version of NutritionRepository.get_foods_by_names
+        """
+        ...
+
 
 MapFoodToNutritionDBComponent = Callable[
     [FoodNutritionRequest, NutritionRepository],
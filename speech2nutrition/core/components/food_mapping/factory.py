@@ -1,13 +1,15 @@
 import logging
 
-import spacy
-
 from config.settings_v2 import APP_CONFIG
-from core.components.food_mapping.definitions.food_map_v2 import (
-    MapFoodToNutritionDBComponentV2,
+from core.components.food_mapping.infrastructure.nlp.clean_keyword import (
+    load_keyword_nlp,
+)
+from core.components.food_mapping.infrastructure.nlp.keyword_cleaning_engine import (
+    KeywordCleaningEngine,
 )
 from core.components.food_mapping.infrastructure.nlp.score_function import (
     score_food_by_exact_fuzzy_matches,
+    score_foods_by_exact_fuzzy_matches,
 )
 from core.components.food_mapping.infrastructure.repositories.mock_repository import (
     MockNutritionRepository,
@@ -15,21 +17,55 @@ from core.components.food_mapping.infrastructure.repositories.mock_repository im
 from core.components.food_mapping.infrastructure.repositories.mongo_repository import (
     SystemNutritionRepository,
 )
+from core.components.food_mapping.infrastructure.repositories.snapshot_repository import (
+    SnapshotNutritionRepository,
+    build_json_file_documents_loader,
+    build_mongo_documents_loader,
+)
+from core.components.food_mapping.infrastructure.repositories.threaded_repository import (
+    ThreadedNutritionRepository,
+)
 from core.components.food_mapping.infrastructure.unit_module.simple_unit import (
     compute_new_amount_to_grams,
 )
-from core.components.food_mapping.map_algorithm import FoodMapper
+from core.components.food_mapping.map_algorithm import AsyncFoodMapper, FoodMapper
 
 logger = logging.getLogger(__name__)
 
 
-def food_mapping_component_factory() -> MapFoodToNutritionDBComponentV2:
-    logger.info("loading spanish model for spacy")
-    spacy_language = spacy.load("es_core_news_sm")
+def food_mapping_component_factory() -> FoodMapper:
+    logger.info(
+        f"loading spanish model for spacy in {APP_CONFIG.keyword_cleaning_nlp_mode} mode"
+    )
+    spacy_language = load_keyword_nlp(
+        "es_core_news_sm", mode=APP_CONFIG.keyword_cleaning_nlp_mode
+    )
+    logger.info("creating keyword cleaning engine")
+    cleaning_engine = KeywordCleaningEngine(
+        maxsize=APP_CONFIG.keyword_cleaning_cache_size
+    )
 
     if APP_CONFIG.mock_services:
         logger.info("creating mock system repository")
         system_repository = MockNutritionRepository(data=[])
+    elif APP_CONFIG.nutrition_system_db_source == "snapshot":
+        if APP_CONFIG.nutrition_system_db_snapshot_file != "":
+            logger.info("creating snapshot system repository from file")
+            load_documents = build_json_file_documents_loader(
+                APP_CONFIG.nutrition_system_db_snapshot_file
+            )
+        else:
+            logger.info("creating snapshot system repository from mongo")
+            load_documents = build_mongo_documents_loader(
+                mongo_uri=APP_CONFIG.nutrition_mongo_url,
+                db_name=APP_CONFIG.nutrition_db_name,
+                collection_name=APP_CONFIG.nutrition_system_db_collection_name,
+            )
+        system_repository = SnapshotNutritionRepository(
+            load_documents=load_documents,
+            max_results=APP_CONFIG.nutrition_system_db_search_limit or None,
+            refresh_interval_seconds=APP_CONFIG.nutrition_system_db_snapshot_refresh_time,
+        )
     else:
         logger.info("creating system repository")
         system_repository = SystemNutritionRepository(
@@ -37,15 +73,28 @@ def food_mapping_component_factory() -> MapFoodToNutritionDBComponentV2:
             db_name=APP_CONFIG.nutrition_db_name,
             collection_name=APP_CONFIG.nutrition_system_db_collection_name,
             index_name=APP_CONFIG.nutrition_system_db_collection_index,
+            max_results=APP_CONFIG.nutrition_system_db_search_limit or None,
         )
 
     logger.info("creating 'map food to nutrition db' function")
     food_mapper = FoodMapper(
         system_repository=system_repository,
         score_function=lambda food: score_food_by_exact_fuzzy_matches(
-            food, spacy_language
+            food, spacy_language, cleaning_engine
         ),
         unit_function=compute_new_amount_to_grams,
+        batch_score_function=lambda request, foods: score_foods_by_exact_fuzzy_matches(
+            request, foods, spacy_language, cleaning_engine
+        ),
     )
 
     return food_mapper
+
+
+def async_food_mapping_component_factory() -> AsyncFoodMapper:
+    food_mapper = food_mapping_component_factory()
+    logger.info("creating async 'map food to nutrition db' function")
+    return AsyncFoodMapper(
+        food_mapper=food_mapper,
+        system_repository=ThreadedNutritionRepository(food_mapper.system_repository),
+    )
@@ -1,9 +1,64 @@
 import logging
 
+import spacy
 from spacy.language import Language
+from spacy.tokens import Doc
 
 logger = logging.getLogger(__name__)
 
+NLP_MODES = ["full", "lexical"]
+
+# components required to compute the lemmas, the parser and the ner are not needed
+LEMMATIZATION_COMPONENTS = [
+    "tok2vec",
+    "morphologizer",
+    "tagger",
+    "attribute_ruler",
+    "lemmatizer",
+]
+# components of the spanish pipelines that are not loaded in lexical mode
+UNUSED_LEXICAL_COMPONENTS = ["parser", "senter", "ner"]
+
+
+def load_keyword_nlp(
+    model_name: str = "es_core_news_sm", mode: str = "full"
+) -> Language:
+    """
+    Load the spacy model used to clean keywords
+
+    - full: the whole pipeline is executed for every text
+    - lexical: only the tokenizer runs. Cleaning only needs `is_punct` and
+      `is_stop`, which are lexical attributes, so the output is the same as the
+      full mode. The components needed for lemmatization are loaded disabled and
+      are only executed when it is requested, the rest are not loaded
+    """
+    if mode not in NLP_MODES:
+        raise ValueError(f"Invalid nlp mode: {mode}, valid values: {NLP_MODES}")
+
+    if mode == "full":
+        return spacy.load(model_name)
+
+    nlp = spacy.load(model_name, exclude=UNUSED_LEXICAL_COMPONENTS)
+    for name in nlp.pipe_names:
+        nlp.disable_pipe(name)
+
+    return nlp
+
+
+def lemmatize(nlp: Language, text: str) -> Doc:
+    """
+    Process the text with the components needed to compute the lemmas, even if
+    they are disabled
+    """
+    if "lemmatizer" in nlp.pipe_names:
+        return nlp(text)
+
+    doc = nlp.make_doc(text)
+    for name in nlp.component_names:
+        if name in LEMMATIZATION_COMPONENTS:
+            doc = nlp.get_pipe(name)(doc)
+    return doc
+
 
 def remove_spanish_accents(text: str) -> str:
     """
@@ -47,7 +102,7 @@ def clean_description_keyword(
 
     # Apply lemmatization
     if not disable_lemmatization:
-        tokens = [token.lemma_ for token in nlp(clean_text)]
+        tokens = [token.lemma_ for token in lemmatize(nlp, clean_text)]
         clean_text = " ".join(tokens)
 
     logger.debug(f"cleaned description keyword '{clean_text}'")
@@ -1,13 +1,20 @@
 import logging
-from typing import List
+from typing import Dict, List
 
 import Levenshtein as lev
+import numpy as np
+import numpy.typing as npt
+from rapidfuzz import process
+from rapidfuzz.distance import Indel
 from spacy.language import Language
 
 from core.components.food_mapping.definitions.food_map_v2 import FoodScoreQuery
-from core.components.food_mapping.infrastructure.nlp.clean_keyword import (
-    clean_description_keyword,
+from core.components.food_mapping.infrastructure.nlp.keyword_cleaning_engine import (
+    DEFAULT_KEYWORD_CLEANING_ENGINE,
+    KeywordCleaningEngine,
 )
+from core.domain.entities.food import Food
+from core.domain.entities.food_nutrition_request import FoodNutritionRequest
 
 LEVENSHTIEN_THRESHOLD = 0.84
 
@@ -18,6 +25,7 @@ logger = logging.getLogger(__name__)
 def score_food_by_exact_fuzzy_matches(
     query: FoodScoreQuery,
     nlp: Language,
+    cleaning_engine: KeywordCleaningEngine | None = None,
 ) -> float:
     """
     Score the food by comparing the user's description with the target food's description
@@ -34,26 +42,26 @@ def score_food_by_exact_fuzzy_matches(
 
     :param nlp: spacy nlp object
     :param query: FoodScoreQuery object
+    :param cleaning_engine: engine used to clean the keywords, by default the
+        shared engine is used
     :return: FoodScoreResult object
 
     """
 
-    target_description = query.food.full_description
+    if cleaning_engine is None:
+        cleaning_engine = DEFAULT_KEYWORD_CLEANING_ENGINE
+
     user_description = query.food_description
     user_food_name = query.food_name
 
     logger.debug(f"scoring {query.food_name}")
 
     # is possible that a food name is composed of multiple words, e.g. "carne de res"
-    cleaned_user_food_name = clean_description_keyword(nlp, user_food_name)
+    cleaned_user_food_name = cleaning_engine.clean(nlp, user_food_name)
     food_name_description = cleaned_user_food_name.split(" ")
 
     cleaned_user_description = [
-        clean_description_keyword(
-            nlp,
-            word,
-        )
-        for word in user_description
+        cleaning_engine.clean(nlp, word) for word in user_description
     ]
     # it is possible that the user description is composed of multiple words
     final_user_description: List[str] = []
@@ -62,14 +70,11 @@ def score_food_by_exact_fuzzy_matches(
 
     full_user_description = food_name_description + final_user_description
 
-    # TODO: make sure that each description is a simple word
-    final_target_description: List[str] = []
-    for td in target_description:
-        final_target_description.extend(td.split(" "))
+    # the target description is already split into words when the food is loaded
+    target_description_set = query.food.keyword_token_set
 
     score = 0
     full_user_description_set = set(full_user_description)
-    target_description_set = set(final_target_description)
     intersection = full_user_description_set.intersection(target_description_set)
     number_of_exact_matches = len(intersection)
 
@@ -86,3 +91,72 @@ def score_food_by_exact_fuzzy_matches(
 
     logger.debug(f"final score: {score} for {query.food_name}")
     return score
+
+
+def score_foods_by_exact_fuzzy_matches(
+    request: FoodNutritionRequest,
+    foods: List[Food],
+    nlp: Language,
+    cleaning_engine: KeywordCleaningEngine | None = None,
+) -> npt.NDArray[np.float64]:
+    """
+    Score all the candidate foods at once, giving the same scores as
+    `score_food_by_exact_fuzzy_matches`
+
+    The similarity between every user word and every word of the candidate foods is
+    computed in a single `rapidfuzz.process.cdist` call. Then the exact and fuzzy
+    matches of each food are counted with matrix operations.
+
+    :param request: the food reported by the user
+    :param foods: the candidate foods
+    :param nlp: spacy nlp object
+    :param cleaning_engine: engine used to clean the keywords, by default the
+        shared engine is used
+    :return: array with the score of each food, in the same order as `foods`
+    """
+    if cleaning_engine is None:
+        cleaning_engine = DEFAULT_KEYWORD_CLEANING_ENGINE
+
+    if len(foods) == 0:
+        return np.zeros(0, dtype=np.float64)
+
+    logger.debug(f"scoring {len(foods)} foods for {request.food_name}")
+
+    user_words: List[str] = cleaning_engine.clean(nlp, request.food_name).split(" ")
+    for word in request.description:
+        user_words.extend(cleaning_engine.clean(nlp, word).split(" "))
+    user_vocabulary = list(dict.fromkeys(user_words))
+
+    target_indexes: Dict[str, int] = {}
+    for food in foods:
+        for token in food.keyword_token_set:
+            target_indexes.setdefault(token, len(target_indexes))
+    target_vocabulary = list(target_indexes)
+
+    # incidence matrix, foods x target words
+    food_words = np.zeros((len(foods), len(target_vocabulary)), dtype=np.float64)
+    for i, food in enumerate(foods):
+        food_words[i, [target_indexes[t] for t in food.keyword_token_set]] = 1
+
+    # user words x target words
+    similarity = process.cdist(
+        user_vocabulary,
+        target_vocabulary,
+        scorer=Indel.normalized_similarity,
+        dtype=np.float64,
+    )
+    fuzzy_matches = (similarity > LEVENSHTIEN_THRESHOLD).astype(np.float64)
+
+    # foods x user words, whether the user word is an exact match of the food
+    exact_matches = np.zeros((len(foods), len(user_vocabulary)), dtype=np.float64)
+    for j, word in enumerate(user_vocabulary):
+        target_index = target_indexes.get(word)
+        if target_index is not None:
+            exact_matches[:, j] = food_words[:, target_index]
+            # target words said by the user only count as exact matches
+            fuzzy_matches[:, target_index] = 0
+
+    fuzzy_counts = food_words @ fuzzy_matches.T
+    fuzzy_counts *= 1 - exact_matches
+
+    return exact_matches.sum(axis=1) * 2 + fuzzy_counts.sum(axis=1)
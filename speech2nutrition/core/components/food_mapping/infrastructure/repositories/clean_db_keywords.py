@@ -4,8 +4,8 @@ from typing import List
 from pymongo import database
 from spacy.language import Language
 
-from core.components.food_mapping.infrastructure.nlp.clean_keyword import (
-    clean_description_keyword,
+from core.components.food_mapping.infrastructure.nlp.keyword_cleaning_engine import (
+    KeywordCleaningEngine,
 )
 
 logger = logging.getLogger(__name__)
@@ -19,6 +19,8 @@ def clean_full_description_for_mongo_collection(
     disable_lemmatization: bool = True,
 ) -> None:
     collection = db[collection_name]
+    # many documents share the same keywords, e.g. 'crudo', 'cocido'
+    cleaning_engine = KeywordCleaningEngine()
 
     logger.info(f"retrieving all documents from collection '{collection_name}'")
     documents = collection.find()
@@ -27,7 +29,7 @@ def clean_full_description_for_mongo_collection(
         logger.info(f"cleaning full description for document '{doc['_id']}'")
         full_description: List[str] = doc[full_description_attr]
         cleaned_full_description = [
-            clean_description_keyword(
+            cleaning_engine.clean(
                 nlp, keyword, disable_lemmatization=disable_lemmatization
             )
             for keyword in full_description
@@ -42,3 +44,4 @@ def clean_full_description_for_mongo_collection(
     logger.info(
         f"finished cleaning full description for collection '{collection_name}'"
     )
+    logger.info(f"keyword cleaning cache stats: {cleaning_engine.stats()}")
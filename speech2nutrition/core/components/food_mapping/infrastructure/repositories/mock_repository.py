@@ -1,26 +1,68 @@
 import logging
-from typing import List
+from typing import Dict, List
 
 from core.domain.entities.food import Food
 
 logger = logging.getLogger(__name__)
 
 
+def get_lower_names(food: Food) -> List[str]:
+    possible_names = [food.food_name, *food.other_names]
+    # a name can be repeated, e.g. the food name is also in the other names
+    return list(dict.fromkeys(n.lower() for n in possible_names))
+
+
 class MockNutritionRepository:
     def __init__(self, data: List[Food]):
-        self.data = data
+        self._foods: Dict[str, Food] = {}
+        # lowercase name -> foods with that name or other name, by food id
+        self._name_index: Dict[str, Dict[str, Food]] = {}
+        for food in data:
+            self.add(food)
+
+    @property
+    def data(self) -> List[Food]:
+        return list(self._foods.values())
+
+    def add(self, food: Food) -> None:
+        """
+        Add a food to the repository, if a food with the same id exists it is
+        replaced
+        """
+        if food.id in self._foods:
+            self.remove(food.id)
+
+        self._foods[food.id] = food
+        for name in get_lower_names(food):
+            self._name_index.setdefault(name, {})[food.id] = food
+
+    def remove(self, food_id: str) -> None:
+        """
+        Remove a food from the repository by its id
+        """
+        food = self._foods.pop(food_id, None)
+        if food is None:
+            raise KeyError(f"food with id {food_id} not found")
+
+        for name in get_lower_names(food):
+            foods = self._name_index[name]
+            del foods[food_id]
+            if len(foods) == 0:
+                del self._name_index[name]
 
     def get_foods_by_name(self, name: str) -> List[Food]:
         """
         Get a list of foods by its name or other names
         """
         logger.info(f"searching for food with name: {name}")
-        results: List[Food] = []
-        for food in self.data:
-            possible_names = [food.food_name, *food.other_names]
-            lower_names = [n.lower() for n in possible_names]
-            if name.lower() in lower_names:
-                results.append(food)
+        results = list(self._name_index.get(name.lower(), {}).values())
 
         logger.info(f"found {len(results)} foods")
         return results
+
+    def get_foods_by_names(self, names: List[str]) -> List[List[Food]]:
+        """
+        Get the foods of several names, the results are returned in the same order
+        as the names
+        """
+        return [self.get_foods_by_name(name) for name in names]
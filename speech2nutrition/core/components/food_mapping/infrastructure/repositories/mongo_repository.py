@@ -7,6 +7,23 @@ from core.domain.entities.food import Food, FoodSource
 
 logger = logging.getLogger(__name__)
 
+SYSTEM_DB_FOOD_FIELDS = [
+    "id",
+    "food_name",
+    "other_names",
+    "description",
+    "search_keywords",
+    "portion_size",
+    "portion_size_unit",
+    "serving_size",
+    "serving_size_unit",
+    "calories",
+    "protein",
+    "fat",
+    "carbohydrates",
+]
+""" The fields required to build a Food from a system db document """
+
 
 def system_db_data_to_food(document: Dict[str, Any]) -> Food:
     return Food(
@@ -24,12 +41,18 @@ def system_db_data_to_food(document: Dict[str, Any]) -> Food:
         protein=document["protein"],
         fat=document["fat"],
         carbohydrates=document["carbohydrates"],
+        search_score=document.get("search_score"),
     )
 
 
 class SystemNutritionRepository:
     def __init__(
-        self, mongo_uri: str, db_name: str, collection_name: str, index_name: str
+        self,
+        mongo_uri: str,
+        db_name: str,
+        collection_name: str,
+        index_name: str,
+        max_results: int | None = 100,
     ):
         logger.info("connecting to mongo database")
         self.client = MongoClient(mongo_uri)
@@ -37,27 +60,94 @@ class SystemNutritionRepository:
         self.mongo_db = self.client[db_name]
         self.collection_name = collection_name
         self.index_name = index_name
+        # if None, all the matching documents are returned
+        self.max_results = max_results
 
-    def get_foods_by_name(self, name: str) -> List[Food]:
+    def build_search_pipeline(
+        self, name: str, query_index: int | None = None
+    ) -> List[Dict[str, Any]]:
         """
-        Get a list of foods by its name or other names
+        Build the aggregation pipeline to search foods by its name or other names.
+        Only the best `max_results` documents are returned, with just the fields
+        needed to build a Food and the search score
+
+        If `query_index` is given, it is added to each document so the results of
+        several searches can be told apart
         """
-        collection = self.mongo_db.get_collection(self.collection_name)
-        logger.info(f"searching for food with name: {name}")
-        result = collection.aggregate([
+        pipeline: List[Dict[str, Any]] = [
             {
                 "$search": {
                     "index": self.index_name,
                     "text": {"query": name, "path": {"wildcard": "*"}},
                 }
             }
-        ])
-        # TODO: limit the number of results in the query
-        result = list(result)
-        logger.info(f"number of results with name: {name} are equal to {len(result)}")
+        ]
+        if self.max_results is not None:
+            pipeline.append({"$limit": self.max_results})
+
+        projection: Dict[str, Any] = {
+            "_id": 0,
+            **dict.fromkeys(SYSTEM_DB_FOOD_FIELDS, 1),
+            "search_score": {"$meta": "searchScore"},
+        }
+        if query_index is not None:
+            projection["query_index"] = {"$literal": query_index}
+
+        pipeline.append({"$project": projection})
+        return pipeline
+
+    def build_multi_search_pipeline(self, names: List[str]) -> List[Dict[str, Any]]:
+        """
+        Build a single aggregation pipeline that searches all the names. The
+        search of the first name is the main pipeline, and the other searches are
+        appended using `$unionWith`. `$search` cannot be used inside `$facet`, and
+        inside `$unionWith` it requires MongoDB 6.0 or later
+        """
+        pipeline = self.build_search_pipeline(names[0], query_index=0)
+        for query_index, name in enumerate(names[1:], start=1):
+            pipeline.append({
+                "$unionWith": {
+                    "coll": self.collection_name,
+                    "pipeline": self.build_search_pipeline(
+                        name, query_index=query_index
+                    ),
+                }
+            })
+        return pipeline
+
+    def get_foods_by_name(self, name: str) -> List[Food]:
+        """
+        Get a list of foods by its name or other names
+        """
+        collection = self.mongo_db.get_collection(self.collection_name)
+        logger.info(f"searching for food with name: {name}")
+        result = collection.aggregate(self.build_search_pipeline(name))
         foods = [system_db_data_to_food(usda_data) for usda_data in result]
+        logger.info(f"number of results with name: {name} are equal to {len(foods)}")
 
         return foods
 
+    def get_foods_by_names(self, names: List[str]) -> List[List[Food]]:
+        """
+        Get the foods of several names in one database round trip, the results
+        are returned in the same order as the names
+        """
+        results: List[List[Food]] = [[] for _ in names]
+        if len(names) == 0:
+            return results
+
+        collection = self.mongo_db.get_collection(self.collection_name)
+        logger.info(f"searching for foods with names: {names}")
+        cursor = collection.aggregate(self.build_multi_search_pipeline(names))
+        for document in cursor:
+            results[document["query_index"]].append(system_db_data_to_food(document))
+
+        for name, foods in zip(names, results, strict=True):
+            logger.info(
+                f"number of results with name: {name} are equal to {len(foods)}"
+            )
+
+        return results
+
     def close(self):
         self.client.close()
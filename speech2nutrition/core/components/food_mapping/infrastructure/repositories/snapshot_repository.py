@@ -0,0 +1,181 @@
+import json
+import logging
+import re
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Set
+
+from pymongo import MongoClient
+
+from core.components.food_mapping.infrastructure.nlp.clean_keyword import (
+    remove_spanish_accents,
+)
+from core.components.food_mapping.infrastructure.repositories.mongo_repository import (
+    SYSTEM_DB_FOOD_FIELDS,
+    system_db_data_to_food,
+)
+from core.domain.entities.food import Food
+
+logger = logging.getLogger(__name__)
+
+DocumentsLoader = Callable[[], List[Dict[str, Any]]]
+"""
+Load all the documents of the system nutrition database
+"""
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split a text into lowercase words without spanish accents
+    """
+    return TOKEN_PATTERN.findall(remove_spanish_accents(text.lower()))
+
+
+def build_mongo_documents_loader(
+    mongo_uri: str, db_name: str, collection_name: str
+) -> DocumentsLoader:
+    def load_documents() -> List[Dict[str, Any]]:
+        client = MongoClient(mongo_uri)
+        try:
+            collection = client[db_name][collection_name]
+            projection = {"_id": 0, **dict.fromkeys(SYSTEM_DB_FOOD_FIELDS, 1)}
+            return list(collection.find({}, projection))
+        finally:
+            client.close()
+
+    return load_documents
+
+
+def build_json_file_documents_loader(file_path: str) -> DocumentsLoader:
+    """
+    The file must contain a json list with the documents of the collection
+    """
+
+    def load_documents() -> List[Dict[str, Any]]:
+        with open(file_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    return load_documents
+
+
+@dataclass
+class FoodSnapshot:
+    foods: List[Food]
+    """ All the foods of the collection """
+    index: Dict[str, Set[int]]
+    """ Inverted index, word -> positions of the foods that contain the word """
+
+
+def build_food_snapshot(documents: List[Dict[str, Any]]) -> FoodSnapshot:
+    foods: List[Food] = []
+    index: Dict[str, Set[int]] = defaultdict(set)
+    for position, document in enumerate(documents):
+        foods.append(system_db_data_to_food(document))
+        texts = [
+            document["food_name"],
+            *document["other_names"],
+            *document["search_keywords"],
+        ]
+        for text in texts:
+            for token in tokenize(text):
+                index[token].add(position)
+
+    return FoodSnapshot(foods=foods, index=dict(index))
+
+
+class SnapshotNutritionRepository:
+    """
+    Keep the whole system nutrition database in memory and search it with a local
+    inverted index over the food name, other names and search keywords.
+
+    Like the text operator of Atlas Search, a food matches if it contains any word
+    of the query. Foods are ranked by the number of words they match, and that
+    number is used as the search score.
+
+    If `refresh_interval_seconds` is greater than 0, the snapshot is reloaded in a
+    background thread. When a reload fails, the previous snapshot is kept.
+    """
+
+    def __init__(
+        self,
+        load_documents: DocumentsLoader,
+        max_results: int | None = 100,
+        refresh_interval_seconds: float = 0,
+    ):
+        self.load_documents = load_documents
+        self.max_results = max_results
+        self.refresh_interval_seconds = refresh_interval_seconds
+
+        self._snapshot = self._load_snapshot()
+        self._stop_event = threading.Event()
+        self._refresh_thread: threading.Thread | None = None
+        if refresh_interval_seconds > 0:
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_loop, name="food-snapshot-refresh", daemon=True
+            )
+            self._refresh_thread.start()
+
+    def _load_snapshot(self) -> FoodSnapshot:
+        logger.info("loading food snapshot")
+        snapshot = build_food_snapshot(self.load_documents())
+        logger.info(
+            f"food snapshot loaded with {len(snapshot.foods)} foods and "
+            f"{len(snapshot.index)} words"
+        )
+        return snapshot
+
+    def _refresh_loop(self) -> None:
+        while not self._stop_event.wait(self.refresh_interval_seconds):
+            self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Reload the snapshot, the previous one is kept if the reload fails
+        """
+        try:
+            snapshot = self._load_snapshot()
+        except Exception:
+            logger.exception("failed to refresh food snapshot, keeping previous one")
+            return
+
+        # replacing the reference is atomic, readers see the old or the new snapshot
+        self._snapshot = snapshot
+
+    def get_foods_by_name(self, name: str) -> List[Food]:
+        """
+        Get a list of foods by its name or other names
+        """
+        logger.info(f"searching for food with name: {name}")
+        snapshot = self._snapshot
+
+        matches: Dict[int, int] = defaultdict(int)
+        for token in set(tokenize(name)):
+            for position in snapshot.index.get(token, ()):
+                matches[position] += 1
+
+        # best matches first, ties keep the collection order
+        positions = sorted(matches, key=lambda p: (-matches[p], p))
+        if self.max_results is not None:
+            positions = positions[: self.max_results]
+
+        foods = [
+            snapshot.foods[p].copy(update={"search_score": float(matches[p])})
+            for p in positions
+        ]
+        logger.info(f"number of results with name: {name} are equal to {len(foods)}")
+        return foods
+
+    def get_foods_by_names(self, names: List[str]) -> List[List[Food]]:
+        """
+        Get the foods of several names, the results are returned in the same order
+        as the names
+        """
+        return [self.get_foods_by_name(name) for name in names]
+
+    def close(self):
+        self._stop_event.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join()
@@ -0,0 +1,24 @@
+import asyncio
+from typing import List
+
+from core.components.food_mapping.definitions.repository import NutritionRepository
+from core.domain.entities.food import Food
+
+
+class ThreadedNutritionRepository:
+    """
+    Async repository that queries a blocking repository in a worker thread, so the
+    event loop is free while the query runs.
+
+    pymongo is a blocking driver, so this is how SystemNutritionRepository is used
+    from async code
+    """
+
+    def __init__(self, repository: NutritionRepository):
+        self.repository = repository
+
+    async def get_foods_by_name(self, name: str) -> List[Food]:
+        return await asyncio.to_thread(self.repository.get_foods_by_name, name)
+
+    async def get_foods_by_names(self, names: List[str]) -> List[List[Food]]:
+        return await asyncio.to_thread(self.repository.get_foods_by_names, names)
@@ -1,16 +1,24 @@
+import heapq
 import logging
 from typing import List
 
 from core.components.food_mapping.application.food_finder import (
     find_foods_by_preference,
+    find_many_foods_by_preference,
+    find_many_foods_by_preference_async,
 )
 from core.components.food_mapping.definitions.food_map_v2 import (
+    FoodBatchScoreFunction,
     FoodScoreFunction,
     FoodScoreQuery,
     FoodUnitFunction,
     FoodUnitQuery,
 )
-from core.components.food_mapping.definitions.repository import NutritionRepository
+from core.components.food_mapping.definitions.repository import (
+    AsyncNutritionRepository,
+    NutritionRepository,
+)
+from core.domain.entities.food import Food
 from core.domain.entities.food_nutrition_request import FoodNutritionRequest
 from core.domain.entities.food_nutrition_response import (
     FoodNutritionResponse,
@@ -28,17 +36,30 @@ class FoodMapper:
         system_repository: NutritionRepository,
         score_function: FoodScoreFunction,
         unit_function: FoodUnitFunction,
+        batch_score_function: FoodBatchScoreFunction | None = None,
     ) -> None:
         self.system_repository = system_repository
         self.score_function = score_function
         self.unit_function = unit_function
+        # if available, the batch score function is used instead of scoring the
+        # foods one by one
+        self.batch_score_function = batch_score_function
 
     def __call__(
         self,
         request: FoodNutritionRequest,
         lookup_preference: DBLookupPreference,
         app_user_id: str,
+        max_records: int = 4,
     ) -> FoodNutritionResponse:
+        """
+        Map the food reported by the user to the best food record in the nutrition
+        database, the next `max_records - 1` best food records are returned as
+        suggestions
+        """
+        if max_records < 1:
+            raise ValueError("max_records must be greater than 0")
+
         # TODO: create the real user repository using the app_user_id,
         #  for now we will use the system repository
         logger.info(f"creating user repository for user {app_user_id}")
@@ -48,7 +69,47 @@ class FoodMapper:
             request, lookup_preference, self.system_repository, user_repository
         )
 
-        if len(repo_foods_response.foods) == 0:
+        return self.build_response(request, repo_foods_response.foods, max_records)
+
+    def map_many(
+        self,
+        requests: List[FoodNutritionRequest],
+        lookup_preference: DBLookupPreference,
+        app_user_id: str,
+        max_records: int = 4,
+    ) -> List[FoodNutritionResponse]:
+        """
+        Same as calling the mapper for each request, but the foods of all the
+        requests are retrieved with bulk repository queries. The responses are
+        returned in the same order as the requests
+        """
+        if max_records < 1:
+            raise ValueError("max_records must be greater than 0")
+
+        # TODO: create the real user repository using the app_user_id,
+        #  for now we will use the system repository
+        logger.info(f"creating user repository for user {app_user_id}")
+        user_repository = self.system_repository
+
+        repo_foods_responses = find_many_foods_by_preference(
+            requests, lookup_preference, self.system_repository, user_repository
+        )
+
+        return [
+            self.build_response(request, repo_foods_response.foods, max_records)
+            for request, repo_foods_response in zip(
+                requests, repo_foods_responses, strict=True
+            )
+        ]
+
+    def build_response(
+        self, request: FoodNutritionRequest, foods: List[Food], max_records: int
+    ) -> FoodNutritionResponse:
+        """
+        Score the foods found for the request and build the response with the best
+        `max_records` food records
+        """
+        if len(foods) == 0:
             logger.debug(f"no foods found with name {request.food_name}")
             return FoodNutritionResponse(
                 food_record=None,
@@ -57,52 +118,42 @@ class FoodMapper:
                 user_unit=request.unit,
             )
 
-        logger.debug(f"scoring the {len(repo_foods_response.foods)} foods found")
-        scores = [
-            self.score_function(
-                FoodScoreQuery(
-                    food=food,
-                    food_description=request.description,
-                    food_name=request.food_name,
+        logger.debug(f"scoring the {len(foods)} foods found")
+        if self.batch_score_function is not None:
+            scores = self.batch_score_function(request, foods)
+        else:
+            scores = [
+                self.score_function(
+                    FoodScoreQuery(
+                        food=food,
+                        food_description=request.description,
+                        food_name=request.food_name,
+                    )
                 )
-            )
-            for food in repo_foods_response.foods
-        ]
+                for food in foods
+            ]
 
-        logger.debug("creating the food records without unit information")
-        food_records: List[FoodRecord] = []
-        for food, score in zip(repo_foods_response.foods, scores, strict=True):
-            food_records.append(
-                FoodRecord(
-                    food=food,
-                    score=score,
-                    amount=0,
-                    unit_was_transformed=False,
-                    serving_size_was_used=False,
-                )
-            )
-
-        logger.debug("sorting the food records")
-        sorted_food_records = sorted(food_records, key=lambda x: x.score, reverse=True)
-        best_food_records = sorted_food_records[:4]
+        logger.debug(f"selecting the best {max_records} foods")
+        # nlargest keeps the original order of foods with the same score, just like
+        # a stable sort in descending order would do
+        score_list = [float(score) for score in scores]
+        best_indexes = heapq.nlargest(
+            max_records, range(len(foods)), key=score_list.__getitem__
+        )
 
-        # we compute the new amount just for the best food records. This way we
-        # avoid computing the new amount for uninteresting foods
-        unit_responses = [
-            self.unit_function(
+        # the food records are created just for the best foods. This way we
+        # avoid computing the new amount and validating uninteresting foods
+        final_food_records: List[FoodRecord] = []
+        for index in best_indexes:
+            food = foods[index]
+            unit_response = self.unit_function(
                 FoodUnitQuery(
-                    food=food_record.food,
+                    food=food,
                     unit=request.unit,
                     amount=request.amount,
                 )
             )
-            for food_record in best_food_records
-        ]
 
-        final_food_records: List[FoodRecord] = []
-        for food_record, unit_response in zip(
-            best_food_records, unit_responses, strict=True
-        ):
             unit_trans_info = None
             if unit_response.unit_transformation_info is not None:
                 unit_trans_info = UnitTransformationInfo(
@@ -113,8 +164,8 @@ class FoodMapper:
 
             final_food_records.append(
                 FoodRecord(
-                    food=food_record.food,
-                    score=food_record.score,
+                    food=food,
+                    score=score_list[index],
                     amount=unit_response.amount,
                     unit_was_transformed=unit_response.unit_was_transformed,
                     serving_size_was_used=unit_response.serving_size_was_used,
@@ -123,7 +174,7 @@ class FoodMapper:
             )
 
         best_match = final_food_records[0]
-        suggestions = final_food_records[1:4]
+        suggestions = final_food_records[1:]
 
         return FoodNutritionResponse(
             food_record=best_match,
@@ -131,3 +182,44 @@ class FoodMapper:
             user_amount=request.amount,
             user_unit=request.unit,
         )
+
+
+class AsyncFoodMapper:
+    """
+    Async version of FoodMapper.map_many, the foods are retrieved with an async
+    repository and then scored and selected by the given food mapper
+    """
+
+    def __init__(
+        self, food_mapper: FoodMapper, system_repository: AsyncNutritionRepository
+    ) -> None:
+        self.food_mapper = food_mapper
+        self.system_repository = system_repository
+
+    async def __call__(
+        self,
+        requests: List[FoodNutritionRequest],
+        lookup_preference: DBLookupPreference,
+        app_user_id: str,
+        max_records: int = 4,
+    ) -> List[FoodNutritionResponse]:
+        if max_records < 1:
+            raise ValueError("max_records must be greater than 0")
+
+        # TODO: create the real user repository using the app_user_id,
+        #  for now we will use the system repository
+        logger.info(f"creating user repository for user {app_user_id}")
+        user_repository = self.system_repository
+
+        repo_foods_responses = await find_many_foods_by_preference_async(
+            requests, lookup_preference, self.system_repository, user_repository
+        )
+
+        return [
+            self.food_mapper.build_response(
+                request, repo_foods_response.foods, max_records
+            )
+            for request, repo_foods_response in zip(
+                requests, repo_foods_responses, strict=True
+            )
+        ]
@@ -1,6 +1,11 @@
 import logging
 
-from core.components.speech2text.definitions import AudioStorage, Speech2TextModel
+from core.components.speech2text.definitions import (
+    AsyncAudioStorage,
+    AsyncSpeech2TextModel,
+    AudioStorage,
+    Speech2TextModel,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,3 +35,22 @@ class Speech2TextService:
         audio, audio_metadata = self.audio_storage.read_file(audio_id)
         logger.info(f"transcribing audio with id: {audio_id}")
         return self.speech2text_model.transcribe(audio, audio_metadata)
+
+
+class AsyncSpeech2TextService:
+    def __init__(
+        self,
+        audio_storage: AsyncAudioStorage,
+        speech2text_model: AsyncSpeech2TextModel,
+    ):
+        self.audio_storage = audio_storage
+        self.speech2text_model = speech2text_model
+
+    async def __call__(self, audio_id: str) -> str:
+        """
+        Async version of Speech2TextService.__call__
+        """
+        logger.info(f"dowloading audio with id: {audio_id}")
+        audio, audio_metadata = await self.audio_storage.read_file(audio_id)
+        logger.info(f"transcribing audio with id: {audio_id}")
+        return await self.speech2text_model.transcribe(audio, audio_metadata)
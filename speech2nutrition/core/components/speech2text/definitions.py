@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, Protocol, Tuple
+from typing import Any, Awaitable, Callable, Dict, Protocol, Tuple
 
 
 class AudioStorage(Protocol):
@@ -52,3 +52,25 @@ Returns
 str
     The transcription of the audio
 """
+
+
+class AsyncAudioStorage(Protocol):
+    async def read_file(self, audio_id: str) -> Tuple[bytes, Dict[str, Any]]:
+        """
+        Async version of AudioStorage.read_file
+        """
+        ...
+
+
+class AsyncSpeech2TextModel(Protocol):
+    async def transcribe(self, audio: bytes, metadata: Dict[str, Any]) -> str:
+        """
+        Async version of Speech2TextModel.transcribe
+        """
+        ...
+
+
+AsyncSpeech2TextComponent = Callable[[str], Awaitable[str]]
+"""
+Async version of Speech2TextComponent
+"""
@@ -1,40 +1,153 @@
 import logging
+from typing import Any, Dict
 
 from config.settings_v2 import APP_CONFIG
-from core.components.speech2text.application.s2t_service import Speech2TextService
-from core.components.speech2text.definitions import Speech2TextComponent
+from core.cache import Cache, cache_factory
+from core.components.speech2text.application.s2t_service import (
+    AsyncSpeech2TextService,
+    Speech2TextService,
+)
+from core.components.speech2text.definitions import (
+    AsyncSpeech2TextComponent,
+    AudioStorage,
+    Speech2TextComponent,
+    Speech2TextModel,
+)
+from core.components.speech2text.infrastructure.cached_audio_storage import (
+    DiskCachedAudioStorage,
+)
+from core.components.speech2text.infrastructure.cached_s2t_model import (
+    AsyncCachedSpeech2TextModel,
+    CachedSpeech2TextModel,
+)
 from core.components.speech2text.infrastructure.mocks.mock_audio_storage import (
     MockAudioStorage,
 )
 from core.components.speech2text.infrastructure.mocks.mock_s2t_model import (
+    AsyncMockSpeech2TextToModel,
     MockSpeech2TextToModel,
 )
 from core.components.speech2text.infrastructure.real.deepgram import (
+    DEEPGRAM_OPTIONS,
+    AsyncDeepgramWhisperSpeech2TextModel,
     DeepgramWhisperSpeech2TextModel,
 )
+from core.components.speech2text.infrastructure.real.openai_whisper import (
+    OPENAI_WHISPER_OPTIONS,
+    OpenAIWhisperSpeech2TextModel,
+)
 from core.components.speech2text.infrastructure.real.s3_storage import S3AudioStorage
+from core.components.speech2text.infrastructure.threaded_audio_storage import (
+    ThreadedAudioStorage,
+)
 
 logger = logging.getLogger(__name__)
 
+SPEECH2TEXT_PROVIDERS = ["deepgram", "openai-whisper"]
 
-def speech2text_component_factory() -> Speech2TextComponent:
+
+def audio_storage_factory() -> AudioStorage:
     if APP_CONFIG.mock_services:
         logger.info("creating mock audio storage")
-        audio_storage = MockAudioStorage(
-            audio_folder_path=APP_CONFIG.mock_audio_storage_folder
+        return MockAudioStorage(audio_folder_path=APP_CONFIG.mock_audio_storage_folder)
+
+    logger.info("creating s3 audio storage")
+    audio_storage = S3AudioStorage(
+        region_name=APP_CONFIG.aws_region, bucket_name=APP_CONFIG.aws_s3_bucket
+    )
+    if APP_CONFIG.audio_cache_folder == "":
+        return audio_storage
+
+    logger.info(f"caching the audios in {APP_CONFIG.audio_cache_folder}")
+    return DiskCachedAudioStorage(
+        audio_storage,
+        folder=APP_CONFIG.audio_cache_folder,
+        max_bytes=APP_CONFIG.audio_cache_max_size * 1024 * 1024,
+    )
+
+
+def transcription_cache_factory() -> Cache | None:
+    return cache_factory(
+        APP_CONFIG.transcription_cache,
+        file_path=APP_CONFIG.transcription_cache_file,
+        maxsize=APP_CONFIG.transcription_cache_size,
+        ttl_seconds=APP_CONFIG.transcription_cache_ttl,
+    )
+
+
+def speech2text_model_factory(provider: str = "deepgram") -> Speech2TextModel:
+    """
+    Create the speech2text model of a provider, one of SPEECH2TEXT_PROVIDERS
+    """
+    if provider not in SPEECH2TEXT_PROVIDERS:
+        raise ValueError(
+            f"Invalid speech2text provider: {provider}, valid values: {', '.join(SPEECH2TEXT_PROVIDERS)}"
         )
+
+    if APP_CONFIG.mock_services:
         logger.info("creating mock speech2text model")
-        speech2text_model = MockSpeech2TextToModel()
-    else:
-        logger.info("creating s3 audio storage")
-        audio_storage = S3AudioStorage(
-            region_name=APP_CONFIG.aws_region, bucket_name=APP_CONFIG.aws_s3_bucket
+        return MockSpeech2TextToModel()
+
+    if provider == "openai-whisper":
+        logger.info("creating openai whisper speech2text model")
+        speech2text_model = OpenAIWhisperSpeech2TextModel(
+            api_key=APP_CONFIG.open_ai_key
         )
+    else:
         logger.info("creating deepgram whisper speech2text model")
         speech2text_model = DeepgramWhisperSpeech2TextModel(
             api_key=APP_CONFIG.deepgram_key
         )
 
+    cache = transcription_cache_factory()
+    if cache is None:
+        return speech2text_model
+
+    return CachedSpeech2TextModel(
+        speech2text_model, cache, options=speech2text_model_options(provider)
+    )
+
+
+def speech2text_model_options(provider: str = "deepgram") -> Dict[str, Any]:
+    """
+    Options of the model of a provider that change its transcriptions, used to
+    cache them
+    """
+    if APP_CONFIG.mock_services:
+        return {"provider": "mock"}
+    if provider == "openai-whisper":
+        return {"provider": provider, **OPENAI_WHISPER_OPTIONS}
+    return {"provider": provider, **DEEPGRAM_OPTIONS}
+
+
+def speech2text_component_factory() -> Speech2TextComponent:
+    audio_storage = audio_storage_factory()
+    speech2text_model = speech2text_model_factory()
+
     logger.info("creating speech2text service")
     s2t = Speech2TextService(audio_storage, speech2text_model)
     return s2t
+
+
+def async_speech2text_component_factory() -> AsyncSpeech2TextComponent:
+    audio_storage = audio_storage_factory()
+    if APP_CONFIG.mock_services:
+        logger.info("creating async mock speech2text model")
+        speech2text_model = AsyncMockSpeech2TextToModel()
+    else:
+        logger.info("creating async deepgram whisper speech2text model")
+        speech2text_model = AsyncDeepgramWhisperSpeech2TextModel(
+            api_key=APP_CONFIG.deepgram_key
+        )
+        cache = transcription_cache_factory()
+        if cache is not None:
+            speech2text_model = AsyncCachedSpeech2TextModel(
+                speech2text_model,
+                cache,
+                options=speech2text_model_options("deepgram"),
+            )
+
+    logger.info("creating async speech2text service")
+    return AsyncSpeech2TextService(
+        ThreadedAudioStorage(audio_storage), speech2text_model
+    )
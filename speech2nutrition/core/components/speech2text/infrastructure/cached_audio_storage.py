@@ -0,0 +1,144 @@
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+from core.components.speech2text.definitions import AudioStorage
+
+logger = logging.getLogger(__name__)
+
+AUDIO_EXTENSION = ".audio"
+METADATA_EXTENSION = ".json"
+
+
+class DiskCachedAudioStorage:
+    """
+    Keep the audios read from a storage in a local folder, keyed by the audio id,
+    so an audio that is read again, e.g. when a request is retried, is not
+    downloaded again. The audios are uploaded once with a new id and never
+    replaced, so a cached audio is used without checking the storage again.
+
+    The least recently used audios are removed when the audios in the folder take
+    more than `max_bytes`
+    """
+
+    def __init__(self, audio_storage: AudioStorage, folder: str, max_bytes: int):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be greater than 0")
+
+        self.audio_storage = audio_storage
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # cache key -> size of the audio, from the least to the most recently used
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+
+        os.makedirs(folder, exist_ok=True)
+        self._load_entries()
+
+    def _load_entries(self) -> None:
+        """
+        Index the audios saved by a previous process, by their last use
+        """
+        audios = []
+        for name in os.listdir(self.folder):
+            if not name.endswith(AUDIO_EXTENSION):
+                continue
+            key = name.removesuffix(AUDIO_EXTENSION)
+            if not os.path.exists(self._get_path(key, METADATA_EXTENSION)):
+                continue
+            stat = os.stat(os.path.join(self.folder, name))
+            audios.append((stat.st_mtime, key, stat.st_size))
+
+        for _, key, size in sorted(audios):
+            self._entries[key] = size
+            self._total_bytes += size
+        self._evict()
+
+    def _get_path(self, key: str, extension: str) -> str:
+        return os.path.join(self.folder, f"{key}{extension}")
+
+    def read_file(self, audio_id: str) -> Tuple[bytes, Dict[str, Any]]:
+        key = hashlib.sha256(audio_id.encode()).hexdigest()
+
+        cached = self._read_cached(key)
+        if cached is not None:
+            logger.info(f"audio {audio_id} found in cache")
+            return cached
+
+        audio, metadata = self.audio_storage.read_file(audio_id)
+        try:
+            self._save(key, audio, metadata)
+        except Exception:
+            logger.warning(f"failed to save audio {audio_id} in cache", exc_info=True)
+        return audio, metadata
+
+    def _read_cached(self, key: str) -> Tuple[bytes, Dict[str, Any]] | None:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+
+        try:
+            audio_path = self._get_path(key, AUDIO_EXTENSION)
+            with open(audio_path, "rb") as f:
+                audio = f.read()
+            with open(self._get_path(key, METADATA_EXTENSION), encoding="utf-8") as f:
+                metadata = json.load(f)
+            # the modification time is the last use when the folder is indexed again
+            os.utime(audio_path)
+        except Exception:
+            logger.warning(f"invalid cached audio {key}", exc_info=True)
+            with self._lock:
+                self._remove(key)
+            return None
+
+        return audio, metadata
+
+    def _save(self, key: str, audio: bytes, metadata: Dict[str, Any]) -> None:
+        if len(audio) > self.max_bytes:
+            return
+
+        # the metadata is written first, an audio file is only indexed if its
+        # metadata exists
+        self._write(
+            self._get_path(key, METADATA_EXTENSION), json.dumps(metadata).encode()
+        )
+        self._write(self._get_path(key, AUDIO_EXTENSION), audio)
+
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._entries[key]
+            self._entries[key] = len(audio)
+            self._entries.move_to_end(key)
+            self._total_bytes += len(audio)
+            self._evict()
+
+    def _write(self, path: str, content: bytes) -> None:
+        # write to a temporary file first, so a reader never sees a partial file
+        fd, temp_path = tempfile.mkstemp(dir=self.folder, prefix=".audio-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(temp_path, path)
+        except Exception:
+            os.remove(temp_path)
+            raise
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes:
+            key = next(iter(self._entries))
+            logger.info(f"removing audio {key} from cache")
+            self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        self._total_bytes -= self._entries.pop(key, 0)
+        for extension in [AUDIO_EXTENSION, METADATA_EXTENSION]:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self._get_path(key, extension))
@@ -0,0 +1,77 @@
+import hashlib
+import json
+import logging
+from typing import Any, Dict
+
+from core.cache import Cache
+from core.components.speech2text.definitions import (
+    AsyncSpeech2TextModel,
+    Speech2TextModel,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def build_transcription_cache_key(audio: bytes, options: Dict[str, Any]) -> str:
+    """
+    Hash of the audio content and the options of the model, so the same audio is
+    transcribed again if it is sent to a different model or language
+    """
+    digest = hashlib.sha256(audio)
+    digest.update(json.dumps(options, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class CachedSpeech2TextModel:
+    """
+    Return the cached transcription of an audio instead of transcribing it again,
+    e.g. when a message is delivered again
+    """
+
+    def __init__(
+        self,
+        speech2text_model: Speech2TextModel,
+        cache: Cache,
+        options: Dict[str, Any],
+    ):
+        self.speech2text_model = speech2text_model
+        self.cache = cache
+        self.options = options
+
+    def transcribe(self, audio: bytes, metadata: Dict[str, Any]) -> str:
+        key = build_transcription_cache_key(audio, self.options)
+        transcription = self.cache.get(key)
+        if transcription is not None:
+            logger.info("transcription found in cache")
+            return transcription
+
+        transcription = self.speech2text_model.transcribe(audio, metadata)
+        self.cache.set(key, transcription)
+        return transcription
+
+
+class AsyncCachedSpeech2TextModel:
+    """
+    Async version of CachedSpeech2TextModel
+    """
+
+    def __init__(
+        self,
+        speech2text_model: AsyncSpeech2TextModel,
+        cache: Cache,
+        options: Dict[str, Any],
+    ):
+        self.speech2text_model = speech2text_model
+        self.cache = cache
+        self.options = options
+
+    async def transcribe(self, audio: bytes, metadata: Dict[str, Any]) -> str:
+        key = build_transcription_cache_key(audio, self.options)
+        transcription = self.cache.get(key)
+        if transcription is not None:
+            logger.info("transcription found in cache")
+            return transcription
+
+        transcription = await self.speech2text_model.transcribe(audio, metadata)
+        self.cache.set(key, transcription)
+        return transcription
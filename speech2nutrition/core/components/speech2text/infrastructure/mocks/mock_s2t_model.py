@@ -22,3 +22,12 @@ class MockSpeech2TextToModel:
         """
         logger.info("transcribing audio")
         return audio.decode("utf-8")
+
+
+class AsyncMockSpeech2TextToModel:
+    async def transcribe(self, audio: bytes, metadata: Dict[str, Any]) -> str:
+        """
+        Async version of MockSpeech2TextToModel.transcribe
+        """
+        logger.info("transcribing audio")
+        return audio.decode("utf-8")
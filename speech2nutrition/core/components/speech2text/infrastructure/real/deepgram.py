@@ -7,14 +7,20 @@ from core.domain.errors import ServiceException
 
 logger = logging.getLogger(__name__)
 
+DEEPGRAM_OPTIONS = {
+    "language": "es-419",
+    "model": "whisper-medium",
+}
+
+
+def get_transcript(response: Any) -> str:
+    return response["results"]["channels"][0]["alternatives"][0]["transcript"]
+
 
 class DeepgramWhisperSpeech2TextModel:
     def __init__(self, api_key: str):
         self.deepgram = Deepgram(api_key)
-        self.options = {
-            "language": "es-419",
-            "model": "whisper-medium",
-        }
+        self.options = DEEPGRAM_OPTIONS
 
     def transcribe(self, audio: bytes, metadata: Dict[str, Any]) -> str:
         """
@@ -50,6 +56,36 @@ class DeepgramWhisperSpeech2TextModel:
                 self.options,  # pyright: ignore [reportArgumentType]
                 timeout=180,
             )
-            return response["results"]["channels"][0]["alternatives"][0]["transcript"]  # pyright: ignore [reportTypedDictNotRequiredAccess]
+            return get_transcript(response)
+        except Exception as e:
+            raise ServiceException("could not transcribe audio", "deepgram") from e
+
+
+class AsyncDeepgramWhisperSpeech2TextModel:
+    def __init__(self, api_key: str):
+        self.deepgram = Deepgram(api_key)
+        self.options = DEEPGRAM_OPTIONS
+
+    async def transcribe(self, audio: bytes, metadata: Dict[str, Any]) -> str:
+        """
+        Same as DeepgramWhisperSpeech2TextModel.transcribe, but the request to
+        deepgram does not block the event loop
+        """
+        if "mime_type" not in metadata:
+            raise ServiceException("metadata must contain mime_type", "deepgram")
+
+        logger.info(
+            f"transcribing audio with deepgram using mime type {metadata['mime_type']}"
+        )
+        mimetype: str = metadata["mime_type"]
+        source = {"buffer": audio, "mimetype": mimetype}
+
+        try:
+            response = await self.deepgram.transcription.prerecorded(
+                source,  # pyright: ignore [reportArgumentType]
+                self.options,  # pyright: ignore [reportArgumentType]
+                timeout=180,
+            )
+            return get_transcript(response)
         except Exception as e:
             raise ServiceException("could not transcribe audio", "deepgram") from e
@@ -10,6 +10,11 @@ logger = logging.getLogger(__name__)
 
 SUPPORTED_EXTENSIONS = ["mp3", "mp4", "mpeg", "mpga", "m4a", "wav", "webm"]
 
+OPENAI_WHISPER_OPTIONS = {
+    "language": "es",
+    "model": "whisper-1",
+}
+
 
 class OpenAIWhisperSpeech2TextModel:
     def __init__(self, api_key: str):
@@ -68,9 +73,9 @@ class OpenAIWhisperSpeech2TextModel:
 
         try:
             response = self.client.audio.transcriptions.create(
-                model="whisper-1",
+                model=OPENAI_WHISPER_OPTIONS["model"],
                 file=audio_bytes_io,
-                language="es",
+                language=OPENAI_WHISPER_OPTIONS["language"],
             )
             return response.text
         except Exception as e:
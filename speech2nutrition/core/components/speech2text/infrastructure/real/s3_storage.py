@@ -10,7 +10,9 @@ logger = logging.getLogger(__name__)
 
 class S3AudioStorage:
     def __init__(self, region_name: str, bucket_name: str) -> None:
-        self.s3 = boto3.client(
+        # a session per client, the default session is not thread safe and the
+        # storage can be created in a background thread
+        self.s3 = boto3.session.Session().client(
             "s3",
             region_name=region_name,
         )
@@ -28,12 +30,16 @@ class S3AudioStorage:
         -------
         Tuple[bytes, Dict[str, Any]]
             The audio and metadata associated with the audio, such as mime type
+            and ETag
         """
         try:
             logger.info(f"reading audio from storage with id {audio_id}")
             response = self.s3.get_object(Bucket=self.bucket_name, Key=audio_id)
             content = response["Body"].read()
-            metadata = {"mime_type": response["ContentType"]}
+            metadata = {
+                "mime_type": response["ContentType"],
+                "etag": response.get("ETag"),
+            }
             logger.info(f"metadata for audio {audio_id} is {metadata}")
         except Exception as e:
             logger.exception("Failed to read audio from storage")
@@ -0,0 +1,20 @@
+import asyncio
+from typing import Any, Dict, Tuple
+
+from core.components.speech2text.definitions import AudioStorage
+
+
+class ThreadedAudioStorage:
+    """
+    Async audio storage that reads the audio with a blocking audio storage in a
+    worker thread, so the event loop is free while the audio is downloaded.
+
+    boto3 does not have an async client, so this is how S3AudioStorage is used
+    from async code
+    """
+
+    def __init__(self, audio_storage: AudioStorage):
+        self.audio_storage = audio_storage
+
+    async def read_file(self, audio_id: str) -> Tuple[bytes, Dict[str, Any]]:
+        return await asyncio.to_thread(self.audio_storage.read_file, audio_id)
@@ -1,16 +1,127 @@
-from core.components.food_extraction.factory import food_extraction_component_factory
-from core.components.food_mapping.factory import food_mapping_component_factory
-from core.components.speech2text.factory import speech2text_component_factory
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from config.settings_v2 import APP_CONFIG
+from core.async_request_handler import AsyncRequestHandler
+from core.component_container import ComponentContainer
+from core.components.food_extraction.definitions import (
+    ExtractFoodComponent,
+    StreamExtractFoodComponent,
+)
+from core.components.food_extraction.factory import (
+    async_food_extraction_component_factory,
+    food_extraction_component_factory,
+    food_extraction_stream_component_factory,
+)
+from core.components.food_mapping.definitions.food_map_v2 import (
+    MapFoodToNutritionDBComponentV2,
+    MapManyFoodsToNutritionDBComponent,
+)
+from core.components.food_mapping.factory import (
+    async_food_mapping_component_factory,
+    food_mapping_component_factory,
+)
+from core.components.speech2text.definitions import Speech2TextComponent
+from core.components.speech2text.factory import (
+    async_speech2text_component_factory,
+    speech2text_component_factory,
+)
 from core.request_handler import RequestHandler
 
+logger = logging.getLogger(__name__)
 
-def core_factory() -> RequestHandler:
-    speech2text_component = speech2text_component_factory()
-    food_extraction_component = food_extraction_component_factory()
-    food_mapping_component = food_mapping_component_factory()
+
+def build_request_handler(
+    speech2text_component: Speech2TextComponent,
+    food_extraction_component: ExtractFoodComponent,
+    food_mapping_component: MapFoodToNutritionDBComponentV2,
+    food_mapping_many_component: MapManyFoodsToNutritionDBComponent,
+    food_extraction_stream_component: StreamExtractFoodComponent | None = None,
+) -> RequestHandler:
+    batch_component = None
+    food_mapping_executor = None
+    if APP_CONFIG.food_mapping_strategy == "batch":
+        logger.info("mapping all the foods of a request at once")
+        batch_component = food_mapping_many_component
+    elif APP_CONFIG.food_mapping_strategy == "concurrent":
+        logger.info(
+            f"mapping the foods of a request with {APP_CONFIG.food_mapping_max_workers} workers"
+        )
+        food_mapping_executor = ThreadPoolExecutor(
+            max_workers=APP_CONFIG.food_mapping_max_workers,
+            thread_name_prefix="food-mapping",
+        )
+    else:
+        logger.info("mapping the foods of a request one by one")
 
     return RequestHandler(
         s2t_component=speech2text_component,
         food_extraction_component=food_extraction_component,
         food_mapping_component=food_mapping_component,
+        food_mapping_many_component=batch_component,
+        food_mapping_executor=food_mapping_executor,
+        food_extraction_stream_component=food_extraction_stream_component,
+    )
+
+
+def core_factory() -> RequestHandler:
+    speech2text_component = speech2text_component_factory()
+    food_mapping_component = food_mapping_component_factory()
+
+    if APP_CONFIG.food_extraction_streaming:
+        logger.info("mapping the foods while they are extracted")
+        stream_component = food_extraction_stream_component_factory()
+        return build_request_handler(
+            speech2text_component,
+            lambda text: list(stream_component(text)),
+            food_mapping_component,
+            food_mapping_component.map_many,
+            stream_component,
+        )
+
+    return build_request_handler(
+        speech2text_component,
+        food_extraction_component_factory(),
+        food_mapping_component,
+        food_mapping_component.map_many,
+    )
+
+
+def lazy_core_factory(container: ComponentContainer) -> RequestHandler:
+    """
+    Same as core_factory, but the components are registered in the container and
+    created the first time they are used
+    """
+    speech2text = container.register("speech2text", speech2text_component_factory)
+    food_mapping = container.register("food_mapping", food_mapping_component_factory)
+
+    if APP_CONFIG.food_extraction_streaming:
+        logger.info("mapping the foods while they are extracted")
+        food_extraction_stream = container.register(
+            "food_extraction", food_extraction_stream_component_factory
+        )
+        return build_request_handler(
+            lambda audio_id: speech2text.get()(audio_id),
+            lambda text: list(food_extraction_stream.get()(text)),
+            lambda *args: food_mapping.get()(*args),
+            lambda *args: food_mapping.get().map_many(*args),
+            lambda text: food_extraction_stream.get()(text),
+        )
+
+    food_extraction = container.register(
+        "food_extraction", food_extraction_component_factory
+    )
+    return build_request_handler(
+        lambda audio_id: speech2text.get()(audio_id),
+        lambda text: food_extraction.get()(text),
+        lambda *args: food_mapping.get()(*args),
+        lambda *args: food_mapping.get().map_many(*args),
+    )
+
+
+def async_core_factory() -> AsyncRequestHandler:
+    return AsyncRequestHandler(
+        s2t_component=async_speech2text_component_factory(),
+        food_extraction_component=async_food_extraction_component_factory(),
+        food_mapping_component=async_food_mapping_component_factory(),
     )
@@ -1,7 +1,7 @@
 from enum import Enum
-from typing import List
+from typing import FrozenSet, List, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 
 class FoodSource(str, Enum):
@@ -35,3 +35,27 @@ class Food(BaseModel):
     protein: float
     fat: float
     carbohydrates: float
+    search_score: float | None = None
+    """ The relevance score given by the search engine, if the food was found using one """
+
+    _keyword_tokens: Tuple[str, ...] = PrivateAttr(default=())
+    _keyword_token_set: FrozenSet[str] = PrivateAttr(default=frozenset())
+
+    def __init__(self, **data) -> None:
+        super().__init__(**data)
+        # the full description is split once when the food is loaded, so scoring
+        # functions don't need to split it for every request
+        self._keyword_tokens = tuple(
+            token for keyword in self.full_description for token in keyword.split(" ")
+        )
+        self._keyword_token_set = frozenset(self._keyword_tokens)
+
+    @property
+    def keyword_tokens(self) -> Tuple[str, ...]:
+        """The words of the full description, in order"""
+        return self._keyword_tokens
+
+    @property
+    def keyword_token_set(self) -> FrozenSet[str]:
+        """The unique words of the full description"""
+        return self._keyword_token_set
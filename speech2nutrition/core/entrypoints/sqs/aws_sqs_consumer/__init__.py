@@ -1,8 +1,14 @@
+from core.entrypoints.sqs.aws_sqs_consumer.async_consumer import AsyncSQSConsumer
+from core.entrypoints.sqs.aws_sqs_consumer.concurrent_consumer import (
+    ConcurrentSQSConsumer,
+)
 from core.entrypoints.sqs.aws_sqs_consumer.consumer import SQSConsumer
 from core.entrypoints.sqs.aws_sqs_consumer.error import SQSException
 from core.entrypoints.sqs.aws_sqs_consumer.message import SQSMessage
 
 __all__ = [
+    "AsyncSQSConsumer",
+    "ConcurrentSQSConsumer",
     "SQSConsumer",
     "SQSMessage",
     "SQSException",
@@ -0,0 +1,175 @@
+"""
+SQS consumer that runs on an event loop and keeps several messages in flight
+"""
+
+import asyncio
+import contextlib
+import logging
+import traceback
+from typing import List, Set
+
+from core.entrypoints.sqs.aws_sqs_consumer.error import SQSException
+from core.entrypoints.sqs.aws_sqs_consumer.message import SQSMessage
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSQSConsumer:
+    """
+    Async SQS consumer implementation.
+
+    Up to `max_in_flight_messages` messages are handled at the same time, each one
+    in its own task. New messages are only received when there is room for them,
+    so a message does not wait in memory while its visibility timeout runs out.
+
+    boto3 is a blocking client, so the calls to SQS are made in worker threads.
+
+    If receiving messages fails, the consumer waits before trying again, starting
+    at `initial_error_wait_time_ms` and doubling after each consecutive failure up
+    to `max_error_wait_time_ms`.
+    """
+
+    def __init__(
+        self,
+        queue_url,
+        sqs_client,
+        max_in_flight_messages=10,
+        wait_time_seconds=20,
+        visibility_timeout_seconds=None,
+        initial_error_wait_time_ms=1000,
+        max_error_wait_time_ms=20000,
+    ):
+        self.queue_url = queue_url
+
+        if max_in_flight_messages < 1:
+            raise ValueError("Max in flight messages should be greater than 0")
+        self.max_in_flight_messages = max_in_flight_messages
+
+        self.wait_time_seconds = wait_time_seconds
+        self.visibility_timeout_seconds = visibility_timeout_seconds
+        if sqs_client is None:
+            raise ValueError("SQS client is required")
+        self.sqs_client = sqs_client
+        self.initial_error_wait_time_ms = initial_error_wait_time_ms
+        self.max_error_wait_time_ms = max_error_wait_time_ms
+        self._running = False
+        self._consecutive_errors = 0
+        self._stop_event = asyncio.Event()
+
+    async def handle_message(self, message: SQSMessage):
+        """
+        Called when a single message is received.
+        Write your own logic for handling the message
+        by overriding this method.
+
+        Note:
+            * Any unhandled exception will be available in
+              `handle_processing_exception(message, exception)` method.
+        """
+        ...
+
+    async def handle_processing_exception(
+        self, message: SQSMessage, exception: Exception
+    ):
+        """
+        Called when an exception is thrown while processing a message
+        including messsage deletion from the queue.
+
+        By default, this prints the exception traceback.
+        Override this method to write any custom logic.
+        """
+        traceback.print_exception(exception)
+
+    async def start(self):
+        """
+        Start the consumer, it returns once the consumer is stopped and the
+        messages in flight are processed, even if the consumer fails or is
+        cancelled.
+        """
+        self._running = True
+        self._stop_event.clear()
+        tasks: Set[asyncio.Task] = set()
+        try:
+            while self._running:
+                free_slots = self.max_in_flight_messages - len(tasks)
+                if free_slots == 0:
+                    await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+
+                for message in await self._receive_messages(min(free_slots, 10)):
+                    task = asyncio.create_task(self._process_message(message))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+        finally:
+            if len(tasks) > 0:
+                logger.info(f"waiting for {len(tasks)} messages in flight")
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stop(self):
+        """
+        Stop the consumer, it must be called from the event loop of the consumer.
+        """
+        self._running = False
+        self._stop_event.set()
+
+    async def _receive_messages(self, max_number_of_messages: int) -> List[SQSMessage]:
+        """
+        Receive messages from the queue, if it fails wait with an exponential
+        backoff and return no messages
+        """
+        logger.debug("polling for messages")
+        try:
+            response = await asyncio.to_thread(
+                self.sqs_client.receive_message,
+                **self._sqs_client_params(max_number_of_messages),
+            )
+        except Exception:
+            self._consecutive_errors += 1
+            wait_time_ms = self._error_wait_time_ms()
+            logger.exception(
+                f"failed to receive messages, trying again in {wait_time_ms} ms"
+            )
+            # the wait is interrupted if the consumer is stopped
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._stop_event.wait(), wait_time_ms / 1000)
+            return []
+
+        self._consecutive_errors = 0
+        return [
+            SQSMessage.parse(message_dict)
+            for message_dict in response.get("Messages", [])
+        ]
+
+    def _error_wait_time_ms(self) -> float:
+        # the exponent is bounded to avoid huge numbers after a long outage
+        exponent = min(self._consecutive_errors - 1, 30)
+        wait_time_ms = self.initial_error_wait_time_ms * 2**exponent
+        return min(wait_time_ms, self.max_error_wait_time_ms)
+
+    async def _process_message(self, message: SQSMessage):
+        try:
+            await self.handle_message(message)
+            await self._delete_message(message)
+        except Exception as exception:
+            await self.handle_processing_exception(message, exception)
+
+    async def _delete_message(self, message: SQSMessage):
+        try:
+            await asyncio.to_thread(
+                self.sqs_client.delete_message,
+                QueueUrl=self.queue_url,
+                ReceiptHandle=message.ReceiptHandle,
+            )
+        except Exception as e:
+            raise SQSException("Failed to delete message") from e
+
+    def _sqs_client_params(self, max_number_of_messages: int):
+        params = {
+            "QueueUrl": self.queue_url,
+            "MaxNumberOfMessages": max_number_of_messages,
+            "WaitTimeSeconds": self.wait_time_seconds,
+        }
+        if self.visibility_timeout_seconds is not None:
+            params["VisibilityTimeout"] = self.visibility_timeout_seconds
+
+        return params
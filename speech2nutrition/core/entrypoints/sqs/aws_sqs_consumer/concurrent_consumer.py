@@ -0,0 +1,219 @@
+"""
+SQS consumer that processes several messages at the same time in a thread pool
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from core.entrypoints.sqs.aws_sqs_consumer.consumer import SQSConsumer
+from core.entrypoints.sqs.aws_sqs_consumer.message import SQSMessage
+
+logger = logging.getLogger(__name__)
+
+
+class ConcurrentSQSConsumer(SQSConsumer):
+    """
+    SQS consumer that handles up to `max_workers` messages at the same time, each
+    one in a worker thread with `handle_message(message)`.
+
+    New messages are only received when there are free workers, up to 10 per
+    receive. While a message is in flight, its visibility timeout is extended
+    every `visibility_extension_interval_seconds`, so slow messages are not
+    delivered again to another consumer. Messages are deleted one by one as soon
+    as they are processed.
+
+    `stop()` stops receiving messages, `start()` returns once the messages in
+    flight are processed.
+
+    If receiving messages fails, the consumer waits before trying again, starting
+    at `initial_error_wait_time_ms` and doubling after each consecutive failure up
+    to `max_error_wait_time_ms`.
+    """
+
+    def __init__(
+        self,
+        queue_url,
+        sqs_client,
+        max_workers=4,
+        attribute_names=None,
+        message_attribute_names=None,
+        wait_time_seconds=20,
+        visibility_timeout_seconds=60,
+        visibility_extension_interval_seconds=None,
+        polling_wait_time_ms=0,
+        initial_polling_wait_time_ms=1000,
+        initial_error_wait_time_ms=1000,
+        max_error_wait_time_ms=20000,
+    ):
+        super().__init__(
+            queue_url=queue_url,
+            sqs_client=sqs_client,
+            attribute_names=attribute_names,
+            message_attribute_names=message_attribute_names,
+            batch_size=1,
+            wait_time_seconds=wait_time_seconds,
+            visibility_timeout_seconds=visibility_timeout_seconds,
+            polling_wait_time_ms=polling_wait_time_ms,
+            initial_polling_wait_time_ms=initial_polling_wait_time_ms,
+        )
+
+        if max_workers < 1:
+            raise ValueError("Max workers should be greater than 0")
+        self.max_workers = max_workers
+
+        if visibility_timeout_seconds is None or visibility_timeout_seconds < 1:
+            raise ValueError("Visibility timeout should be greater than 0")
+        # extend the visibility timeout well before it expires
+        self.visibility_extension_interval_seconds = (
+            visibility_extension_interval_seconds
+            if visibility_extension_interval_seconds is not None
+            else visibility_timeout_seconds / 2
+        )
+
+        # keyed by receipt handle, a message delivered again while it is in flight
+        # has the same id but a different receipt handle
+        self._in_flight: Dict[str, SQSMessage] = {}
+        self._in_flight_condition = threading.Condition()
+        self._stop_extension_event = threading.Event()
+        self.initial_error_wait_time_ms = initial_error_wait_time_ms
+        self.max_error_wait_time_ms = max_error_wait_time_ms
+        self._consecutive_errors = 0
+
+    def start(self):
+        """
+        Start the consumer.
+        """
+        self._running = True
+        self._stop_event.clear()
+        self._stop_extension_event.clear()
+        extension_thread = threading.Thread(
+            target=self._visibility_extension_loop,
+            name="sqs-visibility-extension",
+            daemon=True,
+        )
+        extension_thread.start()
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="sqs-consumer"
+            ) as executor:
+                while self._running:
+                    free_workers = self._wait_for_free_workers()
+                    if free_workers == 0:
+                        continue
+
+                    messages = self._receive_messages_with_backoff(
+                        min(free_workers, 10)
+                    )
+                    for message in messages:
+                        with self._in_flight_condition:
+                            self._in_flight[message.ReceiptHandle] = message
+                        executor.submit(self._process_message_in_worker, message)
+
+                logger.info(f"waiting for {len(self._in_flight)} messages in flight")
+        finally:
+            # the visibility of the messages is not extended once the consumer is
+            # gone, even if it fails
+            self._stop_extension_event.set()
+            extension_thread.join()
+
+    def stop(self):
+        """
+        Stop the consumer, the messages in flight are still processed.
+        """
+        with self._in_flight_condition:
+            super().stop()
+            self._in_flight_condition.notify_all()
+
+    def _receive_messages_with_backoff(
+        self, max_number_of_messages: int
+    ) -> List[SQSMessage]:
+        """
+        Receive messages from the queue, if it fails wait with an exponential
+        backoff and return no messages
+        """
+        try:
+            messages = self._receive_messages(
+                self._concurrent_sqs_client_params(max_number_of_messages)
+            )
+        except Exception:
+            self._consecutive_errors += 1
+            wait_time_ms = self._error_wait_time_ms()
+            logger.exception(
+                f"failed to receive messages, trying again in {wait_time_ms} ms"
+            )
+            # the wait is interrupted if the consumer is stopped
+            self._stop_event.wait(wait_time_ms / 1000)
+            return []
+
+        self._consecutive_errors = 0
+        return messages
+
+    def _error_wait_time_ms(self) -> float:
+        # the exponent is bounded to avoid huge numbers after a long outage
+        exponent = min(self._consecutive_errors - 1, 30)
+        wait_time_ms = self.initial_error_wait_time_ms * 2**exponent
+        return min(wait_time_ms, self.max_error_wait_time_ms)
+
+    def _wait_for_free_workers(self) -> int:
+        with self._in_flight_condition:
+            while self._running and len(self._in_flight) >= self.max_workers:
+                self._in_flight_condition.wait()
+
+            if not self._running:
+                return 0
+            return self.max_workers - len(self._in_flight)
+
+    def _process_message_in_worker(self, message: SQSMessage):
+        start = time.monotonic()
+        try:
+            self._process_message(message)
+        finally:
+            # busy time is the sum of the time spent by each worker
+            self._record_busy_time(time.monotonic() - start)
+            with self._in_flight_condition:
+                self._in_flight.pop(message.ReceiptHandle, None)
+                self._in_flight_condition.notify_all()
+
+    def _visibility_extension_loop(self):
+        while not self._stop_extension_event.wait(
+            self.visibility_extension_interval_seconds
+        ):
+            try:
+                self._extend_visibility()
+            except Exception:
+                logger.exception("failed to extend visibility of messages in flight")
+
+    def _extend_visibility(self):
+        with self._in_flight_condition:
+            messages = list(self._in_flight.values())
+
+        # change_message_visibility_batch accepts up to 10 entries
+        for start in range(0, len(messages), 10):
+            batch: List[SQSMessage] = messages[start : start + 10]
+            logger.debug(f"extending visibility of {len(batch)} messages")
+            response = self.sqs_client.change_message_visibility_batch(
+                QueueUrl=self.queue_url,
+                Entries=[
+                    {
+                        "Id": str(i),
+                        "ReceiptHandle": message.ReceiptHandle,
+                        "VisibilityTimeout": self.visibility_timeout_seconds,
+                    }
+                    for i, message in enumerate(batch)
+                ],
+            )
+            for failed in response.get("Failed", []):
+                message = batch[int(failed["Id"])]
+                logger.warning(
+                    f"failed to extend visibility of message {message.MessageId}: "
+                    f"{failed.get('Message', failed.get('Code'))}"
+                )
+
+    def _concurrent_sqs_client_params(self, max_number_of_messages: int):
+        params = self._sqs_client_params
+        params["MaxNumberOfMessages"] = max_number_of_messages
+        return params
@@ -5,8 +5,10 @@ copy from https://github.com/HexmosTech/aws_sqs_consumer_python/tree/main/aws_sq
 """
 
 import logging
+import threading
 import time
 import traceback
+from dataclasses import dataclass, replace
 from typing import List
 
 from core.entrypoints.sqs.aws_sqs_consumer.error import SQSException
@@ -15,6 +17,20 @@ from core.entrypoints.sqs.aws_sqs_consumer.message import SQSMessage
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class PollingMetrics:
+    receives: int = 0
+    """ Number of receive requests made to SQS """
+    empty_receives: int = 0
+    """ Number of receive requests that did not return messages """
+    messages: int = 0
+    """ Number of messages received """
+    idle_seconds: float = 0
+    """ Time spent waiting for messages, empty receives and backoff waits """
+    busy_seconds: float = 0
+    """ Time spent processing messages """
+
+
 class SQSConsumer:
     """
     SQS consumer implementation.
@@ -27,9 +43,10 @@ class SQSConsumer:
         attribute_names=None,
         message_attribute_names=None,
         batch_size=1,
-        wait_time_seconds=1,
+        wait_time_seconds=20,
         visibility_timeout_seconds=None,
         polling_wait_time_ms=0,
+        initial_polling_wait_time_ms=1000,
     ):
         self.queue_url = queue_url
         self.attribute_names = attribute_names if attribute_names is not None else []
@@ -41,13 +58,28 @@ class SQSConsumer:
             raise ValueError("Batch size should be between 1 and 10, both inclusive")
         self.batch_size = batch_size
 
+        # long polling, sqs waits up to 20 seconds for messages before returning an
+        # empty response
+        if not 0 <= wait_time_seconds <= 20:
+            raise ValueError(
+                "Wait time seconds should be between 0 and 20, both inclusive"
+            )
         self.wait_time_seconds = wait_time_seconds
         self.visibility_timeout_seconds = visibility_timeout_seconds
+        # there is no wait while the queue has messages, nor with long polling, as
+        # an empty receive already waited wait_time_seconds for messages. With short
+        # polling, after consecutive empty receives, the wait starts at
+        # initial_polling_wait_time_ms and doubles up to polling_wait_time_ms
         self.polling_wait_time_ms = polling_wait_time_ms
+        self.initial_polling_wait_time_ms = initial_polling_wait_time_ms
         if sqs_client is None:
             raise ValueError("SQS client is required")
         self.sqs_client = sqs_client
         self._running = False
+        self._consecutive_empty_receives = 0
+        self._stop_event = threading.Event()
+        self._metrics = PollingMetrics()
+        self._metrics_lock = threading.Lock()
 
     def handle_message(self, message: SQSMessage):
         """
@@ -103,32 +135,70 @@ class SQSConsumer:
         """
         Start the consumer.
         """
-        # TODO: Figure out threading/daemon
         self._running = True
+        self._stop_event.clear()
         while self._running:
-            logger.debug("polling for messages")
-            response = self.sqs_client.receive_message(**self._sqs_client_params)
-
-            if not response.get("Messages", []):
-                logger.debug("no messages received")
-                self._polling_wait()
+            messages = self._receive_messages(self._sqs_client_params)
+            if len(messages) == 0:
                 continue
 
-            messages = [
-                SQSMessage.parse(message_dict) for message_dict in response["Messages"]
-            ]
-
+            start = time.monotonic()
             if self.batch_size == 1:
                 self._process_message(messages[0])
             else:
                 self._process_message_batch(messages)
+            self._record_busy_time(time.monotonic() - start)
 
     def stop(self):
         """
-        Stop the consumer.
+        Stop the consumer, it can be called from another thread or a signal handler.
         """
-        # TODO: There's no way to invoke this other than a separate thread.
         self._running = False
+        self._stop_event.set()
+
+    def metrics(self) -> PollingMetrics:
+        """
+        Get a copy of the polling metrics since the consumer was created
+        """
+        with self._metrics_lock:
+            return replace(self._metrics)
+
+    def _receive_messages(self, params) -> List[SQSMessage]:
+        """
+        Receive messages from the queue, if the queue is empty wait with an
+        exponential backoff before returning
+        """
+        logger.debug("polling for messages")
+        start = time.monotonic()
+        response = self.sqs_client.receive_message(**params)
+        messages = [
+            SQSMessage.parse(message_dict)
+            for message_dict in response.get("Messages", [])
+        ]
+
+        with self._metrics_lock:
+            self._metrics.receives += 1
+            self._metrics.messages += len(messages)
+            if len(messages) == 0:
+                self._metrics.empty_receives += 1
+
+        if len(messages) > 0:
+            self._consecutive_empty_receives = 0
+            return messages
+
+        logger.debug("no messages received")
+        self._consecutive_empty_receives += 1
+        self._polling_wait()
+        self._record_idle_time(time.monotonic() - start)
+        return messages
+
+    def _record_idle_time(self, seconds: float):
+        with self._metrics_lock:
+            self._metrics.idle_seconds += seconds
+
+    def _record_busy_time(self, seconds: float):
+        with self._metrics_lock:
+            self._metrics.busy_seconds += seconds
 
     def _process_message(self, message: SQSMessage):
         try:
@@ -136,8 +206,6 @@ class SQSConsumer:
             self._delete_message(message)
         except Exception as exception:
             self.handle_processing_exception(message, exception)
-        finally:
-            self._polling_wait()
 
     def _process_message_batch(self, messages: List[SQSMessage]):
         try:
@@ -145,8 +213,6 @@ class SQSConsumer:
             self._delete_message_batch(messages)
         except Exception as exception:
             self.handle_batch_processing_exception(messages, exception)
-        finally:
-            self._polling_wait()
 
     def _delete_message(self, message: SQSMessage):
         try:
@@ -182,5 +248,19 @@ class SQSConsumer:
 
         return params
 
+    def _polling_wait_time_ms(self) -> float:
+        # sleeping after a long poll only delays the next message
+        if self._consecutive_empty_receives == 0 or self.wait_time_seconds > 0:
+            return 0
+
+        # the exponent is bounded to avoid huge numbers after a long idle period
+        exponent = min(self._consecutive_empty_receives - 1, 30)
+        wait_time_ms = self.initial_polling_wait_time_ms * 2**exponent
+        return min(wait_time_ms, self.polling_wait_time_ms)
+
     def _polling_wait(self):
-        time.sleep(self.polling_wait_time_ms / 1000)
+        wait_time_ms = self._polling_wait_time_ms()
+        if wait_time_ms > 0:
+            logger.debug(f"waiting {wait_time_ms} ms before polling again")
+            # the wait is interrupted if the consumer is stopped
+            self._stop_event.wait(wait_time_ms / 1000)
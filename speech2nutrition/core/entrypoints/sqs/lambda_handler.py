@@ -0,0 +1,99 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Set
+
+from core.domain.entities.nutrition_information_request import (
+    NutritionInformationRequest,
+)
+from core.entrypoints.sqs.response_publisher import (
+    ResultCallback,
+    SQSResponsePublisher,
+)
+from core.request_handler import RequestHandler
+
+logger = logging.getLogger(__name__)
+
+
+def process_sqs_record(
+    record: Dict[str, Any],
+    request_handler: RequestHandler,
+    response_publisher: SQSResponsePublisher,
+    on_result: ResultCallback | None = None,
+) -> None:
+    request = NutritionInformationRequest.parse_raw(record["body"])
+    logger.info(f"processing request: {request}")
+    response = request_handler(request)
+    logger.info(f"successfully processed request: {request}")
+    response_as_json = response.json(ensure_ascii=False)
+    logger.info("publishing response to nutrition response queue")
+    response_publisher.publish(response_as_json, on_result)
+
+
+def process_sqs_records(
+    records: List[Dict[str, Any]],
+    request_handler: RequestHandler,
+    response_publisher: SQSResponsePublisher,
+    max_workers: int = 1,
+) -> Dict[str, Any]:
+    """
+    Process all the records of an SQS event and send the responses in batches.
+
+    A record succeeds once its response is sent, so the records whose responses
+    could not be sent after the retries are reported as failures too.
+
+    If `max_workers` is greater than 1, the records are processed at the same time
+    in a thread pool.
+
+    Returns
+    -------
+    Dict[str, Any]
+        A partial batch response, only the messages in `batchItemFailures` are
+        retried by SQS. The event source mapping must have ReportBatchItemFailures
+        enabled
+    """
+
+    unsent: Set[str] = set()
+    unsent_lock = threading.Lock()
+
+    def on_result(message_id: str, sent: bool) -> None:
+        if not sent:
+            with unsent_lock:
+                unsent.add(message_id)
+
+    def process(record: Dict[str, Any]) -> bool:
+        try:
+            process_sqs_record(
+                record,
+                request_handler,
+                response_publisher,
+                partial(on_result, record["messageId"]),
+            )
+        except Exception:
+            logger.exception(f"failed to process message {record['messageId']}")
+            return False
+        return True
+
+    try:
+        if max_workers > 1 and len(records) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(records)),
+                thread_name_prefix="sqs-record",
+            ) as executor:
+                results = list(executor.map(process, records))
+        else:
+            results = [process(record) for record in records]
+    finally:
+        logger.info("sending responses to nutrition response queue")
+        response_publisher.flush()
+
+    failures = [
+        {"itemIdentifier": record["messageId"]}
+        for record, succeeded in zip(records, results, strict=True)
+        if not succeeded or record["messageId"] in unsent
+    ]
+    logger.info(
+        f"processed {len(records)} records, {len(failures)} failed and will be retried"
+    )
+    return {"batchItemFailures": failures}
@@ -0,0 +1,247 @@
+import logging
+import threading
+import time
+from typing import Callable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+ResultCallback = Callable[[bool], None]
+# a response and its callback
+Entry = Tuple[str, ResultCallback | None]
+
+# limits of send_message_batch
+MAX_BATCH_SIZE = 10
+MAX_BATCH_BYTES = 256 * 1024
+
+
+class SQSResponsePublisher:
+    """
+    Buffer the responses and send them to the queue with send_message_batch.
+
+    A batch is sent when it reaches `max_batch_size` entries or `max_batch_bytes`,
+    when its oldest entry has waited `max_linger_seconds`, and when the publisher
+    is flushed or closed. If `max_linger_seconds` is 0 there is no timer and the
+    batches must be flushed manually, e.g. at the end of a lambda invocation.
+
+    Entries that fail are sent again together in a smaller batch, with an
+    exponential backoff between attempts, except the ones rejected because of the
+    entry itself (sender fault). The callback of a response, if any, is called
+    with True once it is sent or with False if it could not be sent, so the
+    request is only acknowledged after its response reaches the queue.
+    """
+
+    def __init__(
+        self,
+        sqs_client,
+        queue_url: str,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        max_batch_bytes: int = MAX_BATCH_BYTES,
+        max_linger_seconds: float = 0.2,
+        max_retries: int = 3,
+        retry_wait_seconds: float = 0.1,
+    ):
+        if not 1 <= max_batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(
+                f"max_batch_size should be between 1 and {MAX_BATCH_SIZE}, both inclusive"
+            )
+        if not 1 <= max_batch_bytes <= MAX_BATCH_BYTES:
+            raise ValueError(
+                f"max_batch_bytes should be between 1 and {MAX_BATCH_BYTES}, both inclusive"
+            )
+
+        self.sqs_client = sqs_client
+        self.queue_url = queue_url
+        self.max_batch_size = max_batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self.max_linger_seconds = max_linger_seconds
+        self.max_retries = max_retries
+        self.retry_wait_seconds = retry_wait_seconds
+
+        self._entries: List[Entry] = []
+        self._batch_bytes = 0
+        self._first_body_time = 0.0
+        self._closed = False
+        self._condition = threading.Condition()
+
+        self._linger_thread: threading.Thread | None = None
+        if max_linger_seconds > 0:
+            self._linger_thread = threading.Thread(
+                target=self._linger_loop, name="sqs-response-publisher", daemon=True
+            )
+            self._linger_thread.start()
+
+    def publish(self, body: str, on_result: ResultCallback | None = None) -> None:
+        """
+        Add a response to the current batch, the batch is sent if it is full
+
+        Parameters
+        ----------
+        body : str
+            The response
+        on_result : ResultCallback | None
+            Called with True once the response is sent, or with False if it could
+            not be sent
+        """
+        body_bytes = len(body.encode("utf-8"))
+        if body_bytes > self.max_batch_bytes:
+            raise ValueError(
+                f"response of {body_bytes} bytes is larger than {self.max_batch_bytes} bytes"
+            )
+
+        batches: List[List[Entry]] = []
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("publisher is closed")
+
+            if self._batch_bytes + body_bytes > self.max_batch_bytes:
+                batches.append(self._take_batch())
+
+            if len(self._entries) == 0:
+                self._first_body_time = time.monotonic()
+                # wake up the linger thread to start the timer of the new batch
+                self._condition.notify_all()
+            self._entries.append((body, on_result))
+            self._batch_bytes += body_bytes
+
+            if len(self._entries) >= self.max_batch_size:
+                batches.append(self._take_batch())
+
+        for batch in batches:
+            self._send_batch(batch)
+
+    def flush(self) -> List[str]:
+        """
+        Send the current batch
+
+        Returns
+        -------
+        List[str]
+            The responses of the batch that could not be sent
+        """
+        with self._condition:
+            batch = self._take_batch()
+        return self._send_batch(batch)
+
+    def close(self) -> List[str]:
+        """
+        Send the current batch and stop the linger timer
+
+        Returns
+        -------
+        List[str]
+            The responses of the batch that could not be sent
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._linger_thread is not None:
+            self._linger_thread.join()
+        return self.flush()
+
+    def _take_batch(self) -> List[Entry]:
+        batch = self._entries
+        self._entries = []
+        self._batch_bytes = 0
+        return batch
+
+    def _linger_loop(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if len(self._entries) == 0:
+                        self._condition.wait()
+                        continue
+
+                    remaining = (
+                        self._first_body_time + self.max_linger_seconds
+                    ) - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                if self._closed:
+                    return
+                batch = self._take_batch()
+
+            logger.debug(f"sending batch of {len(batch)} responses after max linger")
+            self._send_batch(batch)
+
+    def _send_batch(self, entries: List[Entry]) -> List[str]:
+        """
+        Send the entries, retrying the ones that fail, and call their callbacks
+
+        Returns
+        -------
+        List[str]
+            The responses that could not be sent
+        """
+        pending = entries
+        rejected: List[Entry] = []
+        for attempt in range(self.max_retries + 1):
+            if len(pending) == 0:
+                break
+
+            if attempt > 0:
+                time.sleep(self.retry_wait_seconds * 2 ** (attempt - 1))
+                logger.info(f"retrying {len(pending)} responses, attempt {attempt}")
+
+            try:
+                pending, attempt_rejected = self._send_entries(pending)
+            except Exception:
+                logger.exception(f"failed to send batch of {len(pending)} responses")
+                continue
+            rejected.extend(attempt_rejected)
+
+        if len(pending) > 0:
+            logger.error(
+                f"failed to send {len(pending)} responses after {self.max_retries} retries"
+            )
+
+        failed = rejected + pending
+        for _, on_result in failed:
+            self._notify(on_result, False)
+        return [body for body, _ in failed]
+
+    def _send_entries(self, entries: List[Entry]) -> Tuple[List[Entry], List[Entry]]:
+        """
+        Send the entries once and notify the ones that were sent
+
+        Returns
+        -------
+        Tuple[List[Entry], List[Entry]]
+            The entries that can be retried and the ones rejected because of a
+            sender fault
+        """
+        response = self.sqs_client.send_message_batch(
+            QueueUrl=self.queue_url,
+            Entries=[
+                {"Id": str(i), "MessageBody": body}
+                for i, (body, _) in enumerate(entries)
+            ],
+        )
+
+        failures = {
+            int(failure["Id"]): failure for failure in response.get("Failed", [])
+        }
+        retryable: List[Entry] = []
+        rejected: List[Entry] = []
+        for i, entry in enumerate(entries):
+            failure = failures.get(i)
+            if failure is None:
+                self._notify(entry[1], True)
+            elif failure.get("SenderFault", False):
+                logger.error(
+                    f"response rejected by sqs, it will not be retried: {failure.get('Code')}"
+                )
+                rejected.append(entry)
+            else:
+                retryable.append(entry)
+        return retryable, rejected
+
+    def _notify(self, on_result: ResultCallback | None, sent: bool) -> None:
+        if on_result is None:
+            return
+        try:
+            on_result(sent)
+        except Exception:
+            logger.exception("failed to notify the result of a response")
@@ -0,0 +1,116 @@
+import asyncio
+import logging
+import signal
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import boto3
+
+from config.settings_v2 import APP_CONFIG
+from core.async_request_handler import AsyncRequestHandler
+from core.domain.entities.nutrition_information_request import (
+    NutritionInformationRequest,
+)
+from core.entrypoints.sqs.aws_sqs_consumer import AsyncSQSConsumer, SQSMessage
+from core.entrypoints.sqs.response_publisher import SQSResponsePublisher
+
+logger = logging.getLogger(__name__)
+
+
+class SimpleAsyncConsumer(AsyncSQSConsumer):
+    def set_request_handler(self, request_handler: AsyncRequestHandler):
+        self.request_handler = request_handler
+
+    def set_response_publisher(self, response_publisher: SQSResponsePublisher):
+        self.response_publisher = response_publisher
+
+    async def handle_message(self, message: SQSMessage):
+        body = message.Body
+        logger.debug(f"received message: {body}")
+
+        request = NutritionInformationRequest.parse_raw(body)
+        logger.info(f"processing request: {request}")
+        response = await self.request_handler(request)
+        logger.info(f"successfully processed request: {request}")
+        response_as_json = response.json(ensure_ascii=False)
+        logger.info("publishing response to nutrition response queue")
+        # publishing can send a full batch to sqs, which blocks
+        await asyncio.to_thread(
+            self.response_publisher.publish,
+            response_as_json,
+            partial(self._acknowledge_message, message),
+        )
+
+    async def _process_message(self, message: SQSMessage):
+        # the message is deleted once its response is sent, see _acknowledge_message
+        try:
+            await self.handle_message(message)
+        except Exception as exception:
+            await self.handle_processing_exception(message, exception)
+
+    def _acknowledge_message(self, message: SQSMessage, response_sent: bool):
+        # called from the thread that sends the response, not from the event loop
+        if not response_sent:
+            logger.error(
+                f"response of message {message.MessageId} was not sent, it will be retried"
+            )
+            return
+        try:
+            self.sqs_client.delete_message(
+                QueueUrl=self.queue_url, ReceiptHandle=message.ReceiptHandle
+            )
+        except Exception:
+            logger.exception(f"failed to delete message {message.MessageId} from queue")
+
+    async def handle_processing_exception(
+        self, message: SQSMessage, exception: Exception
+    ):
+        # delete message from queue even if processing fails
+        # so far we don't have any dead letter queue, and we want to avoid infinite retries
+        logger.exception(
+            f"failed to process message {message.MessageId} from queue",
+            exc_info=exception,
+        )
+        try:
+            await self._delete_message(message)
+        except Exception:
+            logger.exception(f"failed to delete message {message.MessageId} from queue")
+
+
+async def run_async_consumer(consumer: AsyncSQSConsumer):
+    loop = asyncio.get_running_loop()
+    # every message in flight needs at most one thread at a time, for the blocking
+    # clients, plus one thread to receive new messages
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=consumer.max_in_flight_messages + 1)
+    )
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signal_number, consumer.stop)
+
+    logger.info("starting async sqs consumer")
+    await consumer.start()
+    logger.info("async sqs consumer stopped")
+
+
+def start_async_sqs_app(request_handler: AsyncRequestHandler):
+    sqs_client = boto3.client(
+        "sqs",
+        region_name=APP_CONFIG.aws_region,
+    )
+    consumer = SimpleAsyncConsumer(
+        sqs_client=sqs_client,
+        queue_url=APP_CONFIG.aws_nutrition_request_queue,
+        max_in_flight_messages=APP_CONFIG.async_max_in_flight_requests,
+    )
+    consumer.set_request_handler(request_handler)
+    response_publisher = SQSResponsePublisher(
+        sqs_client=sqs_client,
+        queue_url=APP_CONFIG.aws_nutrition_response_queue,
+        max_linger_seconds=APP_CONFIG.response_publisher_max_linger_time / 1000,
+    )
+    consumer.set_response_publisher(response_publisher)
+    try:
+        asyncio.run(run_async_consumer(consumer))
+    finally:
+        logger.info("sending the pending responses")
+        response_publisher.close()
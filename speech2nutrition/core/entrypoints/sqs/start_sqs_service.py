@@ -1,4 +1,6 @@
 import logging
+import signal
+from functools import partial
 
 import boto3
 
@@ -7,7 +9,12 @@ from core.core_factory import RequestHandler
 from core.domain.entities.nutrition_information_request import (
     NutritionInformationRequest,
 )
-from core.entrypoints.sqs.aws_sqs_consumer import SQSConsumer, SQSMessage
+from core.entrypoints.sqs.aws_sqs_consumer import (
+    ConcurrentSQSConsumer,
+    SQSConsumer,
+    SQSMessage,
+)
+from core.entrypoints.sqs.response_publisher import SQSResponsePublisher
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +23,9 @@ class SimpleConsumer(SQSConsumer):
     def set_request_handler(self, request_handler: RequestHandler):
         self.request_handler = request_handler
 
+    def set_response_publisher(self, response_publisher: SQSResponsePublisher):
+        self.response_publisher = response_publisher
+
     def handle_message(self, message: SQSMessage):
         body = message.Body
         logger.debug(f"received message: {body}")
@@ -25,12 +35,29 @@ class SimpleConsumer(SQSConsumer):
         response = self.request_handler(request)
         logger.info(f"successfully processed request: {request}")
         response_as_json = response.json(ensure_ascii=False)
-        logger.info("sending response to nutrition response queue")
-        self.sqs_client.send_message(
-            QueueUrl=APP_CONFIG.aws_nutrition_response_queue,
-            MessageBody=response_as_json,
+        logger.info("publishing response to nutrition response queue")
+        self.response_publisher.publish(
+            response_as_json, partial(self._acknowledge_message, message)
         )
-        logger.info("response sent to nutrition response queue")
+
+    def _process_message(self, message: SQSMessage):
+        # the message is deleted once its response is sent, see _acknowledge_message
+        try:
+            self.handle_message(message)
+        except Exception as exception:
+            self.handle_processing_exception(message, exception)
+
+    def _acknowledge_message(self, message: SQSMessage, response_sent: bool):
+        if not response_sent:
+            # the message is received again once its visibility timeout expires
+            logger.error(
+                f"response of message {message.MessageId} was not sent, it will be retried"
+            )
+            return
+        try:
+            self._delete_message(message)
+        except Exception:
+            logger.exception(f"failed to delete message {message.MessageId} from queue")
 
     def handle_processing_exception(self, message: SQSMessage, exception: Exception):
         # delete message from queue even if processing fails
@@ -42,17 +69,53 @@ class SimpleConsumer(SQSConsumer):
             logger.exception(f"failed to delete message {message.MessageId} from queue")
 
 
+class SimpleConcurrentConsumer(SimpleConsumer, ConcurrentSQSConsumer):
+    """
+    SimpleConsumer that processes several messages at the same time
+    """
+
+
 def start_sqs_app(request_handler: RequestHandler):
     sqs_client = boto3.client(
         "sqs",
         region_name=APP_CONFIG.aws_region,
     )
-    consumer = SimpleConsumer(
+    if APP_CONFIG.sqs_consumer_workers > 1:
+        logger.info(
+            f"creating concurrent sqs consumer with {APP_CONFIG.sqs_consumer_workers} workers"
+        )
+        consumer = SimpleConcurrentConsumer(
+            sqs_client=sqs_client,
+            queue_url=APP_CONFIG.aws_nutrition_request_queue,
+            max_workers=APP_CONFIG.sqs_consumer_workers,
+            visibility_timeout_seconds=APP_CONFIG.sqs_consumer_visibility_timeout,
+            wait_time_seconds=APP_CONFIG.sqs_consumer_wait_time_seconds,
+            polling_wait_time_ms=APP_CONFIG.aws_nutrition_request_queue_polling_time,
+        )
+    else:
+        consumer = SimpleConsumer(
+            sqs_client=sqs_client,
+            queue_url=APP_CONFIG.aws_nutrition_request_queue,
+            wait_time_seconds=APP_CONFIG.sqs_consumer_wait_time_seconds,
+            polling_wait_time_ms=APP_CONFIG.aws_nutrition_request_queue_polling_time,
+            batch_size=1,
+        )
+    consumer.set_request_handler(request_handler)
+    response_publisher = SQSResponsePublisher(
         sqs_client=sqs_client,
-        queue_url=APP_CONFIG.aws_nutrition_request_queue,
-        polling_wait_time_ms=APP_CONFIG.aws_nutrition_request_queue_polling_time,
-        batch_size=1,
+        queue_url=APP_CONFIG.aws_nutrition_response_queue,
+        max_linger_seconds=APP_CONFIG.response_publisher_max_linger_time / 1000,
     )
-    consumer.set_request_handler(request_handler)
+    consumer.set_response_publisher(response_publisher)
+
+    # on SIGTERM, e.g. when the container is stopped, the messages in flight are
+    # processed before exiting
+    signal.signal(signal.SIGTERM, lambda *_: consumer.stop())
+
     logger.info("starting sqs consumer")
-    consumer.start()
+    try:
+        consumer.start()
+    finally:
+        logger.info("sending the pending responses")
+        response_publisher.close()
+    logger.info(f"sqs consumer stopped, polling metrics: {consumer.metrics()}")
@@ -1,8 +1,17 @@
-from core.components.food_extraction.definitions import ExtractFoodComponent
+from concurrent.futures import Executor
+from typing import List, Tuple
+
+from core.components.food_extraction.definitions import (
+    ExtractFoodComponent,
+    StreamExtractFoodComponent,
+)
 from core.components.food_mapping.definitions.food_map_v2 import (
     MapFoodToNutritionDBComponentV2,
+    MapManyFoodsToNutritionDBComponent,
 )
 from core.components.speech2text.definitions import Speech2TextComponent
+from core.domain.entities.food_nutrition_request import FoodNutritionRequest
+from core.domain.entities.food_nutrition_response import FoodNutritionResponse
 from core.domain.entities.nutrition_information_request import (
     NutritionInformationRequest,
 )
@@ -17,27 +26,66 @@ class RequestHandler:
         s2t_component: Speech2TextComponent,
         food_extraction_component: ExtractFoodComponent,
         food_mapping_component: MapFoodToNutritionDBComponentV2,
+        food_mapping_many_component: MapManyFoodsToNutritionDBComponent | None = None,
+        food_mapping_executor: Executor | None = None,
+        food_extraction_stream_component: StreamExtractFoodComponent | None = None,
     ) -> None:
         self.s2t_component = s2t_component
         self.food_extraction_component = food_extraction_component
         self.food_mapping_component = food_mapping_component
+        # if available, all the foods are mapped at once instead of one by one
+        self.food_mapping_many_component = food_mapping_many_component
+        # if available, the foods are mapped one by one but concurrently, so the
+        # latency of a meal is the latency of its slowest food
+        self.food_mapping_executor = food_mapping_executor
+        # if available, each food is mapped as soon as it is extracted instead of
+        # waiting for the whole extraction, it is not used with the batch mapping
+        self.food_extraction_stream_component = food_extraction_stream_component
 
     def __call__(
         self, request: NutritionInformationRequest
     ) -> NutritionInformationResponse:
         audio_id = request.audio_id
         transcription = self.s2t_component(audio_id)
-        food_requests = self.food_extraction_component(transcription)
+        db_lookup_preference = request.db_lookup_preference
 
-        food_responses = []
+        if (
+            self.food_extraction_stream_component is not None
+            and self.food_mapping_many_component is None
+        ):
+            food_requests, food_responses = self._extract_and_map_foods(
+                self.food_extraction_stream_component, transcription, request
+            )
+            return NutritionInformationResponse(
+                raw_transcript=transcription,
+                food_responses=food_responses,
+                food_requests=food_requests,
+                ni_request=request,
+            )
 
-        db_lookup_preference = request.db_lookup_preference
+        food_requests = self.food_extraction_component(transcription)
 
-        for food_request in food_requests:
-            food_response = self.food_mapping_component(
-                food_request, db_lookup_preference, request.user_id
+        if self.food_mapping_many_component is not None:
+            food_responses = self.food_mapping_many_component(
+                food_requests, db_lookup_preference, request.user_id
             )
-            food_responses.append(food_response)
+        elif self.food_mapping_executor is not None:
+            # map keeps the order of the requests
+            food_responses = list(
+                self.food_mapping_executor.map(
+                    lambda food_request: self.food_mapping_component(
+                        food_request, db_lookup_preference, request.user_id
+                    ),
+                    food_requests,
+                )
+            )
+        else:
+            food_responses = []
+            for food_request in food_requests:
+                food_response = self.food_mapping_component(
+                    food_request, db_lookup_preference, request.user_id
+                )
+                food_responses.append(food_response)
 
         nutrition_information_response = NutritionInformationResponse(
             raw_transcript=transcription,
@@ -47,3 +95,34 @@ class RequestHandler:
         )
 
         return nutrition_information_response
+
+    def _extract_and_map_foods(
+        self,
+        food_extraction_stream_component: StreamExtractFoodComponent,
+        transcription: str,
+        request: NutritionInformationRequest,
+    ) -> Tuple[List[FoodNutritionRequest], List[FoodNutritionResponse]]:
+        """
+        Map each food while the next ones are being extracted
+        """
+
+        def map_food(food_request: FoodNutritionRequest) -> FoodNutritionResponse:
+            return self.food_mapping_component(
+                food_request, request.db_lookup_preference, request.user_id
+            )
+
+        food_requests = []
+        food_responses = []
+        if self.food_mapping_executor is None:
+            for food_request in food_extraction_stream_component(transcription):
+                food_requests.append(food_request)
+                food_responses.append(map_food(food_request))
+            return food_requests, food_responses
+
+        futures = []
+        for food_request in food_extraction_stream_component(transcription):
+            food_requests.append(food_request)
+            futures.append(self.food_mapping_executor.submit(map_food, food_request))
+
+        food_responses = [future.result() for future in futures]
+        return food_requests, food_responses
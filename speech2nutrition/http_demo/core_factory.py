@@ -1,8 +1,11 @@
 import logging
+from typing import Any, Dict
 
 from config.settings_v2 import APP_CONFIG
+from core.component_container import ComponentContainer, LazyComponent
 from core.components.food_extraction.factory import food_extraction_component_factory
 from core.components.food_mapping.factory import food_mapping_component_factory
+from core.components.speech2text.definitions import Speech2TextModel
 from core.components.speech2text.infrastructure.mocks.mock_s2t_model import (
     MockSpeech2TextToModel,
 )
@@ -14,16 +17,25 @@ from http_demo.demo_request_handler import HTTPDemoRequestHandler
 logger = logging.getLogger(__name__)
 
 
-def core_factory() -> HTTPDemoRequestHandler:
+def speech2text_model_factory() -> Speech2TextModel:
     if APP_CONFIG.mock_services:
         logger.info("creating mock speech2text model")
-        speech2text_model = MockSpeech2TextToModel()
-    else:
-        logger.info("creating openai whisper speech2text model")
-        speech2text_model = OpenAIWhisperSpeech2TextModel(
-            api_key=APP_CONFIG.open_ai_key
-        )
+        return MockSpeech2TextToModel()
+
+    logger.info("creating openai whisper speech2text model")
+    return OpenAIWhisperSpeech2TextModel(api_key=APP_CONFIG.open_ai_key)
+
+
+class LazySpeech2TextModel:
+    def __init__(self, component: LazyComponent[Speech2TextModel]):
+        self.component = component
 
+    def transcribe(self, audio: bytes, metadata: Dict[str, Any]) -> str:
+        return self.component.get().transcribe(audio, metadata)
+
+
+def core_factory() -> HTTPDemoRequestHandler:
+    speech2text_model = speech2text_model_factory()
     food_extraction_component = food_extraction_component_factory()
     food_mapping_component = food_mapping_component_factory()
 
@@ -31,4 +43,26 @@ def core_factory() -> HTTPDemoRequestHandler:
         speech2text_model=speech2text_model,
         food_extraction_component=food_extraction_component,
         food_mapping_component=food_mapping_component,
+        food_mapping_many_component=food_mapping_component.map_many,
+    )
+
+
+def lazy_core_factory(container: ComponentContainer) -> HTTPDemoRequestHandler:
+    """
+    Same as core_factory, but the components are registered in the container and
+    created the first time they are used
+    """
+    speech2text_model = container.register(
+        "speech2text_model", speech2text_model_factory
+    )
+    food_extraction = container.register(
+        "food_extraction", food_extraction_component_factory
+    )
+    food_mapping = container.register("food_mapping", food_mapping_component_factory)
+
+    return HTTPDemoRequestHandler(
+        speech2text_model=LazySpeech2TextModel(speech2text_model),
+        food_extraction_component=lambda text: food_extraction.get()(text),
+        food_mapping_component=lambda *args: food_mapping.get()(*args),
+        food_mapping_many_component=lambda *args: food_mapping.get().map_many(*args),
     )
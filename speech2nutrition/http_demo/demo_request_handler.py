@@ -4,6 +4,7 @@ from typing import Any, Dict
 from core.components.food_extraction.definitions import ExtractFoodComponent
 from core.components.food_mapping.definitions.food_map_v2 import (
     MapFoodToNutritionDBComponentV2,
+    MapManyFoodsToNutritionDBComponent,
 )
 from core.components.speech2text.definitions import Speech2TextModel
 from core.domain.entities.nutrition_information_request import (
@@ -21,10 +22,12 @@ class HTTPDemoRequestHandler:
         speech2text_model: Speech2TextModel,
         food_extraction_component: ExtractFoodComponent,
         food_mapping_component: MapFoodToNutritionDBComponentV2,
+        food_mapping_many_component: MapManyFoodsToNutritionDBComponent | None = None,
     ) -> None:
         self.speech2text_model = speech2text_model
         self.food_extraction_component = food_extraction_component
         self.food_mapping_component = food_mapping_component
+        self.food_mapping_many_component = food_mapping_many_component
 
     def __call__(
         self, audio: bytes, metadata: Dict[str, Any]
@@ -32,15 +35,19 @@ class HTTPDemoRequestHandler:
         transcription = self.speech2text_model.transcribe(audio, metadata)
         food_requests = self.food_extraction_component(transcription)
 
-        food_responses = []
-
         db_lookup_preference = DBLookupPreference.system_db
 
-        for food_request in food_requests:
-            food_response = self.food_mapping_component(
-                food_request, db_lookup_preference, "adskju123"
+        if self.food_mapping_many_component is not None:
+            food_responses = self.food_mapping_many_component(
+                food_requests, db_lookup_preference, "adskju123"
             )
-            food_responses.append(food_response)
+        else:
+            food_responses = []
+            for food_request in food_requests:
+                food_response = self.food_mapping_component(
+                    food_request, db_lookup_preference, "adskju123"
+                )
+                food_responses.append(food_response)
 
         nutrition_information_response = NutritionInformationResponse(
             raw_transcript=transcription,
@@ -4,17 +4,40 @@ import boto3
 
 from config.logging import config_logger
 from config.settings_v2 import APP_CONFIG
-from core.core_factory import core_factory
-from core.domain.entities.nutrition_information_request import (
-    NutritionInformationRequest,
-)
-
-sqs_client = boto3.client("sqs", region_name=APP_CONFIG.aws_region)
+from core.component_container import ComponentContainer
+from core.core_factory import lazy_core_factory
+from core.entrypoints.sqs.lambda_handler import process_sqs_records
+from core.entrypoints.sqs.response_publisher import SQSResponsePublisher
 
 config_logger()
 logger = logging.getLogger(__name__)
+
+
+def response_publisher_factory() -> SQSResponsePublisher:
+    # a session per client, the default session is not thread safe and the
+    # publisher is created in a background thread
+    sqs_client = boto3.session.Session().client(
+        "sqs", region_name=APP_CONFIG.aws_region
+    )
+    # the lambda is frozen between invocations, so there is no linger timer and the
+    # responses are flushed at the end of every invocation
+    return SQSResponsePublisher(
+        sqs_client=sqs_client,
+        queue_url=APP_CONFIG.aws_nutrition_response_queue,
+        max_linger_seconds=0,
+    )
+
+
 logger.info("initiating request handler")
-request_handler = core_factory()
+container = ComponentContainer()
+response_publisher = container.register(
+    "response_publisher", response_publisher_factory
+)
+request_handler = lazy_core_factory(container)
+if APP_CONFIG.lazy_components_warm_up:
+    # the components are created in parallel while the lambda init phase runs, the
+    # first request waits for the ones that are not ready yet
+    container.warm_up()
 
 
 def handler(event, context):
@@ -23,23 +46,12 @@ def handler(event, context):
         records = event["Records"]
         if len(records) == 0:
             logger.warning("no records in event, ignoring")
-        elif len(records) > 1:
-            logger.warning(
-                "This lambda function only supports one record per event, ignoring"
-            )
-        else:
-            body = records[0]["body"]
-            request = NutritionInformationRequest.parse_raw(body)
-            logger.info(f"processing request: {request}")
-            response = request_handler(request)
-            logger.info(f"successfully processed request: {request}")
-            response_as_json = response.json(ensure_ascii=False)
-            logger.info("sending response to nutrition response queue")
-            sqs_client.send_message(
-                QueueUrl=APP_CONFIG.aws_nutrition_response_queue,
-                MessageBody=response_as_json,
-            )
-            logger.info("response sent to nutrition response queue")
-
-    else:
-        logger.warning("non AWS SQS Event, ignoring")
+
+        return process_sqs_records(
+            records,
+            request_handler,
+            response_publisher.get(),
+            max_workers=APP_CONFIG.lambda_record_workers,
+        )
+
+    logger.warning("non AWS SQS Event, ignoring")
@@ -6,12 +6,19 @@ from typing import Any, Dict, Tuple
 from requests_toolbelt.multipart import decoder
 
 from config.logging import config_logger
-from http_demo.core_factory import core_factory
+from config.settings_v2 import APP_CONFIG
+from core.component_container import ComponentContainer
+from http_demo.core_factory import lazy_core_factory
 
 config_logger()
 logger = logging.getLogger(__name__)
 logger.info("initiating request handler")
-request_handler = core_factory()
+container = ComponentContainer()
+request_handler = lazy_core_factory(container)
+if APP_CONFIG.lazy_components_warm_up:
+    # the components are created in parallel while the lambda init phase runs, the
+    # first request waits for the ones that are not ready yet
+    container.warm_up()
 
 
 def parse_base64_body(
@@ -4,24 +4,36 @@ import sys
 
 from config.logging import config_logger
 from config.settings_v2 import APP_CONFIG
-from core.core_factory import core_factory
+from core.core_factory import async_core_factory, core_factory
 
 if __name__ == "__main__":
     try:
         config_logger()
         logger = logging.getLogger(__name__)
-        logger.info("initiating request handler")
-        request_handler = core_factory()
-        if APP_CONFIG.message_queue_service == "rabbitmq":
-            from core.entrypoints.rabbitmq.start_rabbit_service import start_rabbit_app
+        if APP_CONFIG.message_queue_service == "sqs-async":
+            from core.entrypoints.sqs.start_async_sqs_service import (
+                start_async_sqs_app,
+            )
 
-            logger.info("starting rabbitmq app")
-            start_rabbit_app(request_handler)
-        elif APP_CONFIG.message_queue_service == "sqs":
-            from core.entrypoints.sqs.start_sqs_service import start_sqs_app
+            logger.info("initiating async request handler")
+            async_request_handler = async_core_factory()
+            logger.info("starting async sqs app")
+            start_async_sqs_app(async_request_handler)
+        else:
+            logger.info("initiating request handler")
+            request_handler = core_factory()
+            if APP_CONFIG.message_queue_service == "rabbitmq":
+                from core.entrypoints.rabbitmq.start_rabbit_service import (
+                    start_rabbit_app,
+                )
 
-            logger.info("starting sqs app")
-            start_sqs_app(request_handler)
+                logger.info("starting rabbitmq app")
+                start_rabbit_app(request_handler)
+            elif APP_CONFIG.message_queue_service == "sqs":
+                from core.entrypoints.sqs.start_sqs_service import start_sqs_app
+
+                logger.info("starting sqs app")
+                start_sqs_app(request_handler)
     except KeyboardInterrupt:
         logger.info("app stopped")
         try:
@@ -0,0 +1,59 @@
+import argparse
+import logging
+from typing import Callable
+
+from config.logging import config_logger
+from core.components.food_extraction.infrastructure.build_prompt import (
+    EXTRACTION_PROMPT,
+    examples,
+    render_examples,
+)
+
+logger = logging.getLogger(__name__)
+
+# rough number of characters of a token, used when tiktoken is not installed
+CHARS_PER_TOKEN = 4
+
+
+def get_token_counter(engine: str) -> Callable[[str], int]:
+    try:
+        import tiktoken
+    except ImportError:
+        logger.warning("tiktoken is not installed, the token counts are estimated")
+        return lambda text: -(-len(text) // CHARS_PER_TOKEN)
+
+    try:
+        encoding = tiktoken.encoding_for_model(engine)
+    except KeyError:
+        encoding = tiktoken.get_encoding("cl100k_base")
+    return lambda text: len(encoding.encode(text))
+
+
+if __name__ == "__main__":
+    config_logger()
+
+    parser = argparse.ArgumentParser(
+        description="Report the number of tokens of the food extraction prompt"
+    )
+    parser.add_argument(
+        "--engine",
+        type=str,
+        default="gpt-3.5-turbo",
+        help="Model used to choose the tokenizer",
+    )
+
+    args = parser.parse_args()
+
+    count_tokens = get_token_counter(args.engine)
+    instructions = EXTRACTION_PROMPT.prefix.replace(
+        EXTRACTION_PROMPT.examples_block, ""
+    )
+
+    print(f"prompt version: {EXTRACTION_PROMPT.version}")
+    print(f"total tokens (without text): {count_tokens(EXTRACTION_PROMPT.render(''))}")
+    print(
+        f"instructions tokens: {count_tokens(instructions + EXTRACTION_PROMPT.suffix)}"
+    )
+    print(f"examples tokens: {count_tokens(EXTRACTION_PROMPT.examples_block)}")
+    for i, example in enumerate(examples):
+        print(f"  example {i}: {count_tokens(render_examples([example]))}")
@@ -0,0 +1,60 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, List
+
+import numpy as np
+
+
+def content_key(*parts: str) -> str:
+    """
+    Key of a test case result, it changes whenever any of the parts changes, e.g.
+    the input of the case or the model that executes it
+    """
+    content = json.dumps(parts, ensure_ascii=False)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class CaseResultCache:
+    """
+    Results of the test cases saved in a folder, one json file per key, so only
+    the cases that changed are executed again
+    """
+
+    def __init__(self, folder: str):
+        self.folder = folder
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.folder, f"{key}.json")
+
+    def get(self, key: str) -> Dict[str, Any] | None:
+        path = self._get_path(key)
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def set(self, key: str, result: Dict[str, Any]) -> None:
+        os.makedirs(self.folder, exist_ok=True)
+        # write to a temporary file first, so an interrupted run does not leave a
+        # partial result
+        fd, temp_path = tempfile.mkstemp(dir=self.folder, prefix=".result-")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=4, ensure_ascii=False)
+        os.replace(temp_path, self._get_path(key))
+
+
+def summarize_latencies(latencies: List[float]) -> Dict[str, float | None]:
+    """
+    p50, p95 and mean of the latencies in seconds, None if there are no latencies
+    """
+    if len(latencies) == 0:
+        return {"p50": None, "p95": None, "mean": None}
+
+    p50, p95 = np.percentile(latencies, [50, 95])
+    return {
+        "p50": round(float(p50), 3),
+        "p95": round(float(p95), 3),
+        "mean": round(float(np.mean(latencies)), 3),
+    }
@@ -0,0 +1,34 @@
+import logging
+import os
+import tempfile
+import unittest
+
+from tests.benchmark import CaseResultCache, content_key, summarize_latencies
+
+logger = logging.getLogger(__name__)
+
+
+class BenchmarkTests(unittest.TestCase):
+    def test_content_key(self):
+        key = content_key("arroz con pollo", "gpt-4")
+
+        self.assertEqual(key, content_key("arroz con pollo", "gpt-4"))
+        self.assertNotEqual(key, content_key("arroz con pollo", "gpt-3.5"))
+        self.assertNotEqual(key, content_key("arroz con", "pollo gpt-4"))
+
+    def test_case_result_cache(self):
+        with tempfile.TemporaryDirectory() as folder:
+            cache = CaseResultCache(os.path.join(folder, "cases"))
+            self.assertIsNone(cache.get("key"))
+
+            cache.set("key", {"found_foods": [], "latency": 1.5})
+            self.assertEqual(cache.get("key"), {"found_foods": [], "latency": 1.5})
+            self.assertEqual(os.listdir(os.path.join(folder, "cases")), ["key.json"])
+
+    def test_summarize_latencies(self):
+        summary = summarize_latencies([float(i) for i in range(1, 101)])
+        self.assertEqual(summary, {"p50": 50.5, "p95": 95.05, "mean": 50.5})
+
+        self.assertEqual(
+            summarize_latencies([]), {"p50": None, "p95": None, "mean": None}
+        )
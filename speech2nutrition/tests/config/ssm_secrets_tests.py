@@ -0,0 +1,126 @@
+import logging
+import unittest
+from typing import Any, Dict, List
+
+from config.ssm_secrets import load_ssm_parameters
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "/fitvoice-app/test/s2n/"
+
+
+class StubSSMClient:
+    """
+    Local replacement of the boto3 ssm client, it returns one parameter per page
+    when searching by path
+    """
+
+    def __init__(
+        self,
+        parameters: Dict[str, str],
+        hidden_from_path: List[str] | None = None,
+        failing_requests: List[str] | None = None,
+    ):
+        self.parameters = parameters
+        self.hidden_from_path = hidden_from_path or []
+        # names of the methods that fail, e.g. because the role can not use them
+        self.failing_requests = failing_requests or []
+        self.calls: List[str] = []
+
+    def get_parameters_by_path(self, **params) -> Dict[str, Any]:
+        self.calls.append("get_parameters_by_path")
+        if "get_parameters_by_path" in self.failing_requests:
+            raise PermissionError("access denied")
+
+        names = [
+            name
+            for name in self.parameters
+            if name.startswith(params["Path"] + "/")
+            and name not in self.hidden_from_path
+        ]
+        index = int(params.get("NextToken", 0))
+        response: Dict[str, Any] = {
+            "Parameters": [
+                {"Name": name, "Value": self.parameters[name]}
+                for name in names[index : index + 1]
+            ]
+        }
+        if index + 1 < len(names):
+            response["NextToken"] = str(index + 1)
+        return response
+
+    def get_parameters(self, Names: List[str], WithDecryption: bool) -> Dict[str, Any]:
+        self.calls.append("get_parameters")
+        if "get_parameters" in self.failing_requests:
+            raise PermissionError("access denied")
+        if len(Names) > 10:
+            raise ValueError("get_parameters accepts up to 10 names")
+        return {
+            "Parameters": [
+                {"Name": name, "Value": self.parameters[name]}
+                for name in Names
+                if name in self.parameters
+            ],
+            "InvalidParameters": [
+                name for name in Names if name not in self.parameters
+            ],
+        }
+
+    def get_parameter(self, Name: str, WithDecryption: bool) -> Dict[str, Any]:
+        self.calls.append("get_parameter")
+        return {"Parameter": {"Name": Name, "Value": self.parameters[Name]}}
+
+
+PARAMETERS = {
+    f"{PREFIX}open_ai_key": "key",
+    f"{PREFIX}open_ai_engine": "gpt",
+    f"{PREFIX}deepgram_key": "deepgram",
+}
+NAMES = ["open_ai_key", "open_ai_engine", "deepgram_key"]
+EXPECTED_VALUES = {
+    "open_ai_key": "key",
+    "open_ai_engine": "gpt",
+    "deepgram_key": "deepgram",
+}
+
+
+class LoadSSMParametersTests(unittest.TestCase):
+    def test_load_by_path(self):
+        client = StubSSMClient(PARAMETERS)
+
+        values = load_ssm_parameters(client, PREFIX, NAMES)
+
+        self.assertEqual(values, EXPECTED_VALUES)
+        self.assertEqual(client.calls, ["get_parameters_by_path"] * 3)
+
+    def test_missing_parameters_are_requested_in_batch(self):
+        client = StubSSMClient(PARAMETERS, hidden_from_path=[f"{PREFIX}deepgram_key"])
+
+        values = load_ssm_parameters(client, PREFIX, NAMES)
+
+        self.assertEqual(values, EXPECTED_VALUES)
+        self.assertEqual(client.calls[-1], "get_parameters")
+
+    def test_fallback_to_batch_requests(self):
+        client = StubSSMClient(PARAMETERS, failing_requests=["get_parameters_by_path"])
+
+        values = load_ssm_parameters(client, PREFIX, NAMES)
+
+        self.assertEqual(values, EXPECTED_VALUES)
+        self.assertEqual(client.calls, ["get_parameters_by_path", "get_parameters"])
+
+    def test_fallback_to_parallel_requests(self):
+        client = StubSSMClient(
+            PARAMETERS, failing_requests=["get_parameters_by_path", "get_parameters"]
+        )
+
+        values = load_ssm_parameters(client, PREFIX, NAMES)
+
+        self.assertEqual(values, EXPECTED_VALUES)
+        self.assertEqual(client.calls.count("get_parameter"), 3)
+
+    def test_parameter_not_found(self):
+        client = StubSSMClient(PARAMETERS)
+
+        with self.assertRaises(ValueError):
+            load_ssm_parameters(client, PREFIX, [*NAMES, "nutrition_mongo_url"])
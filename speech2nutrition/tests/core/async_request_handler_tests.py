@@ -0,0 +1,119 @@
+import asyncio
+import logging
+import unittest
+from datetime import datetime
+from typing import Any, Dict
+
+from core.async_request_handler import AsyncRequestHandler
+from core.components.food_extraction.infrastructure.mocks.mock_food_extraction import (
+    AsyncMockFoodExtractionService,
+)
+from core.components.food_mapping.infrastructure.repositories.mock_repository import (
+    MockNutritionRepository,
+)
+from core.components.food_mapping.infrastructure.repositories.threaded_repository import (
+    ThreadedNutritionRepository,
+)
+from core.components.food_mapping.infrastructure.unit_module.simple_unit import (
+    compute_new_amount_to_grams,
+)
+from core.components.food_mapping.map_algorithm import AsyncFoodMapper, FoodMapper
+from core.components.speech2text.application.s2t_service import (
+    AsyncSpeech2TextService,
+)
+from core.components.speech2text.infrastructure.mocks.mock_audio_storage import (
+    MockAudioStorage,
+)
+from core.components.speech2text.infrastructure.mocks.mock_s2t_model import (
+    AsyncMockSpeech2TextToModel,
+)
+from core.components.speech2text.infrastructure.threaded_audio_storage import (
+    ThreadedAudioStorage,
+)
+from core.domain.entities.nutrition_information_request import (
+    DBLookupPreference,
+    NutritionInformationRequest,
+)
+from tests.food_mapping.utils import create_foods, score_food_by_exact_match
+
+logger = logging.getLogger(__name__)
+
+
+class SlowSpeech2TextModel:
+    """
+    Wait until `number_of_requests` transcriptions are running before answering
+    """
+
+    def __init__(self, number_of_requests: int):
+        self.number_of_requests = number_of_requests
+        self.running = 0
+        self.all_running = asyncio.Event()
+
+    async def transcribe(self, audio: bytes, metadata: Dict[str, Any]) -> str:
+        self.running += 1
+        if self.running == self.number_of_requests:
+            self.all_running.set()
+        await asyncio.wait_for(self.all_running.wait(), timeout=5)
+        return audio.decode("utf-8")
+
+
+def create_handler(speech2text_model: Any) -> AsyncRequestHandler:
+    system_repository = MockNutritionRepository(
+        create_foods([
+            {"food_name": "arroz", "other_names": [], "description": ["blanco"]},
+            {"food_name": "carne", "other_names": [], "description": ["res"]},
+        ])
+    )
+    food_mapper = FoodMapper(
+        system_repository=system_repository,
+        score_function=score_food_by_exact_match,
+        unit_function=compute_new_amount_to_grams,
+    )
+    return AsyncRequestHandler(
+        s2t_component=AsyncSpeech2TextService(
+            ThreadedAudioStorage(MockAudioStorage("tests/data/audio")),
+            speech2text_model,
+        ),
+        food_extraction_component=AsyncMockFoodExtractionService(),
+        food_mapping_component=AsyncFoodMapper(
+            food_mapper, ThreadedNutritionRepository(system_repository)
+        ),
+    )
+
+
+def create_request(audio_id: str) -> NutritionInformationRequest:
+    return NutritionInformationRequest(
+        user_id="1",
+        audio_id=audio_id,
+        db_lookup_preference=DBLookupPreference.system_db,
+        meal_recorded_at=datetime.now(),
+    )
+
+
+class AsyncRequestHandlerTests(unittest.TestCase):
+    def test_request(self):
+        handler = create_handler(AsyncMockSpeech2TextToModel())
+
+        response = asyncio.run(handler(create_request("arroz-carne-audio.json")))
+
+        self.assertEqual(len(response.food_requests), 2)
+        records = [r.food_record for r in response.food_responses]
+        self.assertEqual(
+            [r.food.food_name for r in records if r is not None], ["arroz", "carne"]
+        )
+
+    def test_requests_are_processed_concurrently(self):
+        async def handle_requests():
+            # the transcriptions only finish if all the requests are in flight
+            handler = create_handler(SlowSpeech2TextModel(number_of_requests=3))
+            return await asyncio.gather(*[
+                handler(create_request(audio_id))
+                for audio_id in [
+                    "arroz-carne-audio.json",
+                    "empty-audio.json",
+                    "arroz-carne-audio.json",
+                ]
+            ])
+
+        responses = asyncio.run(handle_requests())
+        self.assertEqual([len(r.food_responses) for r in responses], [2, 0, 2])
@@ -0,0 +1,74 @@
+import logging
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from core.cache import MemoryCache, SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryCacheTests(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = MemoryCache(maxsize=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        self.assertEqual(cache.get("a"), "1")
+
+        cache.set("c", "3")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "1")
+        self.assertEqual(cache.get("c"), "3")
+
+    def test_values_expire(self):
+        cache = MemoryCache(ttl_seconds=10)
+        with mock.patch("time.time", return_value=1000):
+            cache.set("a", "1")
+        with mock.patch("time.time", return_value=1005):
+            self.assertEqual(cache.get("a"), "1")
+        with mock.patch("time.time", return_value=1011):
+            self.assertIsNone(cache.get("a"))
+
+
+class SQLiteCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "cache.sqlite3")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_values_persist(self):
+        cache = SQLiteCache(self.file_path)
+        cache.set("a", "1")
+        cache.close()
+
+        cache = SQLiteCache(self.file_path)
+        self.assertEqual(cache.get("a"), "1")
+        self.assertIsNone(cache.get("b"))
+        cache.close()
+
+    def test_evicts_least_recently_used(self):
+        cache = SQLiteCache(self.file_path, maxsize=2)
+        with mock.patch("time.time", return_value=1000):
+            cache.set("a", "1")
+        with mock.patch("time.time", return_value=1001):
+            cache.set("b", "2")
+        with mock.patch("time.time", return_value=1002):
+            self.assertEqual(cache.get("a"), "1")
+        with mock.patch("time.time", return_value=1003):
+            cache.set("c", "3")
+        with mock.patch("time.time", return_value=1004):
+            self.assertIsNone(cache.get("b"))
+            self.assertEqual(cache.get("a"), "1")
+            self.assertEqual(cache.get("c"), "3")
+        cache.close()
+
+    def test_values_expire(self):
+        cache = SQLiteCache(self.file_path, ttl_seconds=10)
+        with mock.patch("time.time", return_value=1000):
+            cache.set("a", "1")
+        with mock.patch("time.time", return_value=1011):
+            self.assertIsNone(cache.get("a"))
+        cache.close()
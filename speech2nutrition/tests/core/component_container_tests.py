@@ -0,0 +1,67 @@
+import logging
+import threading
+import unittest
+
+from core.component_container import ComponentContainer, LazyComponent
+
+logger = logging.getLogger(__name__)
+
+
+class LazyComponentTests(unittest.TestCase):
+    def test_component_is_created_once_on_first_use(self):
+        calls = []
+        component = LazyComponent("numbers", lambda: calls.append(1) or [1, 2])
+
+        self.assertFalse(component.initialized)
+        self.assertEqual(calls, [])
+        self.assertIsNone(component.init_seconds)
+
+        self.assertEqual(component.get(), [1, 2])
+        self.assertIs(component.get(), component.get())
+        self.assertEqual(calls, [1])
+        self.assertTrue(component.initialized)
+        self.assertGreaterEqual(component.init_seconds, 0)
+
+    def test_failed_warm_up_is_retried_on_first_use(self):
+        attempts = []
+
+        def factory():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ConnectionError("service is down")
+            return "component"
+
+        component = LazyComponent("flaky", factory)
+        component.warm_up().join()
+        self.assertFalse(component.initialized)
+
+        self.assertEqual(component.get(), "component")
+        self.assertEqual(len(attempts), 2)
+
+
+class ComponentContainerTests(unittest.TestCase):
+    def test_warm_up_creates_components_in_parallel(self):
+        # each factory waits for the other one, so they must run at the same time
+        barrier = threading.Barrier(2, timeout=5)
+
+        def factory(value: str):
+            barrier.wait()
+            return value
+
+        container = ComponentContainer()
+        container.register("a", lambda: factory("a"))
+        container.register("b", lambda: factory("b"))
+        self.assertEqual(container.timings(), {"a": None, "b": None})
+
+        for thread in container.warm_up():
+            thread.join()
+
+        self.assertEqual(container.get("a"), "a")
+        self.assertEqual(container.get("b"), "b")
+        self.assertTrue(all(t is not None for t in container.timings().values()))
+
+    def test_register_twice(self):
+        container = ComponentContainer()
+        container.register("a", lambda: "a")
+        with self.assertRaises(ValueError):
+            container.register("a", lambda: "b")
@@ -0,0 +1,104 @@
+import logging
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List
+
+from core.domain.entities.food_nutrition_request import FoodNutritionRequest
+from core.domain.entities.food_nutrition_response import FoodNutritionResponse
+from core.domain.entities.nutrition_information_request import (
+    DBLookupPreference,
+    NutritionInformationRequest,
+)
+from core.request_handler import RequestHandler
+
+logger = logging.getLogger(__name__)
+
+FOOD_NAMES = ["arroz", "carne", "pollo", "papa"]
+AMOUNTS = [0, 1, 2, 3]
+
+
+def extract_foods(transcription: str) -> List[FoodNutritionRequest]:
+    return [
+        FoodNutritionRequest(food_name=name, description=[], amount=i, unit="taza")
+        for i, name in enumerate(transcription.split())
+    ]
+
+
+def create_response(request: FoodNutritionRequest) -> FoodNutritionResponse:
+    return FoodNutritionResponse(
+        food_record=None,
+        suggestions=[],
+        user_amount=request.amount,
+        user_unit=request.unit,
+    )
+
+
+def create_request() -> NutritionInformationRequest:
+    return NutritionInformationRequest(
+        user_id="1",
+        audio_id="audio",
+        db_lookup_preference=DBLookupPreference.system_db,
+        meal_recorded_at=datetime.now(),
+    )
+
+
+class RequestHandlerTests(unittest.TestCase):
+    def test_sequential_mapping(self):
+        handler = RequestHandler(
+            s2t_component=lambda _: " ".join(FOOD_NAMES),
+            food_extraction_component=extract_foods,
+            food_mapping_component=lambda request, *_: create_response(request),
+        )
+
+        response = handler(create_request())
+        self.assertEqual([r.user_amount for r in response.food_responses], AMOUNTS)
+
+    def test_concurrent_mapping_keeps_order(self):
+        # every mapping call waits until all of them are running, so the request
+        # only finishes if the foods are mapped concurrently
+        barrier = threading.Barrier(len(FOOD_NAMES), timeout=5)
+
+        def map_food(request: FoodNutritionRequest, *_) -> FoodNutritionResponse:
+            barrier.wait()
+            return create_response(request)
+
+        with ThreadPoolExecutor(max_workers=len(FOOD_NAMES)) as executor:
+            handler = RequestHandler(
+                s2t_component=lambda _: " ".join(FOOD_NAMES),
+                food_extraction_component=extract_foods,
+                food_mapping_component=map_food,
+                food_mapping_executor=executor,
+            )
+            response = handler(create_request())
+
+        self.assertEqual([r.user_amount for r in response.food_responses], AMOUNTS)
+        self.assertEqual([r.food_name for r in response.food_requests], FOOD_NAMES)
+
+    def test_streaming_maps_foods_while_extracting(self):
+        # the next food is only extracted after the previous one started mapping
+        mapping_started = threading.Event()
+
+        def extract_foods_stream(transcription: str):
+            for food_request in extract_foods(transcription):
+                yield food_request
+                self.assertTrue(mapping_started.wait(timeout=5))
+                mapping_started.clear()
+
+        def map_food(request: FoodNutritionRequest, *_) -> FoodNutritionResponse:
+            mapping_started.set()
+            return create_response(request)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            handler = RequestHandler(
+                s2t_component=lambda _: " ".join(FOOD_NAMES),
+                food_extraction_component=extract_foods,
+                food_mapping_component=map_food,
+                food_mapping_executor=executor,
+                food_extraction_stream_component=extract_foods_stream,
+            )
+            response = handler(create_request())
+
+        self.assertEqual([r.user_amount for r in response.food_responses], AMOUNTS)
+        self.assertEqual([r.food_name for r in response.food_requests], FOOD_NAMES)
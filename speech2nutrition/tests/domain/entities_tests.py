@@ -4,6 +4,8 @@ import unittest
 from pydantic import ValidationError
 
 from core.domain.entities.food_nutrition_request import FoodNutritionRequest
+from core.domain.entities.food_nutrition_response import FoodRecord
+from tests.food_mapping.utils import create_food
 
 logger = logging.getLogger(__name__)
 
@@ -69,3 +71,29 @@ class FoodNutritionRequestDataModelTests(unittest.TestCase):
         self.assertEqual(error["msg"], "amount must be positive")
         self.assertEqual(error["type"], "value_error")
         self.assertEqual(error["loc"][0], "amount")
+
+
+class FoodDataModelTests(unittest.TestCase):
+    def test_keyword_tokens_are_precomputed(self):
+        food = create_food({
+            "full_description": ["carne res", "magro separable", "crudo", "res"]
+        })
+        self.assertEqual(
+            food.keyword_tokens, ("carne", "res", "magro", "separable", "crudo", "res")
+        )
+        self.assertEqual(
+            food.keyword_token_set,
+            frozenset(["carne", "res", "magro", "separable", "crudo"]),
+        )
+
+    def test_keyword_tokens_are_kept_in_nested_models(self):
+        food = create_food({"full_description": ["arroz blanco"]})
+        record = FoodRecord(
+            food=food,
+            score=0,
+            amount=0,
+            unit_was_transformed=False,
+            serving_size_was_used=False,
+        )
+        self.assertEqual(record.food.keyword_tokens, ("arroz", "blanco"))
+        self.assertNotIn("keyword_tokens", record.food.dict())
@@ -0,0 +1,123 @@
+import asyncio
+import contextlib
+import logging
+import unittest
+from typing import List
+
+from core.entrypoints.sqs.aws_sqs_consumer import AsyncSQSConsumer, SQSMessage
+from tests.entrypoints.utils import FakeSQSClient
+
+logger = logging.getLogger(__name__)
+
+
+class RecordingConsumer(AsyncSQSConsumer):
+    def __init__(self, number_of_messages: int, **kwargs):
+        super().__init__(**kwargs)
+        self.number_of_messages = number_of_messages
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.handled: List[str] = []
+        self.failed: List[str] = []
+
+    async def handle_message(self, message: SQSMessage):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if message.Body == "fail":
+            raise ValueError("invalid message")
+
+        self.handled.append(message.Body)
+
+    async def handle_processing_exception(
+        self, message: SQSMessage, exception: Exception
+    ):
+        self.failed.append(message.Body)
+
+    async def _process_message(self, message: SQSMessage):
+        await super()._process_message(message)
+        if len(self.handled) + len(self.failed) == self.number_of_messages:
+            self.stop()
+
+
+class AsyncSQSConsumerTests(unittest.TestCase):
+    def test_messages_in_flight_are_bounded(self):
+        bodies = [f"message-{i}" for i in range(7)] + ["fail"]
+        sqs_client = FakeSQSClient(bodies)
+        consumer = RecordingConsumer(
+            number_of_messages=len(bodies),
+            queue_url="queue",
+            sqs_client=sqs_client,
+            max_in_flight_messages=3,
+            wait_time_seconds=0,
+        )
+
+        asyncio.run(consumer.start())
+
+        self.assertEqual(sorted(consumer.handled), sorted(bodies[:-1]))
+        self.assertEqual(consumer.failed, ["fail"])
+        self.assertLessEqual(consumer.max_in_flight, 3)
+        self.assertTrue(all(n <= 3 for n in sqs_client.max_number_of_messages))
+        # failed messages are not deleted by default
+        self.assertEqual(len(sqs_client.deleted), len(bodies) - 1)
+
+    def test_receive_errors_are_retried_with_backoff(self):
+        sqs_client = FakeSQSClient(["message-0"])
+        receive_message = sqs_client.receive_message
+        errors = [ConnectionError("sqs unavailable")] * 2
+
+        def failing_receive_message(**params):
+            if len(errors) > 0:
+                raise errors.pop()
+            return receive_message(**params)
+
+        sqs_client.receive_message = failing_receive_message
+        consumer = RecordingConsumer(
+            number_of_messages=1,
+            queue_url="queue",
+            sqs_client=sqs_client,
+            wait_time_seconds=0,
+            initial_error_wait_time_ms=1,
+        )
+        waits: List[float] = []
+        error_wait_time_ms = consumer._error_wait_time_ms
+
+        def recording_error_wait_time_ms():
+            waits.append(error_wait_time_ms())
+            return waits[-1]
+
+        consumer._error_wait_time_ms = recording_error_wait_time_ms
+
+        asyncio.run(consumer.start())
+
+        self.assertEqual(consumer.handled, ["message-0"])
+        self.assertEqual(waits, [1, 2])
+
+    def test_messages_in_flight_are_drained_when_cancelled(self):
+        sqs_client = FakeSQSClient(["message-0", "message-1"])
+        consumer = RecordingConsumer(
+            number_of_messages=3,
+            queue_url="queue",
+            sqs_client=sqs_client,
+            wait_time_seconds=0,
+        )
+
+        async def start_and_cancel():
+            task = asyncio.create_task(consumer.start())
+            while consumer.in_flight < 2:
+                await asyncio.sleep(0)
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        asyncio.run(start_and_cancel())
+
+        self.assertEqual(sorted(consumer.handled), ["message-0", "message-1"])
+
+    def test_invalid_max_in_flight_messages(self):
+        with self.assertRaises(ValueError):
+            AsyncSQSConsumer(
+                queue_url="queue",
+                sqs_client=FakeSQSClient([]),
+                max_in_flight_messages=0,
+            )
@@ -0,0 +1,197 @@
+import logging
+import threading
+import time
+import unittest
+from typing import List
+
+from core.entrypoints.sqs.aws_sqs_consumer import ConcurrentSQSConsumer, SQSMessage
+from tests.entrypoints.utils import FakeSQSClient
+
+logger = logging.getLogger(__name__)
+
+
+class RecordingConsumer(ConcurrentSQSConsumer):
+    def __init__(self, number_of_messages: int, handle_time: float, **kwargs):
+        super().__init__(**kwargs)
+        self.number_of_messages = number_of_messages
+        self.handle_time = handle_time
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.handled: List[str] = []
+        self.failed: List[str] = []
+
+    def handle_message(self, message: SQSMessage):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        time.sleep(self.handle_time)
+
+        with self.lock:
+            self.in_flight -= 1
+            if message.Body == "fail":
+                raise ValueError("invalid message")
+            self.handled.append(message.Body)
+
+    def handle_processing_exception(self, message: SQSMessage, exception: Exception):
+        with self.lock:
+            self.failed.append(message.Body)
+
+
+def start_until_processed(consumer: RecordingConsumer):
+    def stop_when_processed():
+        while (
+            len(consumer.handled) + len(consumer.failed) < consumer.number_of_messages
+        ):
+            time.sleep(0.01)
+        consumer.stop()
+
+    stopper = threading.Thread(target=stop_when_processed, daemon=True)
+    stopper.start()
+    consumer.start()
+    stopper.join()
+
+
+class ConcurrentSQSConsumerTests(unittest.TestCase):
+    def test_messages_are_processed_concurrently(self):
+        bodies = [f"message-{i}" for i in range(11)] + ["fail"]
+        sqs_client = FakeSQSClient(bodies)
+        consumer = RecordingConsumer(
+            number_of_messages=len(bodies),
+            handle_time=0.05,
+            queue_url="queue",
+            sqs_client=sqs_client,
+            max_workers=4,
+            wait_time_seconds=0,
+        )
+
+        start_until_processed(consumer)
+
+        self.assertEqual(sorted(consumer.handled), sorted(bodies[:-1]))
+        self.assertEqual(consumer.failed, ["fail"])
+        self.assertGreater(consumer.max_in_flight, 1)
+        self.assertLessEqual(consumer.max_in_flight, 4)
+        self.assertTrue(all(n <= 4 for n in sqs_client.max_number_of_messages))
+        # messages are deleted one by one, failed messages are not deleted by default
+        self.assertEqual(len(sqs_client.deleted), len(bodies) - 1)
+
+    def test_visibility_is_extended_while_in_flight(self):
+        sqs_client = FakeSQSClient(["message"])
+        consumer = RecordingConsumer(
+            number_of_messages=1,
+            handle_time=0.3,
+            queue_url="queue",
+            sqs_client=sqs_client,
+            max_workers=2,
+            wait_time_seconds=0,
+            visibility_extension_interval_seconds=0.05,
+        )
+
+        start_until_processed(consumer)
+
+        self.assertGreater(len(sqs_client.visibility_changes), 0)
+        self.assertTrue(all(h == "handle-0" for h in sqs_client.visibility_changes))
+        self.assertEqual(sqs_client.deleted, ["handle-0"])
+
+    def test_stop_drains_messages_in_flight(self):
+        sqs_client = FakeSQSClient(["message-0", "message-1"])
+        consumer = RecordingConsumer(
+            number_of_messages=2,
+            handle_time=0.2,
+            queue_url="queue",
+            sqs_client=sqs_client,
+            max_workers=2,
+            wait_time_seconds=0,
+        )
+
+        def stop_when_in_flight():
+            while consumer.in_flight < 2:
+                time.sleep(0.01)
+            consumer.stop()
+
+        stopper = threading.Thread(target=stop_when_in_flight, daemon=True)
+        stopper.start()
+        consumer.start()
+
+        self.assertEqual(sorted(consumer.handled), ["message-0", "message-1"])
+        self.assertEqual(len(sqs_client.deleted), 2)
+
+    def test_message_delivered_twice_while_in_flight(self):
+        sqs_client = FakeSQSClient(["message", "message"])
+        # the same message with a new receipt handle
+        sqs_client.messages[1]["MessageId"] = sqs_client.messages[0]["MessageId"]
+        consumer = RecordingConsumer(
+            number_of_messages=2,
+            handle_time=0.3,
+            queue_url="queue",
+            sqs_client=sqs_client,
+            max_workers=2,
+            wait_time_seconds=0,
+            visibility_extension_interval_seconds=0.05,
+        )
+
+        start_until_processed(consumer)
+
+        self.assertEqual(consumer.handled, ["message", "message"])
+        # the visibility of both deliveries is extended
+        self.assertEqual(set(sqs_client.visibility_changes), {"handle-0", "handle-1"})
+        self.assertEqual(sorted(sqs_client.deleted), ["handle-0", "handle-1"])
+        self.assertEqual(consumer._in_flight, {})
+
+    def test_receive_errors_are_retried_with_backoff(self):
+        sqs_client = FakeSQSClient(["message"])
+        receive_message = sqs_client.receive_message
+        errors = [ConnectionError("sqs unavailable")] * 2
+
+        def failing_receive_message(**params):
+            if len(errors) > 0:
+                raise errors.pop()
+            return receive_message(**params)
+
+        sqs_client.receive_message = failing_receive_message
+        consumer = RecordingConsumer(
+            number_of_messages=1,
+            handle_time=0,
+            queue_url="queue",
+            sqs_client=sqs_client,
+            wait_time_seconds=0,
+            initial_error_wait_time_ms=1,
+        )
+        waits: List[float] = []
+        error_wait_time_ms = consumer._error_wait_time_ms
+
+        def recording_error_wait_time_ms():
+            waits.append(error_wait_time_ms())
+            return waits[-1]
+
+        consumer._error_wait_time_ms = recording_error_wait_time_ms
+
+        start_until_processed(consumer)
+
+        self.assertEqual(consumer.handled, ["message"])
+        self.assertEqual(waits, [1, 2])
+
+    def test_visibility_extension_stops_when_the_consumer_fails(self):
+        sqs_client = FakeSQSClient([])
+
+        def interrupted_receive_message(**_):
+            raise KeyboardInterrupt
+
+        sqs_client.receive_message = interrupted_receive_message
+        consumer = RecordingConsumer(
+            number_of_messages=0,
+            handle_time=0,
+            queue_url="queue",
+            sqs_client=sqs_client,
+            wait_time_seconds=0,
+        )
+
+        with self.assertRaises(KeyboardInterrupt):
+            consumer.start()
+        extension_threads = [
+            thread
+            for thread in threading.enumerate()
+            if thread.name == "sqs-visibility-extension"
+        ]
+        self.assertEqual(extension_threads, [])
@@ -0,0 +1,127 @@
+import logging
+import threading
+import unittest
+from datetime import datetime
+from typing import Any, Dict, List
+
+from core.domain.entities.nutrition_information_request import (
+    DBLookupPreference,
+    NutritionInformationRequest,
+)
+from core.domain.entities.nutrition_information_response import (
+    NutritionInformationResponse,
+)
+from core.entrypoints.sqs.lambda_handler import process_sqs_records
+from core.entrypoints.sqs.response_publisher import SQSResponsePublisher
+
+logger = logging.getLogger(__name__)
+
+
+class RecordingSQSClient:
+    def __init__(self, rejected_transcripts: List[str] | None = None):
+        self.batches: List[List[str]] = []
+        self.rejected_transcripts = rejected_transcripts or []
+
+    def send_message_batch(
+        self, QueueUrl: str, Entries: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        self.batches.append([e["MessageBody"] for e in Entries])
+        failed = [
+            {"Id": e["Id"], "SenderFault": True, "Code": "error"}
+            for e in Entries
+            if NutritionInformationResponse.parse_raw(e["MessageBody"]).raw_transcript
+            in self.rejected_transcripts
+        ]
+        return {"Successful": [], "Failed": failed}
+
+
+def create_record(message_id: str, audio_id: str) -> Dict[str, Any]:
+    request = NutritionInformationRequest(
+        user_id="1",
+        audio_id=audio_id,
+        db_lookup_preference=DBLookupPreference.system_db,
+        meal_recorded_at=datetime.now(),
+    )
+    return {"messageId": message_id, "body": request.json(by_alias=True)}
+
+
+def request_handler(request: NutritionInformationRequest):
+    if request.audio_id == "broken":
+        raise ValueError("could not transcribe audio")
+
+    return NutritionInformationResponse(
+        raw_transcript=request.audio_id,
+        food_responses=[],
+        food_requests=[],
+        ni_request=request,
+    )
+
+
+class ProcessSQSRecordsTests(unittest.TestCase):
+    def process_records(
+        self,
+        max_workers: int,
+        handler=request_handler,
+        rejected_transcripts: List[str] | None = None,
+    ):
+        sqs_client = RecordingSQSClient(rejected_transcripts)
+        publisher = SQSResponsePublisher(
+            sqs_client=sqs_client, queue_url="queue", max_linger_seconds=0
+        )
+        records = [
+            create_record("1", "audio-1"),
+            create_record("2", "broken"),
+            {"messageId": "3", "body": "not a request"},
+            create_record("4", "audio-4"),
+        ]
+        result = process_sqs_records(records, handler, publisher, max_workers)
+        return result, sqs_client
+
+    def test_all_records_are_processed(self):
+        result, sqs_client = self.process_records(max_workers=1)
+
+        self.assertEqual(
+            result,
+            {"batchItemFailures": [{"itemIdentifier": "2"}, {"itemIdentifier": "3"}]},
+        )
+        self.assertEqual(len(sqs_client.batches), 1)
+        transcripts = [
+            NutritionInformationResponse.parse_raw(body).raw_transcript
+            for body in sqs_client.batches[0]
+        ]
+        self.assertEqual(transcripts, ["audio-1", "audio-4"])
+
+    def test_records_are_processed_in_parallel(self):
+        # the two valid records are only processed if they run at the same time
+        barrier = threading.Barrier(2, timeout=5)
+
+        def waiting_request_handler(request: NutritionInformationRequest):
+            response = request_handler(request)
+            barrier.wait()
+            return response
+
+        result, sqs_client = self.process_records(
+            max_workers=4, handler=waiting_request_handler
+        )
+
+        self.assertEqual(
+            result,
+            {"batchItemFailures": [{"itemIdentifier": "2"}, {"itemIdentifier": "3"}]},
+        )
+        self.assertEqual(len(sqs_client.batches[0]), 2)
+
+    def test_records_with_unsent_responses_are_retried(self):
+        result, _ = self.process_records(
+            max_workers=1, rejected_transcripts=["audio-4"]
+        )
+
+        self.assertEqual(
+            result,
+            {
+                "batchItemFailures": [
+                    {"itemIdentifier": "2"},
+                    {"itemIdentifier": "3"},
+                    {"itemIdentifier": "4"},
+                ]
+            },
+        )
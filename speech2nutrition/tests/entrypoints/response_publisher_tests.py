@@ -0,0 +1,127 @@
+import logging
+import threading
+import time
+import unittest
+from functools import partial
+from typing import Any, Dict, List
+from unittest import mock
+
+from core.entrypoints.sqs.response_publisher import SQSResponsePublisher
+
+logger = logging.getLogger(__name__)
+
+
+class FakeBatchSQSClient:
+    """
+    Record the batches sent, the entries with the given bodies fail once
+    """
+
+    def __init__(self, failing_bodies: Dict[str, bool] | None = None):
+        # body -> sender fault
+        self.failing_bodies = dict(failing_bodies or {})
+        self.batches: List[List[str]] = []
+        self.lock = threading.Lock()
+
+    def send_message_batch(
+        self, QueueUrl: str, Entries: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        with self.lock:
+            self.batches.append([e["MessageBody"] for e in Entries])
+            failed = []
+            for entry in Entries:
+                body = entry["MessageBody"]
+                if body in self.failing_bodies:
+                    sender_fault = self.failing_bodies[body]
+                    if not sender_fault:
+                        del self.failing_bodies[body]
+                    failed.append({
+                        "Id": entry["Id"],
+                        "SenderFault": sender_fault,
+                        "Code": "error",
+                    })
+            return {"Successful": [], "Failed": failed}
+
+
+def create_publisher(sqs_client: FakeBatchSQSClient, **kwargs) -> SQSResponsePublisher:
+    return SQSResponsePublisher(
+        sqs_client=sqs_client, queue_url="queue", retry_wait_seconds=0, **kwargs
+    )
+
+
+class SQSResponsePublisherTests(unittest.TestCase):
+    def test_flush_on_max_batch_size(self):
+        sqs_client = FakeBatchSQSClient()
+        publisher = create_publisher(sqs_client, max_linger_seconds=0)
+
+        for i in range(23):
+            publisher.publish(f"response-{i}")
+        self.assertEqual([len(b) for b in sqs_client.batches], [10, 10])
+
+        publisher.close()
+        self.assertEqual([len(b) for b in sqs_client.batches], [10, 10, 3])
+
+    def test_flush_on_max_batch_bytes(self):
+        sqs_client = FakeBatchSQSClient()
+        publisher = create_publisher(
+            sqs_client, max_batch_bytes=10, max_linger_seconds=0
+        )
+
+        for body in ["aaaa", "bbbb", "cccc", "dd"]:
+            publisher.publish(body)
+        publisher.flush()
+
+        self.assertEqual(sqs_client.batches, [["aaaa", "bbbb"], ["cccc", "dd"]])
+        with self.assertRaises(ValueError):
+            publisher.publish("a" * 11)
+
+    def test_flush_on_max_linger(self):
+        sqs_client = FakeBatchSQSClient()
+        publisher = create_publisher(sqs_client, max_linger_seconds=0.05)
+
+        publisher.publish("response-0")
+        publisher.publish("response-1")
+        deadline = time.monotonic() + 5
+        while len(sqs_client.batches) == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(sqs_client.batches, [["response-0", "response-1"]])
+        publisher.close()
+        self.assertEqual(len(sqs_client.batches), 1)
+
+    def test_failed_entries_are_retried(self):
+        sqs_client = FakeBatchSQSClient({"response-1": False, "invalid": True})
+        publisher = create_publisher(sqs_client, max_linger_seconds=0)
+
+        results: Dict[str, bool] = {}
+        for body in ["response-0", "response-1", "invalid"]:
+            publisher.publish(body, partial(results.__setitem__, body))
+        failed = publisher.flush()
+
+        # entries rejected because of a sender fault are not retried
+        self.assertEqual(
+            sqs_client.batches,
+            [["response-0", "response-1", "invalid"], ["response-1"]],
+        )
+        self.assertEqual(failed, ["invalid"])
+        self.assertEqual(
+            results, {"response-0": True, "response-1": True, "invalid": False}
+        )
+
+    def test_entries_failing_after_retries_are_returned(self):
+        sqs_client = FakeBatchSQSClient()
+        sqs_client.send_message_batch = mock.Mock(side_effect=ConnectionError)
+        publisher = create_publisher(sqs_client, max_linger_seconds=0, max_retries=2)
+
+        results: List[bool] = []
+        publisher.publish("response", results.append)
+
+        self.assertEqual(publisher.flush(), ["response"])
+        self.assertEqual(sqs_client.send_message_batch.call_count, 3)
+        self.assertEqual(results, [False])
+
+    def test_publish_after_close(self):
+        publisher = create_publisher(FakeBatchSQSClient(), max_linger_seconds=0.05)
+        publisher.close()
+
+        with self.assertRaises(RuntimeError):
+            publisher.publish("response")
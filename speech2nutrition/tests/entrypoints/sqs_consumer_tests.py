@@ -0,0 +1,146 @@
+import logging
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+
+from core.domain.entities.nutrition_information_request import (
+    DBLookupPreference,
+    NutritionInformationRequest,
+)
+from core.domain.entities.nutrition_information_response import (
+    NutritionInformationResponse,
+)
+from core.entrypoints.sqs.aws_sqs_consumer import SQSConsumer, SQSMessage
+from core.entrypoints.sqs.start_sqs_service import SimpleConsumer
+from tests.entrypoints.utils import FakeSQSClient
+
+logger = logging.getLogger(__name__)
+
+
+class ScriptedSQSClient:
+    """
+    Return the given number of messages on every receive, the consumer is stopped
+    once the script is over
+    """
+
+    def __init__(self, script: List[int]):
+        self.script = script
+        self.consumer: SQSConsumer | None = None
+        self.deleted = 0
+
+    def receive_message(self, **params) -> Dict[str, Any]:
+        count = self.script.pop(0)
+        if len(self.script) == 0 and self.consumer is not None:
+            self.consumer.stop()
+        return {
+            "Messages": [
+                {"MessageId": str(i), "ReceiptHandle": f"handle-{i}", "Body": "body"}
+                for i in range(count)
+            ]
+        }
+
+    def delete_message(self, QueueUrl: str, ReceiptHandle: str):
+        self.deleted += 1
+
+
+class RecordingConsumer(SQSConsumer):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.waits: List[float] = []
+
+    def handle_message(self, message: SQSMessage):
+        pass
+
+    def _polling_wait(self):
+        self.waits.append(self._polling_wait_time_ms())
+
+
+def create_request() -> NutritionInformationRequest:
+    return NutritionInformationRequest(
+        user_id="1",
+        audio_id="audio",
+        db_lookup_preference=DBLookupPreference.system_db,
+        meal_recorded_at=datetime.now(),
+    )
+
+
+def request_handler(request: NutritionInformationRequest):
+    return NutritionInformationResponse(
+        raw_transcript=request.audio_id,
+        food_responses=[],
+        food_requests=[],
+        ni_request=request,
+    )
+
+
+def start_consumer(script: List[int], **kwargs) -> RecordingConsumer:
+    sqs_client = ScriptedSQSClient(script)
+    consumer = RecordingConsumer(queue_url="queue", sqs_client=sqs_client, **kwargs)
+    sqs_client.consumer = consumer
+    consumer.start()
+    return consumer
+
+
+class SQSConsumerPollingTests(unittest.TestCase):
+    def test_no_wait_while_queue_has_messages(self):
+        consumer = start_consumer([1, 1, 1], polling_wait_time_ms=60000)
+
+        self.assertEqual(consumer.waits, [])
+        self.assertEqual(consumer.sqs_client.deleted, 3)
+
+    def test_exponential_backoff_on_empty_receives(self):
+        consumer = start_consumer(
+            [0, 0, 0, 0, 0, 1, 0],
+            wait_time_seconds=0,
+            initial_polling_wait_time_ms=1000,
+            polling_wait_time_ms=10000,
+        )
+
+        # the backoff is reset after a message is received
+        self.assertEqual(consumer.waits, [1000, 2000, 4000, 8000, 10000, 1000])
+
+    def test_no_wait_after_long_polling(self):
+        consumer = start_consumer(
+            [0, 0, 0, 1, 0], wait_time_seconds=20, polling_wait_time_ms=60000
+        )
+
+        self.assertEqual(consumer.waits, [0, 0, 0, 0])
+
+    def test_metrics(self):
+        consumer = start_consumer([0, 1, 0, 1], polling_wait_time_ms=0)
+
+        metrics = consumer.metrics()
+        self.assertEqual(metrics.receives, 4)
+        self.assertEqual(metrics.empty_receives, 2)
+        self.assertEqual(metrics.messages, 2)
+        self.assertGreaterEqual(metrics.idle_seconds, 0)
+        self.assertGreaterEqual(metrics.busy_seconds, 0)
+
+    def test_invalid_wait_time_seconds(self):
+        with self.assertRaises(ValueError):
+            SQSConsumer(
+                queue_url="queue",
+                sqs_client=ScriptedSQSClient([]),
+                wait_time_seconds=21,
+            )
+
+
+class SimpleConsumerTests(unittest.TestCase):
+    def test_message_is_deleted_after_its_response_is_sent(self):
+        sqs_client = FakeSQSClient([create_request().json(by_alias=True)] * 2)
+        published: List[Callable[[bool], None]] = []
+        consumer = SimpleConsumer(queue_url="queue", sqs_client=sqs_client)
+        consumer.set_request_handler(request_handler)
+        consumer.set_response_publisher(
+            SimpleNamespace(publish=lambda _, on_result: published.append(on_result))  # pyright: ignore [reportArgumentType]
+        )
+
+        for message in sqs_client.receive_message(MaxNumberOfMessages=2)["Messages"]:
+            consumer._process_message(SQSMessage.parse(message))
+        # the responses are buffered, the messages are not deleted yet
+        self.assertEqual(sqs_client.deleted, [])
+
+        published[0](True)
+        published[1](False)
+        self.assertEqual(sqs_client.deleted, ["handle-0"])
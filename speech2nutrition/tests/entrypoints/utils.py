@@ -0,0 +1,37 @@
+import threading
+from typing import Any, Dict, List
+
+
+class FakeSQSClient:
+    """
+    In memory replacement of the boto3 sqs client, with the methods used by the
+    consumers
+    """
+
+    def __init__(self, bodies: List[str]):
+        self.messages = [
+            {"MessageId": str(i), "ReceiptHandle": f"handle-{i}", "Body": body}
+            for i, body in enumerate(bodies)
+        ]
+        self.max_number_of_messages: List[int] = []
+        self.deleted: List[str] = []
+        self.visibility_changes: List[str] = []
+        self.lock = threading.Lock()
+
+    def receive_message(self, **params) -> Dict[str, Any]:
+        with self.lock:
+            count = params["MaxNumberOfMessages"]
+            self.max_number_of_messages.append(count)
+            messages, self.messages = self.messages[:count], self.messages[count:]
+        return {"Messages": messages}
+
+    def delete_message(self, QueueUrl: str, ReceiptHandle: str):
+        with self.lock:
+            self.deleted.append(ReceiptHandle)
+
+    def change_message_visibility_batch(
+        self, QueueUrl: str, Entries: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        with self.lock:
+            self.visibility_changes.extend(e["ReceiptHandle"] for e in Entries)
+        return {"Successful": [{"Id": e["Id"]} for e in Entries], "Failed": []}
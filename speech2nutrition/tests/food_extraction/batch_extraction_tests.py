@@ -0,0 +1,141 @@
+import json
+import logging
+import unittest
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+from core.components.food_extraction.infrastructure.gpt import (
+    ChatGPTFoodExtractionService,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def create_food(food_name: str) -> Dict[str, Any]:
+    return {"food_name": food_name, "description": "", "amount": 1, "unit": ""}
+
+
+class FakeCompletions:
+    """
+    Return the contents in order, an exception is raised instead of returned
+    """
+
+    def __init__(self, contents: List[str | Exception], finish_reason: str = "stop"):
+        self.contents = contents
+        self.finish_reason = finish_reason
+        self.prompts: List[str] = []
+
+    def create(self, messages: List[Dict[str, str]], **_):
+        self.prompts.append(messages[0]["content"])
+        content = self.contents.pop(0)
+        if isinstance(content, Exception):
+            raise content
+        choice = SimpleNamespace(
+            message=SimpleNamespace(content=content), finish_reason=self.finish_reason
+        )
+        return SimpleNamespace(choices=[choice])
+
+
+class FakeOpenAIClient:
+    def __init__(self, completions: FakeCompletions):
+        self.chat = SimpleNamespace(completions=completions)
+        self.timeouts: List[float] = []
+
+    def with_options(self, timeout: float):
+        self.timeouts.append(timeout)
+        return self
+
+
+def create_service(
+    contents: List[str | Exception], max_batch_size: int = 10, **kwargs
+) -> ChatGPTFoodExtractionService:
+    service = ChatGPTFoodExtractionService(
+        openai_key="key", engine="gpt-4", max_batch_size=max_batch_size
+    )
+    client = FakeOpenAIClient(FakeCompletions(contents, **kwargs))
+    service.client = client  # pyright: ignore [reportAttributeAccessIssue]
+    return service
+
+
+def get_food_names(results) -> List[List[str]]:
+    return [[f.food_name for f in foods] for foods in results]
+
+
+class BatchExtractionTests(unittest.TestCase):
+    def test_one_completion_for_all_texts(self):
+        content = json.dumps({
+            "1": [create_food("arroz")],
+            "2": [],
+            "3": [create_food("pollo"), create_food("papa")],
+        })
+        service = create_service([f"```json\n{content}\n```"])
+
+        results = service.extract_many(["arroz", "teclado", "pollo con papa"])
+
+        self.assertEqual(get_food_names(results), [["arroz"], [], ["pollo", "papa"]])
+        prompts = service.client.chat.completions.prompts
+        self.assertEqual(len(prompts), 1)
+        self.assertIn('2: "teclado"', prompts[0])
+        # the timeout grows with the number of texts
+        self.assertEqual(service.client.timeouts, [30])  # pyright: ignore [reportAttributeAccessIssue]
+
+    def test_missing_texts_are_extracted_one_by_one(self):
+        content = json.dumps({"1": [create_food("arroz")], "2": "pollo"})
+        service = create_service([content, json.dumps([create_food("pollo")])])
+
+        results = service.extract_many(["arroz", "pollo"])
+
+        self.assertEqual(get_food_names(results), [["arroz"], ["pollo"]])
+        prompts = service.client.chat.completions.prompts
+        self.assertTrue(prompts[1].endswith("Fragmento de texto:\npollo\n"))
+
+    def test_invalid_content_extracts_all_texts_one_by_one(self):
+        service = create_service([
+            "no json",
+            json.dumps([create_food("arroz")]),
+            json.dumps([create_food("pollo")]),
+        ])
+
+        results = service.extract_many(["arroz", "pollo"])
+
+        self.assertEqual(get_food_names(results), [["arroz"], ["pollo"]])
+
+    def test_texts_are_split_in_batches(self):
+        service = create_service(
+            [
+                json.dumps({"1": [create_food("arroz")], "2": [create_food("pollo")]}),
+                json.dumps([create_food("papa")]),
+            ],
+            max_batch_size=2,
+        )
+
+        results = service.extract_many(["arroz", "pollo", "papa"])
+
+        self.assertEqual(get_food_names(results), [["arroz"], ["pollo"], ["papa"]])
+        self.assertEqual(len(service.client.chat.completions.prompts), 2)
+
+    def test_failed_completion_extracts_all_texts_one_by_one(self):
+        service = create_service([
+            TimeoutError("batch timed out"),
+            json.dumps([create_food("arroz")]),
+            json.dumps([create_food("pollo")]),
+        ])
+
+        results = service.extract_many(["arroz", "pollo"])
+
+        self.assertEqual(get_food_names(results), [["arroz"], ["pollo"]])
+
+    def test_truncated_content_extracts_all_texts_one_by_one(self):
+        content = json.dumps({"1": [create_food("arroz")], "2": [create_food("po")]})
+        service = create_service(
+            [
+                content[: content.rfind("}")],
+                json.dumps([create_food("arroz")]),
+                json.dumps([create_food("pollo")]),
+            ],
+            finish_reason="length",
+        )
+
+        results = service.extract_many(["arroz", "pollo"])
+
+        self.assertEqual(get_food_names(results), [["arroz"], ["pollo"]])
@@ -0,0 +1,46 @@
+import logging
+import unittest
+
+from core.components.food_extraction.infrastructure.build_prompt import (
+    ExtractionPrompt,
+    get_extraction_prompt,
+    get_prompt_version,
+)
+
+logger = logging.getLogger(__name__)
+
+BASE_PROMPT = 'Formato: {{"food_name":"string"}}\n{EXAMPLES}\nTexto:\n{TEXT_FRAGMENT}\n'
+EXAMPLES = [
+    {"text": "una pera", "result": [{"food_name": "pera"}]},
+    {"text": "sin comida", "result": []},
+]
+
+
+class ExtractionPromptTests(unittest.TestCase):
+    def test_render(self):
+        prompt = ExtractionPrompt(BASE_PROMPT, EXAMPLES)
+
+        self.assertEqual(
+            prompt.render("café {con} leche"),
+            'Formato: {"food_name":"string"}\n'
+            'una pera\n[{"food_name": "pera"}]\nsin comida\n[]\n'
+            "Texto:\ncafé {con} leche\n",
+        )
+
+    def test_version_changes_with_examples(self):
+        version = ExtractionPrompt(BASE_PROMPT, EXAMPLES).version
+
+        self.assertEqual(ExtractionPrompt(BASE_PROMPT, EXAMPLES).version, version)
+        self.assertNotEqual(
+            ExtractionPrompt(BASE_PROMPT, EXAMPLES[:1]).version, version
+        )
+        self.assertNotEqual(
+            ExtractionPrompt("Otro " + BASE_PROMPT, EXAMPLES).version, version
+        )
+
+    def test_extraction_prompt(self):
+        prompt = get_extraction_prompt("comí arroz")
+
+        self.assertTrue(prompt.endswith("Fragmento de texto:\ncomí arroz\n"))
+        self.assertIn("Mi cena de hoy fueron espaguetis", prompt)
+        self.assertEqual(len(get_prompt_version()), 16)
@@ -2,30 +2,177 @@ import argparse
 import json
 import logging
 import os
-from typing import Any, Dict, List, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
 
 import spacy
+from spacy.language import Language
 
 from config.logging import config_logger
-from core.components.food_extraction.factory import food_extraction_component_factory
+from config.settings_v2 import APP_CONFIG
+from core.components.food_extraction.definitions import (
+    BatchExtractFoodComponent,
+    ExtractFoodComponent,
+)
+from core.components.food_extraction.factory import (
+    food_extraction_batch_component_factory,
+    food_extraction_component_factory,
+)
+from core.components.food_extraction.infrastructure.build_prompt import (
+    BATCH_EXTRACTION_PROMPT,
+    get_prompt_version,
+)
+from core.domain.entities.food_nutrition_request import FoodNutritionRequest
+from tests.benchmark import CaseResultCache, content_key, summarize_latencies
 from tests.food_extraction.cases import TEST_SETS
 from tests.food_extraction.metrics import evaluate_test_case
 from tests.food_extraction.test_sets.definitions import FoodExtractionTestCase
 
+RESULTS_FOLDER = os.path.join("tests/data", "fe_results")
+
 
 def save_results(test_set_id: str, results: List[Dict[str, Any]]) -> None:
-    results_path = os.path.join("tests/data", "fe_results", f"test--{test_set_id}.json")
+    results_path = os.path.join(RESULTS_FOLDER, f"test--{test_set_id}.json")
     os.makedirs(os.path.dirname(results_path), exist_ok=True)
     with open(results_path, "w", encoding="utf-8") as f:
         json.dump(results, f, indent=4, ensure_ascii=False)
 
 
-def load_results(test_set_id: str) -> List[Dict[str, Any]] | None:
-    results_path = os.path.join("tests/data", "fe_results", f"test--{test_set_id}.json")
-    if not os.path.exists(results_path):
-        return None
-    with open(results_path, encoding="utf-8") as f:
-        return json.load(f)
+def extract_case(
+    food_extraction_component: ExtractFoodComponent, text: str
+) -> Dict[str, Any]:
+    logger.info(f"executing test case '{text}'")
+    start = time.perf_counter()
+    try:
+        found_foods = [food.dict() for food in food_extraction_component(text)]
+        error = False
+    except Exception:
+        logger.warning(f"Error executing test case {text}", exc_info=True)
+        found_foods = []
+        error = True
+
+    return {
+        "found_foods": found_foods,
+        "latency": time.perf_counter() - start,
+        "error": error,
+    }
+
+
+def extract_cases(
+    food_extraction_component: ExtractFoodComponent,
+    food_extraction_batch_component: BatchExtractFoodComponent | None,
+    texts: List[str],
+    workers: int,
+) -> List[Dict[str, Any]]:
+    if food_extraction_batch_component is not None:
+        start = time.perf_counter()
+        try:
+            found_foods_list = food_extraction_batch_component(texts)
+        except Exception:
+            logger.warning(
+                "Error executing test cases in batch, executing them one by one",
+                exc_info=True,
+            )
+        else:
+            # the latency of a case is the time until its foods are available
+            latency = time.perf_counter() - start
+            return [
+                {
+                    "found_foods": [food.dict() for food in found_foods],
+                    "latency": latency,
+                    "error": False,
+                }
+                for found_foods in found_foods_list
+            ]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                lambda text: extract_case(food_extraction_component, text), texts
+            )
+        )
+
+
+def get_cache_key_parts(batch: bool) -> List[str]:
+    """
+    Everything besides the input text that changes the result of a case: the
+    engine, the prompts and, in batch mode, the number of texts per completion
+    """
+    engine = "mock" if APP_CONFIG.mock_services else APP_CONFIG.open_ai_engine
+    if not batch:
+        return [engine, "single", get_prompt_version()]
+
+    return [
+        engine,
+        "batch",
+        get_prompt_version(),
+        BATCH_EXTRACTION_PROMPT.version,
+        str(APP_CONFIG.food_extraction_batch_size),
+    ]
+
+
+def execute_test_set(
+    test_set: List[FoodExtractionTestCase],
+    cache: CaseResultCache | None,
+    spacy_language: Language,
+    extract: Callable[[List[str]], List[Dict[str, Any]]],
+    key_parts: List[str],
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Execute the cases of the test set that are not cached and evaluate all of them.
+    A case is cached by its input text and `key_parts`
+
+    Returns
+    -------
+    Tuple[List[Dict[str, Any]], Dict[str, Any]]
+        The result of each case and the summary of the test set
+    """
+    start = time.perf_counter()
+    keys = [content_key(test_case["input_text"], *key_parts) for test_case in test_set]
+
+    extractions: Dict[int, Dict[str, Any]] = {}
+    for i, key in enumerate(keys):
+        extraction = cache.get(key) if cache is not None else None
+        if extraction is not None:
+            extractions[i] = extraction
+    n_cached = len(extractions)
+    logger.info(f"{n_cached} cached test cases")
+
+    missing = [i for i in range(len(test_set)) if i not in extractions]
+    if len(missing) > 0:
+        new_extractions = extract([test_set[i]["input_text"] for i in missing])
+        for i, extraction in zip(missing, new_extractions, strict=True):
+            extractions[i] = extraction
+            if cache is not None and not extraction["error"]:
+                cache.set(keys[i], extraction)
+
+    results = []
+    for i, test_case in enumerate(test_set):
+        extraction = extractions[i]
+        found_foods = [
+            FoodNutritionRequest(**food) for food in extraction["found_foods"]
+        ]
+        test_case_results = evaluate_test_case(spacy_language, test_case, found_foods)
+        results.append({
+            "test_case_input_text": test_case["input_text"],
+            "test_case": [
+                food_item["food"].dict()
+                for food_item in test_case["expected_foods_items"]
+            ],
+            "found_foods": extraction["found_foods"],
+            "latency": extraction["latency"],
+            **test_case_results,
+        })
+
+    summary = {
+        "n_tests": len(test_set),
+        "total": sum(result["total"] for result in results),
+        "cached": n_cached,
+        "wall_clock_seconds": round(time.perf_counter() - start, 3),
+        **summarize_latencies([result["latency"] for result in results]),
+    }
+    return results, summary
 
 
 def main() -> None:
@@ -39,6 +186,22 @@ def main() -> None:
         help="The id of the test set to execute. use all to get all test sets",
         default="check",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Extract the foods of several test cases in the same prompt",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Max number of test cases executed at the same time",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Execute all the test cases, even if their results are cached",
+    )
     args = parser.parse_args()
 
     id_test_set_list: List[Tuple[str, List[FoodExtractionTestCase]]] = []
@@ -55,70 +218,51 @@ def main() -> None:
 
     logger.info("creating food extraction component")
     food_extraction_component = food_extraction_component_factory()
+    food_extraction_batch_component = (
+        food_extraction_batch_component_factory() if args.batch else None
+    )
+    cache = None
+    if not args.no_cache:
+        cache = CaseResultCache(os.path.join(RESULTS_FOLDER, "cases"))
+    key_parts = get_cache_key_parts(args.batch)
 
-    all_results: List[Tuple[str, List[Dict[str, Any]]]] = []
-    n_tests = 0
+    def extract(texts: List[str]) -> List[Dict[str, Any]]:
+        return extract_cases(
+            food_extraction_component,
+            food_extraction_batch_component,
+            texts,
+            args.workers,
+        )
+
+    all_individual_metrics = []
+    summaries = []
     for test_set_id, test_set in id_test_set_list:
         logger.info(f"executing test set with id: {test_set_id}")
-        n_tests += len(test_set)
-        loaded_results = load_results(test_set_id)
-        if loaded_results is None:
-            logger.info(f"test set with id: '{test_set_id}' not found, executing")
-            results = []
-            for test_case in test_set:
-                logger.info(f"executing test case '{test_case['input_text']}'")
-
-                try:
-                    found_foods = food_extraction_component(test_case["input_text"])
-                except Exception:
-                    logger.warning(
-                        f"Error executing test case {test_case['input_text']}",
-                        exc_info=True,
-                    )
-                    found_foods = []
-
-                test_case_results = evaluate_test_case(
-                    spacy_language, test_case, found_foods
-                )
-                results.append({
-                    "test_case_input_text": test_case["input_text"],
-                    "test_case": [
-                        food_item["food"].dict()
-                        for food_item in test_case["expected_foods_items"]
-                    ],
-                    "found_foods": [food.dict() for food in found_foods],
-                    **test_case_results,
-                })
-            save_results(test_set_id, results)
-            all_results.append((test_set_id, results))
-        else:
-            logger.info(f"test set '{test_set_id}' found, skipping")
-            all_results.append((test_set_id, loaded_results))
+        results, summary = execute_test_set(
+            test_set, cache, spacy_language, extract, key_parts
+        )
+        save_results(test_set_id, results)
 
-    all_individual_metrics = []
-    total = 0
-    for test_set_id, results in all_results:
-        current_total = 0
         for result in results:
-            test_id_total = result["total"]
-            logger.info(f"test set id: '{test_set_id}' - total: {test_id_total}")
-
-            ind_metrics = result["individual_metrics"].copy()
+            logger.info(f"test set id: '{test_set_id}' - total: {result['total']}")
             all_individual_metrics.extend([
-                {**m, "test_set_id": test_set_id} for m in ind_metrics
+                {**m, "test_set_id": test_set_id} for m in result["individual_metrics"]
             ])
 
-            current_total += test_id_total
-
         logger.info(
-            f"--> test set id: '{test_set_id}' - total: {current_total} / {len(results)}"
+            f"--> test set id: '{test_set_id}' - total: {summary['total']} / "
+            f"{summary['n_tests']} - p50: {summary['p50']}s - p95: {summary['p95']}s"
+            f" - wall clock: {summary['wall_clock_seconds']}s"
         )
-        total += current_total
+        summaries.append({"test_set_id": test_set_id, **summary})
 
+    n_tests = sum(summary["n_tests"] for summary in summaries)
+    total = sum(summary["total"] for summary in summaries)
     logger.info(f"number of tests: {n_tests}")
     logger.info(f"total score: {total} / {n_tests}")
     logger.info("Saving individual metrics")
     save_results("individual_metrics", all_individual_metrics)
+    save_results("summary", summaries)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,113 @@
+import asyncio
+import logging
+import unittest
+from typing import List
+
+from core.cache import MemoryCache
+from core.components.food_extraction.infrastructure.extraction_cache import (
+    AsyncCachedFoodExtractionService,
+    CachedFoodExtractionService,
+    CachedStreamFoodExtractionService,
+    build_extraction_cache_key,
+    normalize_transcript,
+)
+from core.domain.entities.food_nutrition_request import FoodNutritionRequest
+
+logger = logging.getLogger(__name__)
+
+FOOD_REQUESTS = [
+    FoodNutritionRequest(
+        food_name="arroz", description=["blanco"], amount=100, unit="gramos"
+    ),
+    FoodNutritionRequest(food_name="pollo", description=[], amount=1, unit="unidad"),
+]
+
+
+class FakeExtractionService:
+    def __init__(self, food_requests: List[FoodNutritionRequest]):
+        self.food_requests = food_requests
+        self.calls: List[str] = []
+
+    def __call__(self, text: str) -> List[FoodNutritionRequest]:
+        self.calls.append(text)
+        return self.food_requests
+
+
+class AsyncFakeExtractionService(FakeExtractionService):
+    async def __call__(self, text: str) -> List[FoodNutritionRequest]:
+        return super().__call__(text)
+
+
+class ExtractionCacheKeyTests(unittest.TestCase):
+    def test_normalize_transcript(self):
+        self.assertEqual(
+            normalize_transcript("  Comí   arroz\ncon pollo. "), "comí arroz con pollo"
+        )
+        self.assertEqual(normalize_transcript("¿Arroz?"), "arroz")
+
+    def test_key_depends_on_engine_and_prompt_version(self):
+        key = build_extraction_cache_key("Arroz con pollo.", "gpt-4", "v1")
+        self.assertEqual(
+            key, build_extraction_cache_key("arroz con pollo", "gpt-4", "v1")
+        )
+        self.assertNotEqual(
+            key, build_extraction_cache_key("arroz con pollo", "gpt-3.5", "v1")
+        )
+        self.assertNotEqual(
+            key, build_extraction_cache_key("arroz con pollo", "gpt-4", "v2")
+        )
+
+
+class CachedFoodExtractionServiceTests(unittest.TestCase):
+    def test_cache_hit_skips_extraction(self):
+        extraction_service = FakeExtractionService(FOOD_REQUESTS)
+        service = CachedFoodExtractionService(
+            extraction_service,
+            MemoryCache(),
+            engine="gpt-4",
+            prompt_version="v1",
+        )
+
+        self.assertEqual(service("Arroz blanco y pollo"), FOOD_REQUESTS)
+        self.assertEqual(service("arroz blanco  y pollo."), FOOD_REQUESTS)
+        self.assertEqual(extraction_service.calls, ["Arroz blanco y pollo"])
+
+    def test_prompt_version_change_misses_cache(self):
+        cache = MemoryCache()
+        extraction_service = FakeExtractionService(FOOD_REQUESTS)
+        for prompt_version in ["v1", "v2"]:
+            service = CachedFoodExtractionService(
+                extraction_service, cache, engine="gpt-4", prompt_version=prompt_version
+            )
+            service("arroz blanco y pollo")
+
+        self.assertEqual(len(extraction_service.calls), 2)
+
+    def test_async_cache_hit_skips_extraction(self):
+        extraction_service = AsyncFakeExtractionService(FOOD_REQUESTS)
+        service = AsyncCachedFoodExtractionService(
+            extraction_service,
+            MemoryCache(),
+            engine="gpt-4",
+            prompt_version="v1",
+        )
+
+        async def extract_twice():
+            return [await service("arroz y pollo"), await service("Arroz y pollo")]
+
+        results = asyncio.run(extract_twice())
+        self.assertEqual(results, [FOOD_REQUESTS, FOOD_REQUESTS])
+        self.assertEqual(len(extraction_service.calls), 1)
+
+    def test_stream_is_saved_after_it_is_consumed(self):
+        extraction_service = FakeExtractionService(FOOD_REQUESTS)
+        service = CachedStreamFoodExtractionService(
+            lambda text: iter(extraction_service(text)),
+            MemoryCache(),
+            engine="gpt-4",
+            prompt_version="v1",
+        )
+
+        self.assertEqual(list(service("arroz y pollo")), FOOD_REQUESTS)
+        self.assertEqual(list(service("arroz y pollo")), FOOD_REQUESTS)
+        self.assertEqual(len(extraction_service.calls), 1)
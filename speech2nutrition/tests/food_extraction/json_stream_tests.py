@@ -0,0 +1,63 @@
+import json
+import logging
+import unittest
+
+from core.components.food_extraction.infrastructure.json_stream import (
+    JSONArrayStreamParser,
+)
+
+logger = logging.getLogger(__name__)
+
+FOODS = [
+    {"food_name": "arroz", "description": "blanco, cocido", "amount": 1, "unit": ""},
+    {
+        "food_name": 'pan "integral"',
+        "description": "{tostado}",
+        "amount": 2,
+        "unit": "",
+    },
+    {"food_name": "café", "description": "", "amount": 0.5, "unit": "taza"},
+]
+
+
+class JSONArrayStreamParserTests(unittest.TestCase):
+    def test_objects_are_returned_when_closed(self):
+        content = json.dumps(FOODS, ensure_ascii=False)
+        first_end = content.index("}") + 1
+        parser = JSONArrayStreamParser()
+
+        self.assertEqual(parser.feed(content[: first_end - 1]), [])
+        self.assertEqual(parser.feed(content[first_end - 1 : first_end]), FOODS[:1])
+        self.assertEqual(parser.feed(content[first_end:]), FOODS[1:])
+        self.assertTrue(parser.finished)
+
+    def test_one_character_chunks(self):
+        content = json.dumps(FOODS, ensure_ascii=False)
+        parser = JSONArrayStreamParser()
+
+        objects = []
+        for char in content:
+            objects.extend(parser.feed(char))
+        self.assertEqual(objects, FOODS)
+
+    def test_text_around_the_array_is_ignored(self):
+        content = f"```json\n{json.dumps(FOODS[:1])}\n```\n[{{}}]"
+        parser = JSONArrayStreamParser()
+
+        self.assertEqual(parser.feed(content), FOODS[:1])
+        self.assertTrue(parser.finished)
+
+    def test_incomplete_array(self):
+        parser = JSONArrayStreamParser()
+
+        self.assertEqual(
+            parser.feed('[{"food_name": "arroz"}, {"food_'), [{"food_name": "arroz"}]
+        )
+        self.assertTrue(parser.started)
+        self.assertFalse(parser.finished)
+
+    def test_empty_array(self):
+        parser = JSONArrayStreamParser()
+
+        self.assertEqual(parser.feed("[]"), [])
+        self.assertTrue(parser.finished)
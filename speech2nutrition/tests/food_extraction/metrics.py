@@ -3,8 +3,8 @@ from typing import Dict, List, Set, Tuple
 
 from spacy.language import Language
 
-from core.components.food_mapping.infrastructure.nlp.clean_keyword import (
-    clean_description_keyword,
+from core.components.food_mapping.infrastructure.nlp.keyword_cleaning_engine import (
+    KeywordCleaningEngine,
 )
 from core.domain.entities.food_nutrition_request import FoodNutritionRequest
 from tests.food_extraction.test_sets.definitions import (
@@ -12,6 +12,9 @@ from tests.food_extraction.test_sets.definitions import (
     FoodExtractionTestCase,
 )
 
+# test cases repeat the same names and descriptions across test sets
+keyword_cleaning_engine = KeywordCleaningEngine()
+
 
 def avg(lst: List[float]) -> float:
     if len(lst) == 0:
@@ -26,7 +29,7 @@ def merge_food_name_description(
     Merge the food name and description into a single string and clean it
     """
     final_food_description = f"{name} {' '.join(description)}"
-    clean_text = clean_description_keyword(nlp, final_food_description)
+    clean_text = keyword_cleaning_engine.clean(nlp, final_food_description)
     return set(clean_text.split(" "))
 
 
@@ -35,8 +38,8 @@ def name_metric(nlp: Language, name: str, expected_name: str) -> int:
     Given a food name and an expected food name, compute a metric that is 1 if the names are the same and 0 otherwise. An exact match strategy is used after cleaning the names
     """
 
-    cleaned_name = clean_description_keyword(nlp, name)
-    cleaned_expected_name = clean_description_keyword(nlp, expected_name)
+    cleaned_name = keyword_cleaning_engine.clean(nlp, name)
+    cleaned_expected_name = keyword_cleaning_engine.clean(nlp, expected_name)
 
     return 1 if cleaned_name == cleaned_expected_name else 0
 
@@ -47,8 +50,8 @@ def description_metric(
     """
     Given a food description and an expected food description, compute a metric based on the intersection of the words in the descriptions
     """
-    final_food_description = clean_description_keyword(nlp, " ".join(description))
-    expected_final_food_description = clean_description_keyword(
+    final_food_description = keyword_cleaning_engine.clean(nlp, " ".join(description))
+    expected_final_food_description = keyword_cleaning_engine.clean(
         nlp, " ".join(expected_description)
     )
 
@@ -0,0 +1,61 @@
+import json
+import logging
+import unittest
+from types import SimpleNamespace
+from typing import Dict, List
+
+from core.components.food_extraction.infrastructure.gpt import (
+    ChatGPTFoodExtractionService,
+)
+from core.domain.errors import ServiceException
+
+logger = logging.getLogger(__name__)
+
+
+class FakeStreamCompletions:
+    """
+    Return the content split in chunks of `chunk_size` characters
+    """
+
+    def __init__(self, content: str, chunk_size: int = 5):
+        self.content = content
+        self.chunk_size = chunk_size
+
+    def create(self, messages: List[Dict[str, str]], **_):
+        for i in range(0, len(self.content), self.chunk_size):
+            delta = SimpleNamespace(content=self.content[i : i + self.chunk_size])
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+def create_service(content: str) -> ChatGPTFoodExtractionService:
+    service = ChatGPTFoodExtractionService(openai_key="key", engine="gpt-4")
+    client = SimpleNamespace(
+        chat=SimpleNamespace(completions=FakeStreamCompletions(content))
+    )
+    service.client = client  # pyright: ignore [reportAttributeAccessIssue]
+    return service
+
+
+class StreamExtractionTests(unittest.TestCase):
+    def test_foods_are_returned(self):
+        content = json.dumps([
+            {"food_name": "arroz", "description": "", "amount": 1, "unit": ""},
+            {"food_name": "pollo", "description": "", "amount": 2, "unit": ""},
+        ])
+        service = create_service(content)
+
+        foods = list(service.stream("arroz con pollo"))
+        self.assertEqual([f.food_name for f in foods], ["arroz", "pollo"])
+
+    def test_invalid_json_raises_service_exception(self):
+        service = create_service('[{"food_name": "arroz",}]')
+
+        with self.assertRaises(ServiceException) as context:
+            list(service.stream("arroz"))
+        self.assertIsInstance(context.exception.__cause__, json.JSONDecodeError)
+
+    def test_incomplete_list_raises_service_exception(self):
+        service = create_service('[{"food_name": "arroz"')
+
+        with self.assertRaises(ServiceException):
+            list(service.stream("arroz"))
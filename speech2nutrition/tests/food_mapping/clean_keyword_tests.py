@@ -2,11 +2,11 @@ import logging
 import unittest
 
 import pytest
-import spacy
 from spacy.language import Language
 
 from core.components.food_mapping.infrastructure.nlp.clean_keyword import (
     clean_description_keyword,
+    load_keyword_nlp,
 )
 
 logger = logging.getLogger(__name__)
@@ -14,10 +14,10 @@ logger = logging.getLogger(__name__)
 assertions = unittest.TestCase()
 
 
-@pytest.fixture(scope="module")
-def nlp():
-    logger.info("loading spacy model for spanish")
-    return spacy.load("es_core_news_sm")
+@pytest.fixture(scope="module", params=["full", "lexical"])
+def nlp(request: pytest.FixtureRequest):
+    logger.info(f"loading spacy model for spanish in {request.param} mode")
+    return load_keyword_nlp("es_core_news_sm", mode=request.param)
 
 
 def test_clean_description_keyword_basic_input(nlp: Language):
@@ -62,3 +62,16 @@ def test_clean_description_keyword_with_stop_words_and_punctuation(nlp: Language
     text = "Arroz de leche."
     expected_output = "arroz leche"
     assertions.assertEqual(clean_description_keyword(nlp, text), expected_output)
+
+
+def test_load_keyword_nlp_invalid_mode():
+    with pytest.raises(ValueError):
+        load_keyword_nlp("es_core_news_sm", mode="invalid")
+
+
+def test_load_keyword_nlp_lexical_mode_only_loads_lemmatization_components():
+    nlp = load_keyword_nlp("es_core_news_sm", mode="lexical")
+    assertions.assertEqual(nlp.pipe_names, [])
+    assertions.assertNotIn("parser", nlp.component_names)
+    assertions.assertNotIn("ner", nlp.component_names)
+    assertions.assertIn("lemmatizer", nlp.component_names)
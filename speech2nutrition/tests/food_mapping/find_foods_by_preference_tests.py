@@ -5,6 +5,7 @@ import pytest
 
 from core.components.food_mapping.application.food_finder import (
     find_foods_by_preference,
+    find_many_foods_by_preference,
 )
 from core.components.food_mapping.definitions.repository import NutritionRepository
 from core.components.food_mapping.infrastructure.repositories.mock_repository import (
@@ -214,3 +215,55 @@ def test_no_match_in_system_db(
     )
 
     assertions.assertEqual(len(response.foods), 0)
+
+
+def test_many_matches_with_fallback_to_system_db(
+    repository1: NutritionRepository,
+    repository3: NutritionRepository,
+):
+    """
+    should look up in the system db only the foods that were not found in the user db
+    with order user_db then system_db
+    """
+    preference = DBLookupPreference.user_db_system_db
+    food_requests = [
+        FoodNutritionRequest(food_name="arroz", description=[], amount=0, unit=""),
+        FoodNutritionRequest(food_name="carne", description=[], amount=0, unit=""),
+        FoodNutritionRequest(food_name="pollo", description=[], amount=0, unit=""),
+    ]
+
+    responses = find_many_foods_by_preference(
+        food_requests=food_requests,
+        lookup_preference=preference,
+        system_repository=repository1,
+        user_repository=repository3,
+    )
+
+    assertions.assertEqual(len(responses), 3)
+    assertions.assertEqual([f.id for f in responses[0].foods], ["1"])
+    assertions.assertEqual([f.id for f in responses[1].foods], ["3"])
+    assertions.assertEqual(responses[2].foods, [])
+
+
+def test_many_matches_in_system_db(
+    repository1: NutritionRepository,
+    repository3: NutritionRepository,
+):
+    """
+    should only look up in the system db
+    """
+    preference = DBLookupPreference.system_db
+    food_requests = [
+        FoodNutritionRequest(food_name="carne", description=[], amount=0, unit=""),
+        FoodNutritionRequest(food_name="arroz", description=[], amount=0, unit=""),
+    ]
+
+    responses = find_many_foods_by_preference(
+        food_requests=food_requests,
+        lookup_preference=preference,
+        system_repository=repository1,
+        user_repository=repository3,
+    )
+
+    assertions.assertEqual(responses[0].foods, [])
+    assertions.assertEqual([f.id for f in responses[1].foods], ["1"])
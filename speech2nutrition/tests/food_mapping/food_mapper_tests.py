@@ -12,7 +12,11 @@ from core.components.food_mapping.map_algorithm import FoodMapper
 from core.domain.entities.food_nutrition_request import FoodNutritionRequest
 from core.domain.entities.food_nutrition_response import FoodNutritionResponse
 from core.domain.entities.nutrition_information_request import DBLookupPreference
-from tests.food_mapping.utils import create_foods, score_food_by_exact_match
+from tests.food_mapping.utils import (
+    create_foods,
+    score_food_by_exact_match,
+    score_foods_by_exact_match,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -163,6 +167,48 @@ class FoodMapperTest(unittest.TestCase):
         self.assertEqual(response.user_amount, 50)
         self.assertEqual(response.user_unit, "g")
 
+    def test_custom_max_records(self):
+        """
+        should return one food record and max_records - 1 suggestions, keeping the
+        order of the foods with the same score
+        """
+
+        request = FoodNutritionRequest(
+            food_name="carne",
+            description=["cerdo"],
+            amount=50,
+            unit="g",
+        )
+        data = create_foods([
+            {"id": "1", "food_name": "carne", "full_description": ["res"]},
+            {"id": "2", "food_name": "arroz", "full_description": ["integral"]},
+            {"id": "3", "food_name": "carne", "full_description": ["pollo"]},
+            {"id": "4", "food_name": "carne", "full_description": ["cerdo"]},
+            {"id": "5", "food_name": "carne", "full_description": ["vacuna"]},
+        ])
+        food_mapper = FoodMapper(
+            system_repository=MockNutritionRepository(data),
+            score_function=score_food_by_exact_match,
+            unit_function=compute_new_amount_to_grams,
+        )
+        response = food_mapper(
+            request=request,
+            lookup_preference=DBLookupPreference.system_db,
+            app_user_id="1",
+            max_records=3,
+        )
+
+        self.assertEqual(response.food_record.food.id, "4")
+        self.assertEqual([s.food.id for s in response.suggestions], ["1", "3"])
+
+        with self.assertRaises(ValueError):
+            food_mapper(
+                request=request,
+                lookup_preference=DBLookupPreference.system_db,
+                app_user_id="1",
+                max_records=0,
+            )
+
     def test_no_match(self):
         """
         should return no food record and no suggestions if could not find any food
@@ -188,6 +234,89 @@ class FoodMapperTest(unittest.TestCase):
         self.assertEqual(response.user_amount, 80)
         self.assertEqual(response.user_unit, "g")
 
+    def test_batch_score_function(self):
+        """
+        should use the batch score function to score all the foods at once
+        """
+        request = FoodNutritionRequest(
+            food_name="carne",
+            description=["cerdo"],
+            amount=50,
+            unit="g",
+        )
+        data = create_foods([
+            {
+                "id": "1",
+                "food_name": "carne",
+                "full_description": ["res", "sin grasa", "cocida"],
+            },
+            {
+                "id": "2",
+                "food_name": "carne",
+                "full_description": ["cerdo", "sin grasa", "cocida"],
+            },
+        ])
+        food_mapper = FoodMapper(
+            system_repository=MockNutritionRepository(data),
+            score_function=lambda query: 0,
+            unit_function=compute_new_amount_to_grams,
+            batch_score_function=score_foods_by_exact_match,
+        )
+        response = food_mapper(
+            request=request,
+            lookup_preference=DBLookupPreference.system_db,
+            app_user_id="1",
+        )
+
+        self.assertEqual(response.food_record.food.id, "2")
+        self.assertEqual(response.food_record.score, 1)
+        self.assertEqual([s.food.id for s in response.suggestions], ["1"])
+
+    def test_map_many(self):
+        """
+        should return the same responses as mapping the foods one by one, in the
+        same order as the requests
+        """
+        requests = [
+            FoodNutritionRequest(
+                food_name="carne", description=["cerdo"], amount=50, unit="g"
+            ),
+            FoodNutritionRequest(
+                food_name="lentejas", description=[], amount=80, unit="g"
+            ),
+            FoodNutritionRequest(
+                food_name="arroz", description=["integral"], amount=1, unit="taza"
+            ),
+        ]
+        data = create_foods([
+            {"id": "1", "food_name": "carne", "full_description": ["res"]},
+            {"id": "2", "food_name": "carne", "full_description": ["cerdo"]},
+            {"id": "3", "food_name": "arroz", "full_description": ["integral"]},
+        ])
+        food_mapper = FoodMapper(
+            system_repository=MockNutritionRepository(data),
+            score_function=score_food_by_exact_match,
+            unit_function=compute_new_amount_to_grams,
+        )
+        responses = food_mapper.map_many(
+            requests=requests,
+            lookup_preference=DBLookupPreference.system_db,
+            app_user_id="1",
+        )
+        expected_responses = [
+            food_mapper(
+                request=request,
+                lookup_preference=DBLookupPreference.system_db,
+                app_user_id="1",
+            )
+            for request in requests
+        ]
+
+        self.assertEqual(responses, expected_responses)
+        self.assertEqual(responses[0].food_record.food.id, "2")
+        self.assertEqual(responses[1].food_record, None)
+        self.assertEqual(responses[2].food_record.amount, 200)
+
     # The following tests depend on the unit module
 
     def test_food_unit_is_not_in_grams(self):
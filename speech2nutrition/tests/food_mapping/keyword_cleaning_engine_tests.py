@@ -0,0 +1,63 @@
+import logging
+import unittest
+
+import pytest
+import spacy
+from spacy.language import Language
+
+from core.components.food_mapping.infrastructure.nlp.keyword_cleaning_engine import (
+    KeywordCleaningEngine,
+)
+
+logger = logging.getLogger(__name__)
+
+assertions = unittest.TestCase()
+
+
+@pytest.fixture(scope="module")
+def nlp():
+    logger.info("loading spacy model for spanish")
+    return spacy.load("es_core_news_sm")
+
+
+def test_keyword_cleaning_engine_same_output(nlp: Language):
+    engine = KeywordCleaningEngine(maxsize=10)
+    assertions.assertEqual(engine.clean(nlp, "Carne de res"), "carne res")
+    assertions.assertEqual(engine.clean(nlp, "Carne de res"), "carne res")
+    assertions.assertEqual(engine.clean(nlp, ""), "")
+    assertions.assertEqual(engine.clean(nlp, ""), "")
+
+
+def test_keyword_cleaning_engine_hits_and_misses(nlp: Language):
+    engine = KeywordCleaningEngine(maxsize=10)
+    engine.clean(nlp, "arroz")
+    engine.clean(nlp, "arroz")
+    engine.clean(nlp, "arroz", disable_lemmatization=False)
+
+    stats = engine.stats()
+    assertions.assertEqual(stats.hits, 1)
+    assertions.assertEqual(stats.misses, 2)
+    assertions.assertEqual(stats.size, 2)
+
+
+def test_keyword_cleaning_engine_evicts_least_recently_used(nlp: Language):
+    engine = KeywordCleaningEngine(maxsize=2)
+    engine.clean(nlp, "arroz")
+    engine.clean(nlp, "carne")
+    # 'arroz' becomes the most recently used entry
+    engine.clean(nlp, "arroz")
+    engine.clean(nlp, "pollo")
+
+    stats = engine.stats()
+    assertions.assertEqual(stats.evictions, 1)
+    assertions.assertEqual(stats.size, 2)
+
+    engine.clean(nlp, "arroz")
+    assertions.assertEqual(engine.stats().hits, 2)
+    engine.clean(nlp, "carne")
+    assertions.assertEqual(engine.stats().misses, 4)
+
+
+def test_keyword_cleaning_engine_invalid_maxsize():
+    with pytest.raises(ValueError):
+        KeywordCleaningEngine(maxsize=0)
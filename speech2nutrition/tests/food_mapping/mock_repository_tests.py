@@ -0,0 +1,56 @@
+import logging
+import unittest
+
+from core.components.food_mapping.infrastructure.repositories.mock_repository import (
+    MockNutritionRepository,
+)
+from tests.food_mapping.utils import create_food, create_foods
+
+logger = logging.getLogger(__name__)
+
+
+class MockNutritionRepositoryTests(unittest.TestCase):
+    def test_search_by_name_and_other_names(self):
+        repository = MockNutritionRepository(
+            create_foods([
+                {"id": "1", "food_name": "Carne de vaca", "other_names": ["carne"]},
+                {"id": "2", "food_name": "arroz", "other_names": ["ARROZ"]},
+                {"id": "3", "food_name": "carne", "other_names": []},
+            ])
+        )
+
+        foods = repository.get_foods_by_name("CARNE")
+        self.assertEqual([f.id for f in foods], ["1", "3"])
+
+        foods = repository.get_foods_by_name("arroz")
+        self.assertEqual([f.id for f in foods], ["2"])
+
+        self.assertEqual(repository.get_foods_by_name("pollo"), [])
+
+    def test_add_and_remove(self):
+        repository = MockNutritionRepository([])
+
+        repository.add(create_food({"id": "1", "food_name": "arroz"}))
+        repository.add(create_food({"id": "2", "food_name": "arroz"}))
+        self.assertEqual(len(repository.get_foods_by_name("arroz")), 2)
+
+        repository.remove("1")
+        foods = repository.get_foods_by_name("arroz")
+        self.assertEqual([f.id for f in foods], ["2"])
+
+        repository.remove("2")
+        self.assertEqual(repository.get_foods_by_name("arroz"), [])
+        self.assertEqual(repository.data, [])
+
+        with self.assertRaises(KeyError):
+            repository.remove("2")
+
+    def test_add_replaces_food_with_same_id(self):
+        repository = MockNutritionRepository(
+            create_foods([{"id": "1", "food_name": "arroz"}])
+        )
+
+        repository.add(create_food({"id": "1", "food_name": "pollo"}))
+        self.assertEqual(repository.get_foods_by_name("arroz"), [])
+        self.assertEqual(len(repository.get_foods_by_name("pollo")), 1)
+        self.assertEqual(len(repository.data), 1)
@@ -0,0 +1,90 @@
+import logging
+import unittest
+
+from core.components.food_mapping.infrastructure.repositories.mongo_repository import (
+    SYSTEM_DB_FOOD_FIELDS,
+    SystemNutritionRepository,
+    system_db_data_to_food,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def create_repository(max_results: int | None) -> SystemNutritionRepository:
+    # MongoClient does not connect to the server until the first operation
+    return SystemNutritionRepository(
+        mongo_uri="mongodb://localhost:27017",
+        db_name="test",
+        collection_name="foods",
+        index_name="food_names_index",
+        max_results=max_results,
+    )
+
+
+class SystemNutritionRepositoryTests(unittest.TestCase):
+    def test_search_pipeline_limit_and_projection(self):
+        repository = create_repository(max_results=20)
+        pipeline = repository.build_search_pipeline("arroz")
+        repository.close()
+
+        self.assertEqual(len(pipeline), 3)
+        self.assertEqual(pipeline[0]["$search"]["text"]["query"], "arroz")
+        self.assertEqual(pipeline[1], {"$limit": 20})
+
+        projection = pipeline[2]["$project"]
+        self.assertEqual(projection["_id"], 0)
+        self.assertEqual(projection["search_score"], {"$meta": "searchScore"})
+        for field in SYSTEM_DB_FOOD_FIELDS:
+            self.assertEqual(projection[field], 1)
+
+    def test_search_pipeline_without_limit(self):
+        repository = create_repository(max_results=None)
+        pipeline = repository.build_search_pipeline("arroz")
+        repository.close()
+
+        self.assertEqual(len(pipeline), 2)
+        self.assertNotIn("$limit", pipeline[1])
+
+    def test_multi_search_pipeline(self):
+        repository = create_repository(max_results=20)
+        pipeline = repository.build_multi_search_pipeline(["arroz", "carne", "pollo"])
+        repository.close()
+
+        self.assertEqual(pipeline[0]["$search"]["text"]["query"], "arroz")
+        self.assertEqual(pipeline[2]["$project"]["query_index"], {"$literal": 0})
+
+        union_stages = [stage["$unionWith"] for stage in pipeline[3:]]
+        self.assertEqual(len(union_stages), 2)
+        for query_index, (name, stage) in enumerate(
+            zip(["carne", "pollo"], union_stages, strict=True), start=1
+        ):
+            self.assertEqual(stage["coll"], "foods")
+            sub_pipeline = stage["pipeline"]
+            self.assertEqual(sub_pipeline[0]["$search"]["text"]["query"], name)
+            self.assertEqual(sub_pipeline[1], {"$limit": 20})
+            self.assertEqual(
+                sub_pipeline[2]["$project"]["query_index"], {"$literal": query_index}
+            )
+
+    def test_projected_document_to_food(self):
+        document = {
+            "id": "1",
+            "food_name": "arroz",
+            "other_names": [],
+            "description": ["blanco"],
+            "search_keywords": ["arroz", "blanco"],
+            "portion_size": 100,
+            "portion_size_unit": "g",
+            "serving_size": 100,
+            "serving_size_unit": "g",
+            "calories": 1,
+            "protein": 1,
+            "fat": 1,
+            "carbohydrates": 1,
+            "search_score": 2.5,
+        }
+        self.assertEqual(set(document) - {"search_score"}, set(SYSTEM_DB_FOOD_FIELDS))
+
+        food = system_db_data_to_food(document)
+        self.assertEqual(food.full_description, ["arroz", "blanco"])
+        self.assertEqual(food.search_score, 2.5)
@@ -8,8 +8,10 @@ from spacy.language import Language
 from core.components.food_mapping.definitions.food_map_v2 import FoodScoreQuery
 from core.components.food_mapping.infrastructure.nlp.score_function import (
     score_food_by_exact_fuzzy_matches,
+    score_foods_by_exact_fuzzy_matches,
 )
-from tests.food_mapping.utils import create_food
+from core.domain.entities.food_nutrition_request import FoodNutritionRequest
+from tests.food_mapping.utils import create_food, create_foods
 
 logger = logging.getLogger(__name__)
 
@@ -148,3 +150,50 @@ def test_score_food_by_exact_fuzzy_matches_plurals(nlp: Language):
     score = score_food_by_exact_fuzzy_matches(query, nlp)
     expected_score = 1
     assertions.assertEqual(score, expected_score)
+
+
+def test_score_foods_by_exact_fuzzy_matches_same_as_single_scores(nlp: Language):
+    """Should compute the same scores as scoring the foods one by one"""
+
+    foods = create_foods([
+        {"full_description": ["carne", "res", "ternera", "grasas"]},
+        {"full_description": ["carne res", "grasa"]},
+        {"full_description": ["carnes", "grasa"]},
+        {"full_description": ["arroz", "blanco", "cocido", "sin", "sal"]},
+        {"full_description": ["judias", "cocidas", "frijoles"]},
+        {"full_description": []},
+    ])
+    requests = [
+        FoodNutritionRequest(
+            food_name="carne de ternera", description=["sin grasa"], amount=0, unit=""
+        ),
+        FoodNutritionRequest(
+            food_name="carnes", description=["res", ""], amount=0, unit=""
+        ),
+        FoodNutritionRequest(
+            food_name="frijol", description=["cocido"], amount=0, unit=""
+        ),
+    ]
+
+    for request in requests:
+        scores = score_foods_by_exact_fuzzy_matches(request, foods, nlp)
+        expected_scores = [
+            score_food_by_exact_fuzzy_matches(
+                FoodScoreQuery(
+                    food=food,
+                    food_description=request.description,
+                    food_name=request.food_name,
+                ),
+                nlp,
+            )
+            for food in foods
+        ]
+        assertions.assertEqual(scores.tolist(), expected_scores)
+
+
+def test_score_foods_by_exact_fuzzy_matches_no_foods(nlp: Language):
+    """Should return an empty array if there are no foods"""
+
+    request = FoodNutritionRequest(food_name="arroz", description=[], amount=0, unit="")
+    scores = score_foods_by_exact_fuzzy_matches(request, [], nlp)
+    assertions.assertEqual(len(scores), 0)
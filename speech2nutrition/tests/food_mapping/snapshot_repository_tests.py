@@ -0,0 +1,98 @@
+import logging
+import unittest
+from typing import Any, Dict, List
+
+from core.components.food_mapping.infrastructure.repositories.snapshot_repository import (
+    SnapshotNutritionRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def create_document(
+    _id: str, food_name: str, other_names: List[str], search_keywords: List[str]
+) -> Dict[str, Any]:
+    return {
+        "id": _id,
+        "food_name": food_name,
+        "other_names": other_names,
+        "description": [],
+        "search_keywords": search_keywords,
+        "portion_size": 100,
+        "portion_size_unit": "g",
+        "serving_size": 100,
+        "serving_size_unit": "g",
+        "calories": 1,
+        "protein": 1,
+        "fat": 1,
+        "carbohydrates": 1,
+    }
+
+
+DOCUMENTS = [
+    create_document("1", "arroz", [], ["arroz", "blanco", "cocido"]),
+    create_document("2", "carne de vacuno", ["carne de res"], ["carne vacuno"]),
+    create_document("3", "pollo", [], ["pollo", "asado"]),
+    create_document("4", "arroz con pollo", [], ["arroz", "pollo"]),
+    create_document("5", "café", [], ["cafe", "negro"]),
+]
+
+
+class SnapshotNutritionRepositoryTests(unittest.TestCase):
+    def test_search_by_name_and_other_names(self):
+        repository = SnapshotNutritionRepository(lambda: DOCUMENTS)
+
+        foods = repository.get_foods_by_name("res")
+        self.assertEqual([f.id for f in foods], ["2"])
+
+        foods = repository.get_foods_by_name("Café")
+        self.assertEqual([f.id for f in foods], ["5"])
+
+        foods = repository.get_foods_by_name("lentejas")
+        self.assertEqual(foods, [])
+
+    def test_best_matches_first(self):
+        repository = SnapshotNutritionRepository(lambda: DOCUMENTS)
+
+        foods = repository.get_foods_by_name("arroz con pollo")
+        self.assertEqual([f.id for f in foods], ["4", "1", "3"])
+        self.assertEqual([f.search_score for f in foods], [3, 1, 1])
+        # the foods of the snapshot are not modified
+        self.assertEqual(repository.get_foods_by_name("pollo")[0].search_score, 1)
+
+    def test_max_results(self):
+        repository = SnapshotNutritionRepository(lambda: DOCUMENTS, max_results=2)
+
+        foods = repository.get_foods_by_name("arroz pollo")
+        self.assertEqual([f.id for f in foods], ["4", "1"])
+
+    def test_get_foods_by_names(self):
+        repository = SnapshotNutritionRepository(lambda: DOCUMENTS)
+
+        results = repository.get_foods_by_names(["pollo", "lentejas", "carne"])
+        self.assertEqual(
+            [[f.id for f in foods] for foods in results], [["3", "4"], [], ["2"]]
+        )
+
+    def test_refresh_keeps_previous_snapshot_on_failure(self):
+        documents = [DOCUMENTS[:1]]
+
+        def load_documents():
+            if len(documents) == 0:
+                raise ConnectionError("mongo is down")
+            return documents.pop()
+
+        repository = SnapshotNutritionRepository(load_documents)
+        repository.refresh()
+
+        foods = repository.get_foods_by_name("arroz")
+        self.assertEqual([f.id for f in foods], ["1"])
+
+    def test_refresh_replaces_snapshot(self):
+        documents = [DOCUMENTS, DOCUMENTS[:1]]
+        repository = SnapshotNutritionRepository(documents.pop)
+        self.assertEqual(repository.get_foods_by_name("pollo"), [])
+
+        repository.refresh()
+        foods = repository.get_foods_by_name("pollo")
+        self.assertEqual([f.id for f in foods], ["3", "4"])
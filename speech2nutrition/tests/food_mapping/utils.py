@@ -1,8 +1,12 @@
 import uuid
 from typing import Any, Dict, List
 
+import numpy as np
+import numpy.typing as npt
+
 from core.components.food_mapping.definitions.food_map_v2 import FoodScoreQuery
 from core.domain.entities.food import Food
+from core.domain.entities.food_nutrition_request import FoodNutritionRequest
 
 
 def score_food_by_exact_match(query: FoodScoreQuery) -> float:
@@ -23,6 +27,27 @@ def score_food_by_exact_match(query: FoodScoreQuery) -> float:
     return number_of_matches
 
 
+def score_foods_by_exact_match(
+    request: FoodNutritionRequest, foods: List[Food]
+) -> npt.NDArray[np.float64]:
+    """
+    Batch version of `score_food_by_exact_match`
+    """
+    return np.array(
+        [
+            score_food_by_exact_match(
+                FoodScoreQuery(
+                    food=food,
+                    food_description=request.description,
+                    food_name=request.food_name,
+                )
+            )
+            for food in foods
+        ],
+        dtype=np.float64,
+    )
+
+
 def generate_random_uuid():
     return str(uuid.uuid4())
 
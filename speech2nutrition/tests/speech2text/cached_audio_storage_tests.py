@@ -0,0 +1,73 @@
+import logging
+import os
+import tempfile
+import unittest
+from typing import Any, Dict, List, Tuple
+
+from core.components.speech2text.infrastructure.cached_audio_storage import (
+    DiskCachedAudioStorage,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FakeAudioStorage:
+    def __init__(self, audios: Dict[str, bytes]):
+        self.audios = audios
+        self.reads: List[str] = []
+
+    def read_file(self, audio_id: str) -> Tuple[bytes, Dict[str, Any]]:
+        self.reads.append(audio_id)
+        return self.audios[audio_id], {"mime_type": "audio/mpeg", "etag": '"1"'}
+
+
+class DiskCachedAudioStorageTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.folder = os.path.join(self.directory.name, "audios")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_audio_is_downloaded_once(self):
+        audio_storage = FakeAudioStorage({"a": b"audio a"})
+        storage = DiskCachedAudioStorage(audio_storage, self.folder, max_bytes=100)
+
+        expected = (b"audio a", {"mime_type": "audio/mpeg", "etag": '"1"'})
+        self.assertEqual(storage.read_file("a"), expected)
+        self.assertEqual(storage.read_file("a"), expected)
+        self.assertEqual(audio_storage.reads, ["a"])
+
+        # the cache is kept after a restart
+        storage = DiskCachedAudioStorage(audio_storage, self.folder, max_bytes=100)
+        self.assertEqual(storage.read_file("a"), expected)
+        self.assertEqual(audio_storage.reads, ["a"])
+
+    def test_least_recently_used_audios_are_removed(self):
+        audio_storage = FakeAudioStorage({
+            "a": b"a" * 40,
+            "b": b"b" * 40,
+            "c": b"c" * 40,
+        })
+        storage = DiskCachedAudioStorage(audio_storage, self.folder, max_bytes=100)
+
+        storage.read_file("a")
+        storage.read_file("b")
+        storage.read_file("a")
+        storage.read_file("c")
+        self.assertEqual(len(os.listdir(self.folder)), 4)
+
+        storage.read_file("a")
+        storage.read_file("c")
+        self.assertEqual(audio_storage.reads, ["a", "b", "c"])
+        storage.read_file("b")
+        self.assertEqual(audio_storage.reads, ["a", "b", "c", "b"])
+
+    def test_audios_larger_than_the_cache_are_not_saved(self):
+        audio_storage = FakeAudioStorage({"a": b"a" * 200})
+        storage = DiskCachedAudioStorage(audio_storage, self.folder, max_bytes=100)
+
+        storage.read_file("a")
+        storage.read_file("a")
+        self.assertEqual(audio_storage.reads, ["a", "a"])
+        self.assertEqual(os.listdir(self.folder), [])
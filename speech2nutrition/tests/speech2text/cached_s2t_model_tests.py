@@ -0,0 +1,62 @@
+import asyncio
+import logging
+import unittest
+from typing import Any, Dict, List
+
+from core.cache import MemoryCache
+from core.components.speech2text.infrastructure.cached_s2t_model import (
+    AsyncCachedSpeech2TextModel,
+    CachedSpeech2TextModel,
+    build_transcription_cache_key,
+)
+
+logger = logging.getLogger(__name__)
+
+OPTIONS = {"provider": "deepgram", "language": "es-419", "model": "whisper-medium"}
+
+
+class FakeSpeech2TextModel:
+    def __init__(self):
+        self.audios: List[bytes] = []
+
+    def transcribe(self, audio: bytes, metadata: Dict[str, Any]) -> str:
+        self.audios.append(audio)
+        return audio.decode("utf-8")
+
+
+class AsyncFakeSpeech2TextModel(FakeSpeech2TextModel):
+    async def transcribe(self, audio: bytes, metadata: Dict[str, Any]) -> str:
+        return super().transcribe(audio, metadata)
+
+
+class CachedSpeech2TextModelTests(unittest.TestCase):
+    def test_key_depends_on_audio_and_options(self):
+        key = build_transcription_cache_key(b"arroz", OPTIONS)
+
+        self.assertEqual(key, build_transcription_cache_key(b"arroz", dict(OPTIONS)))
+        self.assertNotEqual(key, build_transcription_cache_key(b"pollo", OPTIONS))
+        self.assertNotEqual(
+            key, build_transcription_cache_key(b"arroz", {**OPTIONS, "language": "es"})
+        )
+
+    def test_same_audio_is_transcribed_once(self):
+        speech2text_model = FakeSpeech2TextModel()
+        model = CachedSpeech2TextModel(speech2text_model, MemoryCache(), OPTIONS)
+
+        self.assertEqual(model.transcribe(b"arroz", {}), "arroz")
+        self.assertEqual(model.transcribe(b"arroz", {}), "arroz")
+        self.assertEqual(model.transcribe(b"pollo", {}), "pollo")
+        self.assertEqual(speech2text_model.audios, [b"arroz", b"pollo"])
+
+    def test_async_same_audio_is_transcribed_once(self):
+        speech2text_model = AsyncFakeSpeech2TextModel()
+        model = AsyncCachedSpeech2TextModel(speech2text_model, MemoryCache(), OPTIONS)
+
+        async def transcribe_twice():
+            return [
+                await model.transcribe(b"arroz", {}),
+                await model.transcribe(b"arroz", {}),
+            ]
+
+        self.assertEqual(asyncio.run(transcribe_twice()), ["arroz", "arroz"])
+        self.assertEqual(speech2text_model.audios, [b"arroz"])
@@ -1,33 +1,174 @@
 import argparse
+import csv
 import json
 import logging
 import os
-from typing import Any, Dict, List, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Tuple
 
 from config.logging import config_logger
-from core.components.speech2text.factory import speech2text_component_factory
+from core.components.speech2text.definitions import AudioStorage, Speech2TextModel
+from core.components.speech2text.factory import (
+    SPEECH2TEXT_PROVIDERS,
+    audio_storage_factory,
+    speech2text_model_factory,
+    speech2text_model_options,
+)
+from core.components.speech2text.infrastructure.cached_s2t_model import (
+    build_transcription_cache_key,
+)
+from tests.benchmark import CaseResultCache, summarize_latencies
 from tests.speech2text.cases import TEST_SETS
 from tests.speech2text.metrics import evaluate_test_case
 from tests.speech2text.test_sets.definitions import ExpectedS2TFood
 
+RESULTS_FOLDER = os.path.join("tests/data", "s2t_results")
+METRICS = ["keyword_metric", "amount_metric", "unit_metric"]
+SUMMARY_COLUMNS = [
+    "provider",
+    "test_set_id",
+    "n_tests",
+    "errors",
+    "cached",
+    *METRICS,
+    "download_p50",
+    "download_p95",
+    "transcription_p50",
+    "transcription_p95",
+    "wall_clock_seconds",
+]
+
 
 def save_results(test_set_id: str, results: List[Dict[str, Any]]) -> None:
-    results_path = os.path.join(
-        "tests/data", "s2t_results", f"test--{test_set_id}.json"
-    )
+    results_path = os.path.join(RESULTS_FOLDER, f"test--{test_set_id}.json")
     os.makedirs(os.path.dirname(results_path), exist_ok=True)
     with open(results_path, "w", encoding="utf-8") as f:
         json.dump(results, f, indent=4, ensure_ascii=False)
 
 
-def load_results(test_set_id: str) -> List[Dict[str, Any]] | None:
-    results_path = os.path.join(
-        "tests/data", "s2t_results", f"test--{test_set_id}.json"
-    )
-    if not os.path.exists(results_path):
-        return None
-    with open(results_path, encoding="utf-8") as f:
-        return json.load(f)
+def save_summary(summaries: List[Dict[str, Any]]) -> None:
+    """
+    Save a row per provider and test set, so the providers can be compared
+    column by column
+    """
+    summary_path = os.path.join(RESULTS_FOLDER, "summary.csv")
+    os.makedirs(os.path.dirname(summary_path), exist_ok=True)
+    with open(summary_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_COLUMNS)
+        writer.writeheader()
+        writer.writerows(summaries)
+
+
+def transcribe_case(
+    audio_storage: AudioStorage,
+    speech2text_model: Speech2TextModel,
+    options: Dict[str, Any],
+    cache: CaseResultCache | None,
+    audio_path: str,
+) -> Dict[str, Any]:
+    """
+    Download and transcribe the audio of a test case, timing each step. The
+    transcription is cached by the audio content and the `options` of the model,
+    a cached case keeps the transcription time of the run that transcribed it
+    """
+    download_seconds = None
+    transcription_seconds = None
+    raw_transcription = ""
+    error = False
+    try:
+        start = time.perf_counter()
+        audio, audio_metadata = audio_storage.read_file(audio_path)
+        download_seconds = time.perf_counter() - start
+
+        key = build_transcription_cache_key(audio, options)
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            return {**cached, "download_seconds": download_seconds, "cached": True}
+
+        start = time.perf_counter()
+        raw_transcription = speech2text_model.transcribe(audio, audio_metadata)
+        transcription_seconds = time.perf_counter() - start
+        if cache is not None:
+            cache.set(
+                key,
+                {
+                    "raw_transcription": raw_transcription,
+                    "transcription_seconds": transcription_seconds,
+                    "error": False,
+                },
+            )
+    except Exception:
+        logger.warning(f"error executing test case {audio_path}", exc_info=True)
+        error = True
+
+    return {
+        "raw_transcription": raw_transcription,
+        "download_seconds": download_seconds,
+        "transcription_seconds": transcription_seconds,
+        "error": error,
+        "cached": False,
+    }
+
+
+def execute_test_set(
+    provider: str,
+    test_set_id: str,
+    test_set: List[ExpectedS2TFood],
+    transcribe: Callable[[str], Dict[str, Any]],
+    workers: int,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Transcribe the audios of the test set with `workers` threads, and evaluate
+    all of them
+
+    Returns
+    -------
+    Tuple[List[Dict[str, Any]], Dict[str, Any]]
+        The result of each case and the summary of the test set
+    """
+    start = time.perf_counter()
+    audio_paths = [
+        f"test-audios/{test_set_id}/{test_case['audio_id']}.mp3"
+        for test_case in test_set
+    ]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        transcriptions = list(executor.map(transcribe, audio_paths))
+
+    results = []
+    for test_case, transcription in zip(test_set, transcriptions, strict=True):
+        result = evaluate_test_case(
+            raw_transcription=transcription["raw_transcription"], test_case=test_case
+        )
+        results.append({
+            "test_case_id": test_case["audio_id"],
+            **transcription,
+            **result,
+        })
+
+    def get_seconds(name: str) -> List[float]:
+        return [r[name] for r in results if r[name] is not None]
+
+    download = summarize_latencies(get_seconds("download_seconds"))
+    transcription = summarize_latencies(get_seconds("transcription_seconds"))
+    summary = {
+        "provider": provider,
+        "test_set_id": test_set_id,
+        "n_tests": len(test_set),
+        "errors": sum(1 for r in results if r["error"]),
+        "cached": sum(1 for r in results if r["cached"]),
+        **{
+            metric: round(sum(r[metric] for r in results) / len(results), 3)
+            for metric in METRICS
+        },
+        "download_p50": download["p50"],
+        "download_p95": download["p95"],
+        "transcription_p50": transcription["p50"],
+        "transcription_p95": transcription["p95"],
+        "wall_clock_seconds": round(time.perf_counter() - start, 3),
+    }
+    return results, summary
 
 
 def main() -> None:
@@ -41,6 +182,23 @@ def main() -> None:
         help="The id of the test set to execute. use all to get all test sets",
         default="check",
     )
+    parser.add_argument(
+        "--providers",
+        type=str,
+        default="deepgram",
+        help=f"Comma separated speech2text providers: {', '.join(SPEECH2TEXT_PROVIDERS)}",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Max number of audios transcribed at the same time",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Transcribe all the audios, even if their results are cached",
+    )
     args = parser.parse_args()
 
     id_test_set_list: List[Tuple[str, List[ExpectedS2TFood]]] = []
@@ -52,59 +210,50 @@ def main() -> None:
     else:
         id_test_set_list = list(TEST_SETS.items())
 
-    logger.info("creating speech2text component")
-    speech2text_component = speech2text_component_factory()
+    audio_storage = audio_storage_factory()
+    cache = None
+    if not args.no_cache:
+        cache = CaseResultCache(os.path.join(RESULTS_FOLDER, "cases"))
 
-    all_results: List[Tuple[str, List[Dict[str, Any]]]] = []
+    all_individual_metrics = []
+    summaries = []
     n_tests = 0
+    for provider in args.providers.split(","):
+        logger.info(f"creating {provider} speech2text model")
+        speech2text_model = speech2text_model_factory(provider)
 
-    for test_set_id, test_set in id_test_set_list:
-        logger.info(f"executing test set with id: {test_set_id}")
-        n_tests += len(test_set)
-        loaded_results = load_results(test_set_id)
-
-        if loaded_results is None:
-            logger.info(f"test set with id: '{test_set_id}' not found, executing")
-            results = []
-            for test_case in test_set:
-                try:
-                    final_id = f"test-audios/{test_set_id}/{test_case['audio_id']}.mp3"
-                    raw_transcription = speech2text_component(final_id)
-                except Exception:
-                    logger.warning(
-                        f"error executing test case {test_case['audio_id']}",
-                        exc_info=True,
-                    )
-                    raw_transcription = ""
-
-                result = evaluate_test_case(
-                    raw_transcription=raw_transcription, test_case=test_case
-                )
-
-                results.append({
-                    "test_case_id": test_case["audio_id"],
-                    "raw_transcription": raw_transcription,
-                    **result,
-                })
+        transcribe = partial(
+            transcribe_case,
+            audio_storage,
+            speech2text_model,
+            speech2text_model_options(provider),
+            cache,
+        )
 
-            save_results(test_set_id, results)
-            all_results.append((test_set_id, results))
-        else:
-            logger.info(f"test set '{test_set_id}' found, skipping")
-            all_results.append((test_set_id, loaded_results))
+        for test_set_id, test_set in id_test_set_list:
+            logger.info(f"executing test set with id: {test_set_id} with {provider}")
+            n_tests += len(test_set)
+            results, summary = execute_test_set(
+                provider, test_set_id, test_set, transcribe, args.workers
+            )
+            save_results(f"{provider}--{test_set_id}", results)
+            summaries.append(summary)
+            logger.info(
+                " - ".join(f"{column}: {summary[column]}" for column in SUMMARY_COLUMNS)
+            )
 
-    all_individual_metrics = []
-    for test_set_id, results in all_results:
-        for result in results:
-            all_individual_metrics.append({
-                "test_set_id": test_set_id,
-                "description_score": result.get("keyword_metric", 0),
-                "amount_score": result.get("amount_metric", 0),
-                "unit_score": result.get("unit_metric", 0),
-            })
+            for result in results:
+                all_individual_metrics.append({
+                    "provider": provider,
+                    "test_set_id": test_set_id,
+                    "description_score": result.get("keyword_metric", 0),
+                    "amount_score": result.get("amount_metric", 0),
+                    "unit_score": result.get("unit_metric", 0),
+                })
 
     logger.info(f"number of tests: {n_tests}")
     save_results("individual_metrics", all_individual_metrics)
+    save_summary(summaries)
 
 
 if __name__ == "__main__":